@@ -1,6 +1,23 @@
 """Алгоритм А* поиска пути в лабиринте."""
 
-from .graphics import AStarGraphic
+from typing import Any
+
 from .map import AStarMap
 
 __all__ = ('AStarMap', 'AStarGraphic')
+
+
+def __getattr__(name: str) -> Any:
+    """Загрузить класс визуализации при первом обращении к нему.
+
+    Args:
+        name: имя атрибута пакета.
+
+    Returns:
+        Класс визуализации.
+    """
+    if name == 'AStarGraphic':
+        from .graphics import AStarGraphic
+
+        return AStarGraphic
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
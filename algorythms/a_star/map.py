@@ -1,54 +1,217 @@
 """Обработка карты c алгоритмом А*."""
 
-from typing import List
+from heapq import heappop, heappush
+from typing import Iterator, List, Tuple
 
-from ..base import DIRECTIONS, Map
+from ..base import Map
 from ..base.exceptions import CalculationFailedError, DataNotProvidedError
+from ..base.grid import UNREACHED
 from ..base.math_handlers import Point
+from ..base.moves import Neighbourhood
+from ..base.stats import SearchStep
 
 
 class AStarMap(Map):
-    """Карта волнового метода, содержащая проходимые и непроходимые точки."""
+    """Карта алгоритма А*, содержащая проходимые и непроходимые точки.
 
-    def find_path(self) -> List[Point]:
-        """Найти путь в лабиринте.
+    Эвристика выбирается атрибутом heuristic из HEURISTICS, правило диагональных ходов -
+    атрибутом diagonal (см. Neighbourhood). Эвристика проверяется на допустимость для выбранных
+    ходов, поэтому найденный путь всегда кратчайший.
+    """
+
+    JUNCTION_HEURISTIC = True
+
+    def search(self, start: int, end: int) -> List[Point]:
+        """Найти путь между ячейками.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
 
         Returns:
-            Список точек.
+            Список точек от конечной точки до начальной.
         """
-        self.clear()
-        if not hasattr(self, 'data'):
-            raise DataNotProvidedError('Не задано поле')
-        if not self.start_point:
-            raise DataNotProvidedError('Не задана начальная точка')
-        if not self.end_point:
-            raise DataNotProvidedError('Не задана конечная точка')
-        points = [self.start_point]
-        self.data[self.start_point].distance = 0
+        if self.two_sided():
+            return self.search_bidirectional(start, end)
+        path: List[Point] = []
+        for step in self.steps(start, end, 0):
+            path = step.path or path
+        return path
+
+    def steps(self, start: int, end: int, batch: int) -> Iterator[SearchStep]:
+        """Найти путь между ячейками пошагово.
+
+        Открытое множество хранится в двоичной куче, закрытое - в массиве по номерам ячеек,
+        поэтому каждое раскрытие вершины стоит O(log n). Лучшая ячейка порции - последняя
+        раскрытая, то есть ячейка с наименьшей оценкой.
+
+        На сетке со стоимостями эвристика умножается на наименьшую стоимость ячейки, поэтому
+        она остаётся допустимой. Из вершин с равной оценкой первой раскрывается вершина с большим
+        пройденным расстоянием, то есть ближайшая к цели: это сокращает число раскрытий на открытых
+        участках, а при полном равенстве порядок задаёт номер ячейки.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+            batch: количество раскрытых ячеек в порции, 0 - только последняя порция.
+
+        Returns:
+            Порции хода поиска, последняя содержит путь.
+        """
+        if self.two_sided():
+            yield from super().steps(start, end, batch)
+            return
+        grid = self.data
+        passable = grid.passable
+        distance = grid.distance
+        width = grid.width
+        end_y, end_x = divmod(end, width)
+        neighbourhood = Neighbourhood(width, self.diagonal)
+        heuristic = neighbourhood.heuristic(self.heuristic)
+        moves = neighbourhood.moves
+        corners = neighbourhood.corners
+        straight_cost = neighbourhood.straight_cost
+        diagonal_cost = neighbourhood.diagonal_cost
+        costs = grid.costs
+        scale = grid.min_cost
+        parents = grid.allocate()
+        closed = grid.flags()
+        stats = self.stats
+        on_expand = stats.on_expand
+        on_push = stats.on_push
+        distance[start] = 0
+        points: List[Tuple[int, int, int]] = [(0, 0, start)]
         path_found = False
-        while points and not path_found:
-            point = points[0]
-            if point == self.end_point:
+        visited: List[int] = []
+        added: List[int] = []
+        self.expanded = 0
+        pushed = frontier = 0
+        while points:
+            if len(points) > frontier:
+                frontier = len(points)
+            _, _, index = heappop(points)
+            if closed[index]:
+                continue
+            if index == end:
                 path_found = True
-            for direction in DIRECTIONS:
-                new_point = point + direction
-                if self.data[new_point].passable and self.data[new_point].distance is None and new_point not in points:
-                    points.append(new_point)
-                    self.data[new_point].distance = self.data[point].distance + 1  # type: ignore[operator]
-            points.remove(point)
-            points = sorted(points, key=self.evtistic_function)
+                break
+            closed[index] = 1
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(index)
+            if batch:
+                visited.append(index)
+                if len(visited) >= batch:
+                    yield SearchStep(visited, added, index)
+                    visited = []
+                    added = []
+            current = distance[index]
+            for offset, cost, first, second in moves:
+                new_index = index + offset
+                if not passable[new_index] or closed[new_index]:
+                    continue
+                if first and passable[index + first] + passable[index + second] < corners:
+                    continue
+                new_distance = current + (cost if costs is None else cost * costs[new_index])
+                if distance[new_index] == UNREACHED or new_distance < distance[new_index]:
+                    distance[new_index] = new_distance
+                    parents[new_index] = index
+                    y, x = divmod(new_index, width)
+                    estimate = heuristic(abs(end_x - x), abs(end_y - y), straight_cost, diagonal_cost)
+                    heappush(points, (new_distance + scale * estimate, -new_distance, new_index))
+                    pushed += 1
+                    if batch:
+                        added.append(new_index)
+                    if on_push is not None:
+                        on_push(new_index)
+        stats.pushed = stats.heuristic = pushed
+        stats.frontier = frontier
         if not path_found:
             raise CalculationFailedError('Не удалось найти путь')
-        path = [self.end_point]
-        point = self.end_point
-        while not point == self.start_point:
-            for direction in DIRECTIONS:
-                new_point = point + direction
-                if self.data[new_point].distance == self.data[point].distance - 1:  # type: ignore[operator]
-                    path.append(new_point)
-                    point = new_point
-                    break
-        return path
+        stats.backtrack()
+        yield SearchStep(visited, added, end, grid.trace(parents, end))
+
+    def two_sided(self) -> bool:
+        """Проверить, можно ли искать путь двунаправленным поиском.
+
+        Двунаправленный поиск ходит только прямо и не учитывает стоимости ячеек.
+
+        Returns:
+            Логическое значение, включён ли и применим ли двунаправленный поиск.
+        """
+        return self.bidirectional and not self.diagonal and self.data.costs is None
+
+    def search_bidirectional(self, start: int, end: int) -> List[Point]:
+        """Найти путь двунаправленным поиском А*.
+
+        Поиски ведутся одновременно от начальной и конечной ячеек, каждый шаг раскрывается
+        сторона с меньшей кучей. Поиск останавливается, когда наименьшая оценка одной из сторон
+        не меньше длины лучшего найденного пути через ячейку встречи.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
+        grid = self.data
+        passable = grid.passable
+        width = grid.width
+        offsets = grid.offsets
+        distances = (grid.distance, grid.allocate())
+        parents = (grid.allocate(), grid.allocate())
+        closed = (grid.flags(), grid.flags())
+        targets = (divmod(end, width), divmod(start, width))
+        points: Tuple[List[Tuple[int, int]], List[Tuple[int, int]]] = ([(0, start)], [(0, end)])
+        distances[0][start] = 0
+        distances[1][end] = 0
+        best = 0 if start == end else UNREACHED
+        meet = start
+        stats = self.stats
+        on_expand = stats.on_expand
+        on_push = stats.on_push
+        self.expanded = 0
+        pushed = frontier = 0
+        while points[0] and points[1]:
+            if len(points[0]) + len(points[1]) > frontier:
+                frontier = len(points[0]) + len(points[1])
+            if best != UNREACHED and (points[0][0][0] >= best or points[1][0][0] >= best):
+                break
+            side = 0 if len(points[0]) <= len(points[1]) else 1
+            distance, other_distance = distances[side], distances[1 - side]
+            target_y, target_x = targets[side]
+            _, index = heappop(points[side])
+            if closed[side][index]:
+                continue
+            closed[side][index] = 1
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(index)
+            new_distance = distance[index] + 1
+            for offset in offsets:
+                new_index = index + offset
+                if not passable[new_index] or closed[side][new_index]:
+                    continue
+                if distance[new_index] == UNREACHED or new_distance < distance[new_index]:
+                    distance[new_index] = new_distance
+                    parents[side][new_index] = index
+                    y, x = divmod(new_index, width)
+                    heappush(points[side], (new_distance + abs(target_x - x) + abs(target_y - y), new_index))
+                    pushed += 1
+                    if on_push is not None:
+                        on_push(new_index)
+                if other_distance[new_index] != UNREACHED:
+                    length = distance[new_index] + other_distance[new_index]
+                    if best == UNREACHED or length < best:
+                        best = length
+                        meet = new_index
+        stats.pushed = stats.heuristic = pushed
+        stats.frontier = frontier
+        if best == UNREACHED:
+            raise CalculationFailedError('Не удалось найти путь')
+        stats.backtrack()
+        return grid.splice(parents[0], parents[1], meet)
 
     def evtistic_function(self, point: Point) -> int:
         """Рассчитать эвристичечкую функцию для заданной точки.
@@ -57,8 +220,12 @@ class AStarMap(Map):
             point: точка, для которой необходимо рассчитать функцию.
 
         Returns:
-            Значение эвристической функции (квадрат расстояния до точки).
+            Значение выбранной эвристики от точки до конечной точки в единицах стоимости хода.
         """
         if not self.end_point:
             raise DataNotProvidedError('Не задана конечная точка')
-        return (self.end_point.x - point.x) ** 2 + (self.end_point.y - point.y) ** 2
+        neighbourhood = Neighbourhood(self.data.width if hasattr(self, 'data') else 0, self.diagonal)
+        heuristic = neighbourhood.heuristic(self.heuristic)
+        dx = abs(self.end_point.x - point.x)
+        dy = abs(self.end_point.y - point.y)
+        return heuristic(dx, dy, neighbourhood.straight_cost, neighbourhood.diagonal_cost)
@@ -1,6 +1,26 @@
 """Базовые обработчики для разных алгоритмов."""
 
-from .graphics import Graphic
+from typing import Any
+
 from .map import DIRECTIONS, Map
 
 __all__ = ('Map', 'DIRECTIONS', 'Graphic')
+
+
+def __getattr__(name: str) -> Any:
+    """Загрузить базовую визуализацию при первом обращении.
+
+    Визуализация импортирует matplotlib, поэтому пакеты алгоритмов загружают свои классы
+    визуализации так же лениво: карты и алгоритмы доступны без графических библиотек.
+
+    Args:
+        name: имя атрибута пакета.
+
+    Returns:
+        Класс визуализации.
+    """
+    if name == 'Graphic':
+        from .graphics import Graphic
+
+        return Graphic
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,184 @@
+"""Параллельная генерация наборов лабиринтов в общей памяти."""
+
+from multiprocessing import Pool, cpu_count
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Optional, Sequence, Tuple, cast
+
+from .exceptions import WrongArgumentValuesError
+from .generators import GENERATORS
+from .grid import Cells, Grid
+from .storage import dump_batch
+
+Task = Tuple[str, str, int, int, int, List[int]]
+
+
+class MazeBatch:
+    """Набор лабиринтов одного размера в блоке общей памяти.
+
+    Лабиринты лежат подряд по байту на ячейку: лабиринт с номером i занимает cells байт,
+    начиная с i * cells. Набор владеет блоком и освобождает его в close; выданные набором
+    представления и сетки ссылаются на блок и после close становятся недоступны.
+    """
+
+    def __init__(self, width: int, height: int, seeds: Sequence[int]) -> None:
+        """Выделить общую память под набор.
+
+        Args:
+            width: количество столбцов клеток лабиринтов.
+            height: количество строк клеток лабиринтов.
+            seeds: зёрна лабиринтов.
+        """
+        if width < 1 or height < 1:
+            raise WrongArgumentValuesError('Значение должно быть больше 0')
+        self.width = width
+        self.height = height
+        self.columns = 2 * width + 1
+        self.rows = 2 * height + 1
+        self.cells = self.columns * self.rows
+        self.seeds = list(seeds)
+        self.memory = SharedMemory(create=True, size=max(1, self.cells * len(self.seeds)))
+        self.views: List[memoryview] = []
+
+    def __len__(self) -> int:
+        """Получить количество лабиринтов.
+
+        Returns:
+            Количество лабиринтов.
+        """
+        return len(self.seeds)
+
+    def __enter__(self) -> 'MazeBatch':
+        """Использовать набор в блоке with.
+
+        Returns:
+            Этот набор.
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Освободить общую память при выходе из блока with.
+
+        Args:
+            args: сведения об исключении.
+        """
+        self.close()
+
+    def maze(self, index: int) -> memoryview:
+        """Получить проходимость лабиринта без копирования.
+
+        Args:
+            index: номер лабиринта.
+
+        Returns:
+            Представление участка общей памяти по байту на ячейку.
+        """
+        if not 0 <= index < len(self.seeds):
+            raise WrongArgumentValuesError(f'В наборе нет карты с номером {index}')
+        first = index * self.cells
+        last = first + self.cells
+        view = self.memory.buf[first:last]
+        self.views.append(view)
+        return view
+
+    def grid(self, index: int) -> Grid:
+        """Получить сетку лабиринта.
+
+        Args:
+            index: номер лабиринта.
+
+        Returns:
+            Сетку, проходимость которой хранится в общей памяти набора.
+        """
+        return Grid(self.columns, self.rows, cast(Cells, self.maze(index)))
+
+    def save(self, path: str) -> None:
+        """Сохранить весь набор в один файл.
+
+        Args:
+            path: путь к файлу.
+        """
+        dump_batch(path, self.columns, self.rows, self.seeds, (self.maze(index) for index in range(len(self))))
+
+    def close(self) -> None:
+        """Освободить общую память."""
+        for view in self.views:
+            view.release()
+        self.views = []
+        self.memory.close()
+        self.memory.unlink()
+
+
+def fill_chunk(task: Task) -> int:
+    """Сгенерировать часть набора в процессе-обработчике.
+
+    Обработчик подключается к общей памяти по имени, и генераторы прорезают лабиринты прямо
+    в своих участках блока, поэтому в основной процесс возвращается только их количество.
+
+    Args:
+        task: имя блока общей памяти, название генератора, размеры лабиринтов в клетках,
+            номер первого лабиринта части и зёрна лабиринтов части.
+
+    Returns:
+        Количество сгенерированных лабиринтов.
+    """
+    name, generator, width, height, first, seeds = task
+    memory = SharedMemory(name=name)
+    try:
+        cells = (2 * width + 1) * (2 * height + 1)
+        for number, seed in enumerate(seeds, first):
+            offset = number * cells
+            end = offset + cells
+            passable = memory.buf[offset:end]
+            try:
+                GENERATORS[generator](seed).fill(cast(Cells, passable), width, height)
+            finally:
+                passable.release()
+    finally:
+        memory.close()
+    return len(seeds)
+
+
+def generate_batch(
+    width: int,
+    height: int,
+    seeds: Sequence[int],
+    generator: str = 'backtracker',
+    processes: Optional[int] = None,
+) -> MazeBatch:
+    """Сгенерировать набор лабиринтов параллельно.
+
+    Зёрна делятся на части, по несколько частей на процесс, чтобы процессы не простаивали
+    из-за лабиринтов разной сложности. Лабиринты не передаются между процессами, поэтому
+    скорость растёт почти линейно с количеством ядер.
+
+    Args:
+        width: количество столбцов клеток лабиринтов.
+        height: количество строк клеток лабиринтов.
+        seeds: зёрна лабиринтов.
+        generator: название генератора из GENERATORS.
+        processes: количество процессов, по умолчанию по количеству ядер, 1 - без пула процессов.
+
+    Returns:
+        Набор лабиринтов, который нужно закрыть после использования.
+    """
+    if generator not in GENERATORS:
+        raise WrongArgumentValuesError(f'Неизвестный генератор: "{generator}"')
+    batch = MazeBatch(width, height, seeds)
+    workers = processes or cpu_count()
+    chunk = max(1, -(-len(batch) // (workers * 4)))
+    tasks: List[Task] = [
+        (batch.memory.name, generator, width, height, first, batch.seeds[first:last])
+        for first, last in ((first, first + chunk) for first in range(0, len(batch), chunk))
+    ]
+    try:
+        if workers == 1:
+            for task in tasks:
+                fill_chunk(task)
+        else:
+            with Pool(workers) as pool:
+                for _ in pool.imap_unordered(fill_chunk, tasks):
+                    pass
+    except BaseException:
+        batch.close()
+        raise
+    return batch
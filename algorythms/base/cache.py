@@ -0,0 +1,117 @@
+"""Ограниченные кэши с вытеснением давно не использованных записей."""
+
+from collections import OrderedDict
+from typing import Generic, Hashable, List, Optional, TypeVar
+
+from .exceptions import WrongArgumentValuesError
+from .math_handlers import Point
+
+Value = TypeVar('Value')
+
+
+class LRUCache(Generic[Value]):
+    """Ограниченный кэш с вытеснением давно не использованных записей (LRU)."""
+
+    def __init__(self, capacity: int) -> None:
+        """Инициализировать кэш.
+
+        Args:
+            capacity: наибольшее количество хранимых записей, 0 отключает кэш.
+        """
+        self.entries: 'OrderedDict[Hashable, Value]' = OrderedDict()
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def capacity(self) -> int:
+        """Получить вместимость кэша.
+
+        Returns:
+            Наибольшее количество хранимых записей.
+        """
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int) -> None:
+        """Задать вместимость кэша, вытеснив лишние записи.
+
+        Args:
+            value: наибольшее количество хранимых записей.
+        """
+        if value < 0:
+            raise WrongArgumentValuesError('Вместимость кэша не может быть отрицательной')
+        self._capacity = value
+        self.shrink()
+
+    def get(self, key: Hashable) -> Optional[Value]:
+        """Получить запись из кэша.
+
+        Args:
+            key: ключ записи.
+
+        Returns:
+            Сохранённое значение или None, если его нет в кэше.
+        """
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Value) -> None:
+        """Сохранить запись в кэш.
+
+        Args:
+            key: ключ записи.
+            value: сохраняемое значение.
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        self.shrink()
+
+    def pop(self, key: Hashable) -> Optional[Value]:
+        """Извлечь запись из кэша без учёта в счётчиках.
+
+        Args:
+            key: ключ записи.
+
+        Returns:
+            Сохранённое значение или None, если его нет в кэше.
+        """
+        return self.entries.pop(key, None)
+
+    def shrink(self) -> None:
+        """Вытеснить давно не использованные записи сверх вместимости."""
+        while len(self.entries) > self._capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Очистить кэш."""
+        self.entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Проверить наличие записи без учёта в счётчиках.
+
+        Args:
+            key: ключ записи.
+
+        Returns:
+            Логическое значение, есть ли запись в кэше.
+        """
+        return key in self.entries
+
+    def __len__(self) -> int:
+        """Получить количество хранимых записей.
+
+        Returns:
+            Количество записей в кэше.
+        """
+        return len(self.entries)
+
+
+PathCache = LRUCache[List[Point]]
@@ -0,0 +1,289 @@
+"""Генераторы лабиринтов."""
+
+from array import array
+from random import Random
+from typing import BinaryIO, Dict, Iterator, List, Optional, Type
+
+from .grid import Cells, Grid
+
+
+class Generator:
+    """Базовый генератор лабиринта.
+
+    Лабиринт из width x height клеток записывается в сетку из (2 * height + 1) x (2 * width + 1)
+    ячеек: клетка (x, y) находится в ячейке (2 * x + 1, 2 * y + 1), а проход между соседними
+    клетками - в ячейке между ними. Генератор использует собственный генератор случайных чисел,
+    поэтому одинаковое зерно даёт одинаковый лабиринт и не влияет на общее состояние модуля random.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """Инициализировать генератор.
+
+        Args:
+            seed: зерно генератора случайных чисел, None - случайное.
+        """
+        self.random = Random(seed)
+
+    def fill(self, passable: Cells, width: int, height: int) -> None:
+        """Прорезать лабиринт в заполненном нулями буфере проходимости.
+
+        Базовый генератор ничего не прорезает, и все ячейки остаются непроходимыми.
+
+        Args:
+            passable: буфер проходимости ячеек сетки.
+            width: количество столбцов клеток лабиринта.
+            height: количество строк клеток лабиринта.
+        """
+
+    def generate(self, width: int, height: int) -> Grid:
+        """Сгенерировать лабиринт.
+
+        Args:
+            width: количество столбцов клеток лабиринта.
+            height: количество строк клеток лабиринта.
+
+        Returns:
+            Сетку с лабиринтом.
+        """
+        passable = bytearray((2 * width + 1) * (2 * height + 1))
+        self.fill(passable, width, height)
+        return Grid(2 * width + 1, 2 * height + 1, passable)
+
+    def rows(self, width: int, height: int) -> Iterator[bytes]:
+        """Сгенерировать лабиринт построчно.
+
+        Args:
+            width: количество столбцов клеток лабиринта.
+            height: количество строк клеток лабиринта.
+
+        Returns:
+            Строки сетки в виде байт, где 1 - проходимая ячейка.
+        """
+        return self.generate(width, height).rows()
+
+    def stream(self, file: BinaryIO, width: int, height: int) -> None:
+        """Записать лабиринт в файл построчно, по байту на ячейку.
+
+        Args:
+            file: файл, открытый на запись в двоичном режиме.
+            width: количество столбцов клеток лабиринта.
+            height: количество строк клеток лабиринта.
+        """
+        for row in self.rows(width, height):
+            file.write(row)
+
+    @staticmethod
+    def carve(passable: Cells, width: int, cell: int, other: int) -> None:
+        """Открыть проход между соседними клетками.
+
+        Args:
+            passable: буфер проходимости ячеек сетки.
+            width: количество столбцов клеток лабиринта.
+            cell: номер первой клетки.
+            other: номер соседней клетки.
+        """
+        raw_width = 2 * width + 1
+        y, x = divmod(cell, width)
+        other_y, other_x = divmod(other, width)
+        first = (2 * y + 1) * raw_width + 2 * x + 1
+        second = (2 * other_y + 1) * raw_width + 2 * other_x + 1
+        passable[first] = 1
+        passable[second] = 1
+        passable[(first + second) // 2] = 1
+
+
+class BacktrackerGenerator(Generator):
+    """Генератор лабиринта методом рекурсивного возврата на явном стеке номеров клеток."""
+
+    def fill(self, passable: Cells, width: int, height: int) -> None:
+        """Прорезать лабиринт в заполненном нулями буфере проходимости.
+
+        Args:
+            passable: буфер проходимости ячеек сетки.
+            width: количество столбцов клеток лабиринта.
+            height: количество строк клеток лабиринта.
+        """
+        randbelow = self.random.randrange
+        visited = bytearray(width * height)
+        stack = array('i', [0])
+        visited[0] = 1
+        self.carve(passable, width, 0, 0)
+        while stack:
+            cell = stack[-1]
+            y, x = divmod(cell, width)
+            options = []
+            if x > 0 and not visited[cell - 1]:
+                options.append(cell - 1)
+            if x < width - 1 and not visited[cell + 1]:
+                options.append(cell + 1)
+            if y > 0 and not visited[cell - width]:
+                options.append(cell - width)
+            if y < height - 1 and not visited[cell + width]:
+                options.append(cell + width)
+            if not options:
+                stack.pop()
+                continue
+            other = options[randbelow(len(options))]
+            visited[other] = 1
+            self.carve(passable, width, cell, other)
+            stack.append(other)
+
+
+class KruskalGenerator(Generator):
+    """Генератор лабиринта рандомизированным алгоритмом Краскала."""
+
+    def fill(self, passable: Cells, width: int, height: int) -> None:
+        """Прорезать лабиринт в заполненном нулями буфере проходимости.
+
+        Args:
+            passable: буфер проходимости ячеек сетки.
+            width: количество столбцов клеток лабиринта.
+            height: количество строк клеток лабиринта.
+        """
+        cells = width * height
+        parents = array('i', range(cells))
+        walls = [cell * 2 for cell in range(cells) if cell % width < width - 1]
+        walls.extend(cell * 2 + 1 for cell in range(cells - width))
+        self.random.shuffle(walls)
+        self.carve(passable, width, 0, 0)
+
+        def find(cell: int) -> int:
+            while parents[cell] != cell:
+                parents[cell] = parents[parents[cell]]
+                cell = parents[cell]
+            return cell
+
+        for wall in walls:
+            cell, vertical = divmod(wall, 2)
+            other = cell + width if vertical else cell + 1
+            root, other_root = find(cell), find(other)
+            if root != other_root:
+                parents[other_root] = root
+                self.carve(passable, width, cell, other)
+
+
+class WilsonGenerator(Generator):
+    """Генератор лабиринта алгоритмом Уилсона на случайных блужданиях со стиранием петель.
+
+    Даёт равномерно распределённое остовное дерево клеток.
+    """
+
+    def fill(self, passable: Cells, width: int, height: int) -> None:
+        """Прорезать лабиринт в заполненном нулями буфере проходимости.
+
+        Args:
+            passable: буфер проходимости ячеек сетки.
+            width: количество столбцов клеток лабиринта.
+            height: количество строк клеток лабиринта.
+        """
+        randbelow = self.random.randrange
+        cells = width * height
+        in_tree = bytearray(cells)
+        walk = array('i', [0]) * cells
+        root = randbelow(cells)
+        in_tree[root] = 1
+        self.carve(passable, width, root, root)
+        for start in range(cells):
+            cell = start
+            while not in_tree[cell]:
+                y, x = divmod(cell, width)
+                options = []
+                if x > 0:
+                    options.append(cell - 1)
+                if x < width - 1:
+                    options.append(cell + 1)
+                if y > 0:
+                    options.append(cell - width)
+                if y < height - 1:
+                    options.append(cell + width)
+                walk[cell] = options[randbelow(len(options))]
+                cell = walk[cell]
+            cell = start
+            while not in_tree[cell]:
+                in_tree[cell] = 1
+                self.carve(passable, width, cell, walk[cell])
+                cell = walk[cell]
+
+
+class EllerGenerator(Generator):
+    """Генератор лабиринта алгоритмом Эллера.
+
+    Лабиринт строится строка за строкой, в памяти хранятся только множества клеток текущей строки,
+    поэтому генерация построчно требует O(width) памяти и подходит для записи лабиринтов,
+    не помещающихся в память, прямо в файл.
+    """
+
+    def fill(self, passable: Cells, width: int, height: int) -> None:
+        """Прорезать лабиринт в заполненном нулями буфере проходимости.
+
+        Args:
+            passable: буфер проходимости ячеек сетки.
+            width: количество столбцов клеток лабиринта.
+            height: количество строк клеток лабиринта.
+        """
+        start = 0
+        for row in self.rows(width, height):
+            end = start + len(row)
+            passable[start:end] = row
+            start = end
+
+    def rows(self, width: int, height: int) -> Iterator[bytes]:
+        """Сгенерировать лабиринт построчно.
+
+        Args:
+            width: количество столбцов клеток лабиринта.
+            height: количество строк клеток лабиринта.
+
+        Returns:
+            Строки сетки в виде байт, где 1 - проходимая ячейка.
+        """
+        raw_width = 2 * width + 1
+        random = self.random.random
+        randbelow = self.random.randrange
+        sets = list(range(width))
+        parents = list(range(2 * width))
+
+        def find(label: int) -> int:
+            while parents[label] != label:
+                parents[label] = parents[parents[label]]
+                label = parents[label]
+            return label
+
+        yield bytes(raw_width)
+        for y in range(height):
+            last = y == height - 1
+            row = bytearray(b'\x00' + b'\x01' * (raw_width - 2) + b'\x00')
+            for x in range(width - 1):
+                label, other = find(sets[x]), find(sets[x + 1])
+                if label != other and (last or random() < 0.5):
+                    parents[other] = label
+                else:
+                    row[2 * x + 2] = 0
+            yield bytes(row)
+            if last:
+                break
+            sets = [find(label) for label in sets]
+            groups: Dict[int, List[int]] = {}
+            for x, label in enumerate(sets):
+                groups.setdefault(label, []).append(x)
+            below = bytearray(raw_width)
+            down = bytearray(width)
+            for members in groups.values():
+                chosen = [x for x in members if random() < 0.5]
+                for x in chosen or [members[randbelow(len(members))]]:
+                    down[x] = 1
+                    below[2 * x + 1] = 1
+            used = {sets[x] for x in range(width) if down[x]}
+            free = (label for label in range(2 * width) if label not in used)
+            sets = [sets[x] if down[x] else next(free) for x in range(width)]
+            parents = list(range(2 * width))
+            yield bytes(below)
+        yield bytes(raw_width)
+
+
+GENERATORS: Dict[str, Type[Generator]] = {
+    'backtracker': BacktrackerGenerator,
+    'kruskal': KruskalGenerator,
+    'wilson': WilsonGenerator,
+    'eller': EllerGenerator,
+}
@@ -1,14 +1,18 @@
 """Обработка визуального отображения карты."""
 
 from functools import wraps
+from time import perf_counter
 from traceback import format_exc
-from typing import Callable, Generic, Optional, Type, TypeVar
+from typing import Any, Callable, Generic, List, Optional, Tuple, Type, TypeVar
 
+import numpy as np
 from matplotlib import pyplot as plt
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
-from matplotlib.backend_bases import Event, MouseButton, MouseEvent
+from matplotlib.backend_bases import DrawEvent, Event, MouseButton, MouseEvent
 from matplotlib.figure import Figure
 from matplotlib.image import AxesImage
+from matplotlib.transforms import Bbox
 from matplotlib.widgets import Button, TextBox
 from typing_extensions import Concatenate, ParamSpec
 
@@ -16,6 +20,8 @@ from .exceptions import WrongActionError
 from .logging import logger
 from .map import Map
 from .math_handlers import Point
+from .paths import waypoints
+from .stats import SearchStep
 
 DecParams = ParamSpec('DecParams')
 RetVar = TypeVar('RetVar')
@@ -27,6 +33,9 @@ def handle_error(message: str = '') -> Callable[
 ]:
     """Обработать исключение при обработке взаимодействия с графическими элементами.
 
+    Обработчики могут вызывать друг друга, поэтому холст перерисовывается один раз,
+    после завершения внешнего обработчика.
+
     Returns:
         Декоратор функции.
     """
@@ -38,6 +47,7 @@ def handle_error(message: str = '') -> Callable[
         @wraps(function)
         def wrapper(self: 'Graphic', *args: DecParams.args, **kwargs: DecParams.kwargs) -> Optional[RetVar]:
             self.clear_exception()
+            self.handling += 1
             try:
                 return function(self, *args, **kwargs)
             except Exception as ex:
@@ -47,6 +57,10 @@ def handle_error(message: str = '') -> Callable[
                 else:
                     self.perform_exception(WrongActionError(str(ex)))
                 return None
+            finally:
+                self.handling -= 1
+                if not self.handling:
+                    self.refresh()
 
         return wrapper
 
@@ -57,13 +71,36 @@ MapType = TypeVar('MapType', bound=Map)
 
 
 class Graphic(Generic[MapType]):
-    """Обработчик визуального отображения карты."""
+    """Обработчик визуального отображения карты.
+
+    Карта выводится одним изображением, которое обновляется на месте. Стрелки, путь и текст
+    ошибки являются анимированными элементами: они не входят в сохранённый фон и перерисовываются
+    поверх него копированием областей (blitting), поэтому обработка нажатия перерисовывает
+    только их, а весь холст перерисовывается только при изменении карты. Обработчики событий
+    перерисовывают холст один раз, после завершения.
+
+    Ход поиска пути выводится анимированным полупрозрачным изображением поверх карты: порции
+    пошагового поиска закрашиваются в нём, а на экран не чаще FPS раз в секунду копируется
+    только область с изменившимися ячейками.
+    """
 
     fig: Figure
     ax: Axes
     event_id: int
     MAP_TYPE: Type[MapType] = Map  # type: ignore[assignment]
     data: AxesImage
+    background: Any = None
+    full_redraw = True
+    handling = 0
+    progress: np.ndarray
+    overlay: AxesImage
+    best: Optional[int] = None
+    dirty: Optional[Tuple[int, int, int, int]] = None
+    STEP_BATCH = 64
+    FPS = 30
+    VISITED_COLOR = (135, 206, 250, 160)
+    FRONTIER_COLOR = (255, 165, 0, 200)
+    BEST_COLOR = (220, 20, 60, 255)
 
     def __init__(self, width: int = 10, height: int = 10) -> None:
         """Инициализировать обработчик визуального отображения карты.
@@ -97,6 +134,11 @@ class Graphic(Generic[MapType]):
                 line.remove()
             del self.path
             self.map.clear()
+        if hasattr(self, 'progress'):
+            self.progress[:] = 0
+            self.overlay.set_data(self.progress)
+        self.best = None
+        self.dirty = None
 
     @handle_error('Не удалось выбрать положение начальной точки')
     def on_click_after_start(self, event: Event) -> None:
@@ -120,8 +162,8 @@ class Graphic(Generic[MapType]):
                     ec='green',
                     head_width=0.3,
                     head_length=0.3,
+                    animated=True,
                 )
-                plt.show()
                 plt.disconnect(self.event_id)
 
     @handle_error('Не удалось выбрать положение конечной точки')
@@ -146,8 +188,8 @@ class Graphic(Generic[MapType]):
                     ec='blue',
                     head_width=0.3,
                     head_length=0.3,
+                    animated=True,
                 )
-                plt.show()
                 plt.disconnect(self.event_id)
 
     @handle_error('Не удалось нажать на кнопку задания начального положения')
@@ -161,7 +203,6 @@ class Graphic(Generic[MapType]):
             plt.disconnect(self.event_id)
         self.delete_start_arrow()
         self.delete_path()
-        plt.show()
         self.event_id = plt.connect('button_press_event', self.on_click_after_start)
 
     @handle_error('Не удалось нажать на кнопку задания конечного положения')
@@ -175,7 +216,6 @@ class Graphic(Generic[MapType]):
             plt.disconnect(self.event_id)
         self.delete_end_arrow()
         self.delete_path()
-        plt.show()
         self.event_id = plt.connect('button_press_event', self.on_click_after_end)
 
     @handle_error('Не удалось нажать на кнопку очистки карты')
@@ -188,7 +228,6 @@ class Graphic(Generic[MapType]):
         self.delete_start_arrow()
         self.delete_end_arrow()
         self.delete_path()
-        plt.show()
 
     @handle_error('Не удалось задать количество строк')
     def x_change(self, event: Event) -> None:
@@ -217,27 +256,35 @@ class Graphic(Generic[MapType]):
             raise ex
 
     def plot_map(self) -> None:
-        """Вывести карту."""
+        """Вывести карту.
+
+        Изображение карты создаётся один раз, при следующих генерациях в нём заменяются данные.
+        """
         self.map.generate_map()
-        self.ax.cla()
-        self.error_text = self.ax.text(
-            0.5,
-            -0.05,
-            '',
-            transform=self.ax.transAxes,
-            style='italic',
-            horizontalalignment='center',
-            verticalalignment='top',
-            bbox={'facecolor': 'red', 'alpha': 0.5, 'pad': 10},
-        )
-        self.data = self.ax.imshow(
-            [[0 if cell.passable else 1 for cell in row] for row in self.map.data.data],
-            cmap=plt.cm.binary,  # type: ignore[attr-defined]
-            interpolation='none',
-        )
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
-        plt.show()
+        grid = self.map.data
+        image = 1 - np.frombuffer(b''.join(grid.rows()), dtype=np.uint8).reshape(grid.height, grid.width)
+        if not hasattr(self, 'data'):
+            self.data = self.ax.imshow(
+                image,
+                cmap=plt.cm.binary,  # type: ignore[attr-defined]
+                interpolation='none',
+                vmin=0,
+                vmax=1,
+            )
+            self.ax.set_xticks([])
+            self.ax.set_yticks([])
+        else:
+            self.data.set_data(image)
+            self.data.set_extent((-0.5, grid.width - 0.5, grid.height - 0.5, -0.5))
+        self.progress = np.zeros((grid.height, grid.width, 4), dtype=np.uint8)
+        if not hasattr(self, 'overlay'):
+            self.overlay = self.ax.imshow(self.progress, interpolation='none', animated=True)
+        else:
+            self.overlay.set_data(self.progress)
+            self.overlay.set_extent((-0.5, grid.width - 0.5, grid.height - 0.5, -0.5))
+        self.best = None
+        self.dirty = None
+        self.full_redraw = True
 
     @handle_error('Не удалось изменить карту')
     def map_change(self, event: Event) -> None:
@@ -257,9 +304,111 @@ class Graphic(Generic[MapType]):
             event: событие клика.
         """
         self.delete_path()
-        path = self.map.find_path()
-        self.path = self.ax.plot([point.x for point in path], [point.y for point in path])
-        plt.show()
+        path: List[Point] = []
+        shown = perf_counter()
+        for step in self.map.find_path_steps(self.STEP_BATCH):
+            self.paint(step)
+            if step.path is not None:
+                path = step.path
+                break
+            if perf_counter() - shown >= 1 / self.FPS:
+                self.show_progress()
+                shown = perf_counter()
+        self.overlay.set_data(self.progress)
+        points = waypoints(path)
+        self.path = self.ax.plot([point.x for point in points], [point.y for point in points], animated=True)
+
+    def paint(self, step: SearchStep) -> None:
+        """Закрасить ячейки порции хода поиска и расширить изменившуюся область.
+
+        Изображение хода поиска само хранит границу поиска: добавленные в неё ячейки
+        закрашиваются цветом границы, а раскрытые поверх - цветом посещённых.
+
+        Args:
+            step: порция хода поиска.
+        """
+        cells = self.progress.reshape(-1, 4)
+        cells[step.pushed] = self.FRONTIER_COLOR
+        cells[step.visited] = self.VISITED_COLOR
+        changed = step.visited + step.pushed + [step.best]
+        if self.best is not None:
+            cells[self.best] = self.VISITED_COLOR
+            changed.append(self.best)
+        cells[step.best] = self.BEST_COLOR
+        self.best = step.best
+        rows, columns = np.divmod(np.array(changed), self.progress.shape[1])
+        left, top, right, bottom = int(columns.min()), int(rows.min()), int(columns.max()), int(rows.max())
+        if self.dirty is not None:
+            left = min(left, self.dirty[0])
+            top = min(top, self.dirty[1])
+            right = max(right, self.dirty[2])
+            bottom = max(bottom, self.dirty[3])
+        self.dirty = (left, top, right, bottom)
+
+    def show_progress(self) -> None:
+        """Вывести на экран изменившуюся область хода поиска.
+
+        Пока фон не сохранён, кадр пропускается: изображение хода поиска будет нарисовано
+        при следующей полной перерисовке.
+        """
+        if self.dirty is None or self.full_redraw or self.background is None:
+            return
+        left, top, right, bottom = self.dirty
+        self.dirty = None
+        self.overlay.set_data(self.progress)
+        corners = self.ax.transData.transform([(left - 0.5, top - 0.5), (right + 0.5, bottom + 0.5)])
+        bbox = Bbox.from_extents(*(corners.min(axis=0) - 1), *(corners.max(axis=0) + 1))
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)  # type: ignore[attr-defined]
+        for artist in self.animated_artists():
+            self.fig.draw_artist(artist)
+        canvas.blit(bbox)
+        canvas.flush_events()
+
+    def animated_artists(self) -> List[Artist]:
+        """Получить анимированные элементы, рисуемые поверх фона.
+
+        Returns:
+            Список элементов.
+        """
+        artists: List[Artist] = []
+        if hasattr(self, 'overlay'):
+            artists.append(self.overlay)
+        if hasattr(self, 'path'):
+            artists.extend(self.path)
+        for name in ('start_arrow', 'end_arrow', 'error_text'):
+            if hasattr(self, name):
+                artists.append(getattr(self, name))
+        return artists
+
+    def on_draw(self, event: DrawEvent) -> None:
+        """Сохранить фон после полной перерисовки холста и нарисовать поверх него анимированные элементы.
+
+        Args:
+            event: событие перерисовки.
+        """
+        canvas = self.fig.canvas
+        if getattr(canvas, 'supports_blit', False):
+            self.background = canvas.copy_from_bbox(self.fig.bbox)  # type: ignore[attr-defined]
+        for artist in self.animated_artists():
+            self.fig.draw_artist(artist)
+
+    def refresh(self) -> None:
+        """Перерисовать изменившиеся элементы.
+
+        Если изменилась карта или фон ещё не сохранён, запрашивается отложенная полная
+        перерисовка холста, иначе поверх сохранённого фона перерисовываются только
+        анимированные элементы.
+        """
+        canvas = self.fig.canvas
+        if self.full_redraw or self.background is None:
+            self.full_redraw = False
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self.background)  # type: ignore[attr-defined]
+        for artist in self.animated_artists():
+            self.fig.draw_artist(artist)
+        canvas.blit(self.fig.bbox)
 
     def draw_maze(self):
         """Отобразить лабиринт."""
@@ -310,7 +459,21 @@ class Graphic(Generic[MapType]):
         self.find_path_button.on_clicked(self.find_path)
 
         # Текстовое поле с ошибкой
+        self.error_text = self.ax.text(
+            0.5,
+            -0.05,
+            '',
+            transform=self.ax.transAxes,
+            style='italic',
+            horizontalalignment='center',
+            verticalalignment='top',
+            bbox={'facecolor': 'red', 'alpha': 0.5, 'pad': 10},
+            animated=True,
+        )
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
         self.plot_map()
+        self.refresh()
+        plt.show()
 
     def perform_exception(self, exception: Exception) -> None:
         """Выполнить в случае вызова исключения.
@@ -319,9 +482,7 @@ class Graphic(Generic[MapType]):
             exception: выполнить в случае исключения.
         """
         self.error_text.set_text(str(exception))
-        plt.show()
 
     def clear_exception(self) -> None:
         """Очистить сообщение об исключении."""
         self.error_text.set_text('')
-        plt.show()
@@ -0,0 +1,415 @@
+"""Компактное хранение карты в плоских массивах."""
+
+from array import array
+from itertools import count
+from typing import Any, Iterator, List, MutableSequence, Optional, Sequence, cast
+from weakref import WeakKeyDictionary
+
+from .exceptions import WrongArgumentValuesError
+from .math_handlers import Point
+
+UNREACHED = -1
+
+MAX_COST = 255
+
+VERSIONS = count()
+
+Cells = MutableSequence[int]
+
+
+class MapPoint:
+    """Обработчик точки в карте.
+
+    Не хранит данных сам, а является представлением ячейки сетки Grid.
+    """
+
+    __slots__ = ('_grid', '_index')
+
+    def __init__(self, grid: 'Grid', index: int) -> None:
+        """Инициализировать обработчик точки в карте.
+
+        Args:
+            grid: сетка, в которой хранятся данные точки.
+            index: номер ячейки в сетке.
+        """
+        self._grid = grid
+        self._index = index
+
+    @property
+    def passable(self) -> bool:
+        """Получить проходимость точки.
+
+        Returns:
+            Логическое значение, проходима ли точка.
+        """
+        return bool(self._grid.passable[self._index])
+
+    @passable.setter
+    def passable(self, value: bool) -> None:
+        """Задать проходимость точки.
+
+        Args:
+            value: проходима ли точка.
+        """
+        self._grid.passable[self._index] = 1 if value else 0
+        self._grid.touch(self._index)
+
+    @property
+    def cost(self) -> int:
+        """Получить стоимость входа в точку.
+
+        Returns:
+            Целое число от 1 до MAX_COST.
+        """
+        costs = self._grid.costs
+        return 1 if costs is None else costs[self._index]
+
+    @cost.setter
+    def cost(self, value: int) -> None:
+        """Задать стоимость входа в точку.
+
+        Args:
+            value: целое число от 1 до MAX_COST.
+        """
+        self._grid.set_cost(self._index, value)
+
+    @property
+    def distance(self) -> Optional[int]:
+        """Получить расстояние от начальной точки.
+
+        Returns:
+            Расстояние или None, если точка ещё не достигнута.
+        """
+        distance = self._grid.distance[self._index]
+        return None if distance == UNREACHED else distance
+
+    @distance.setter
+    def distance(self, value: Optional[int]) -> None:
+        """Задать расстояние от начальной точки.
+
+        Args:
+            value: расстояние или None для сброса.
+        """
+        self._grid.distance[self._index] = UNREACHED if value is None else value
+
+    def clear(self) -> None:
+        """Очистить ячейку таблицы."""
+        self.distance = None
+
+    def __str__(self) -> str:
+        """Получить строковое представление точки.
+
+        Returns:
+            Белый квадрат для проходимой точки и черный для непроходимой.
+        """
+        return '⬜' if self.passable else '⬛'
+
+
+class Grid:
+    """Сетка карты, хранящая проходимость и расстояния в плоских массивах.
+
+    Проходимость хранится в bytearray по байту на ячейку, расстояния - в массиве int32.
+    Стоимости входа в ячейки хранятся в bytearray costs, пока все они равны 1, массива нет.
+    Ячейка с координатами (x, y) имеет номер y * width + x, поэтому соседние ячейки получаются
+    прибавлением смещений offsets к номеру без создания точек. Версия сетки уникальна среди всех
+    сеток и меняется при каждом изменении проходимости, а номера изменённых ячеек записываются
+    в журнал changes, чтобы индексы могли обновиться частично. Журнал ведётся, только пока у сетки
+    есть читатели, и хранит лишь записи, которые прочитали ещё не все читатели.
+
+    Наследники могут хранить данные иначе, например упакованными в отображённом в память файле;
+    признак dense сообщает, лежат ли массивы сетки в непрерывных буферах.
+    """
+
+    dense = True
+
+    def __init__(self, width: int, height: int, passable: Optional[Cells] = None) -> None:
+        """Инициализировать сетку.
+
+        Args:
+            width: количество столбцов сетки.
+            height: количество строк сетки.
+            passable: начальные значения проходимости, по умолчанию все ячейки непроходимы.
+        """
+        self.width = width
+        self.height = height
+        self.size = width * height
+        if passable is None:
+            passable = bytearray(self.size)
+        elif len(passable) != self.size:
+            raise WrongArgumentValuesError('Размер данных не совпадает с размером сетки')
+        self.passable = passable
+        self.offsets = (width, 1, -width, -1)
+        self.costs: Optional[Cells] = None
+        self.min_cost = self.max_cost = 1
+        self.distance = self.allocate()
+        self.changes: List[int] = []
+        self.changes_start = 0
+        self.readers: 'WeakKeyDictionary[object, int]' = WeakKeyDictionary()
+        self.touch()
+
+    def touch(self, index: Optional[int] = None) -> None:
+        """Отметить изменение проходимости, присвоив сетке новую версию.
+
+        Args:
+            index: номер изменённой ячейки, если изменилась одна ячейка.
+        """
+        self.version = next(VERSIONS)
+        if index is not None and self.readers:
+            self.changes.append(index)
+            if len(self.changes) > self.size:
+                self.changes_start += len(self.changes)
+                self.changes.clear()
+
+    def subscribe(self, reader: object) -> None:
+        """Начать читать журнал изменений с текущего момента.
+
+        Читатель хранится по слабой ссылке и перестаёт удерживать журнал, когда удаляется.
+
+        Args:
+            reader: читатель журнала, например индекс карты.
+        """
+        self.readers[reader] = self.changes_start + len(self.changes)
+
+    def read_changes(self, reader: object) -> Optional[List[int]]:
+        """Получить изменения, которые читатель ещё не прочитал, и сжать журнал.
+
+        Если изменений больше, чем ячеек в сетке, журнал сбрасывается: частичное обновление
+        уже не быстрее полного пересчёта.
+
+        Args:
+            reader: читатель, подписанный методом subscribe.
+
+        Returns:
+            Номера изменённых ячеек или None, если часть изменений сброшена и читатель
+            должен пересчитать всё заново.
+        """
+        unread = self.readers.get(reader, 0) - self.changes_start
+        changes = self.changes[unread:] if unread >= 0 else None
+        self.readers[reader] = self.changes_start + len(self.changes)
+        first = min(self.readers.values())
+        del self.changes[: first - self.changes_start]
+        self.changes_start = first
+        return changes
+
+    def set_costs(self, costs: Optional[Sequence[int]], copy: bool = True) -> None:
+        """Задать стоимости входа во все ячейки.
+
+        Args:
+            costs: стоимости по байту на ячейку от 1 до MAX_COST или None, чтобы все стоимости были равны 1.
+            copy: скопировать стоимости в bytearray, False - хранить переданный изменяемый буфер,
+                например участок общей памяти.
+        """
+        if costs is None:
+            self.costs = None
+            self.min_cost = self.max_cost = 1
+        else:
+            if len(costs) != self.size:
+                raise WrongArgumentValuesError('Размер данных не совпадает с размером сетки')
+            if 0 in costs:
+                raise WrongArgumentValuesError(f'Стоимость должна быть от 1 до {MAX_COST}')
+            self.costs = bytearray(costs) if copy else cast(Cells, costs)
+            self.min_cost = min(self.costs)
+            self.max_cost = max(self.costs)
+        self.touch()
+
+    def set_cost(self, index: int, cost: int) -> None:
+        """Задать стоимость входа в ячейку.
+
+        Наименьшая и наибольшая стоимости только расширяются, поэтому остаются границами
+        стоимостей сетки и после повышения стоимости самой дешёвой ячейки.
+
+        Args:
+            index: номер ячейки.
+            cost: стоимость от 1 до MAX_COST.
+        """
+        if not 1 <= cost <= MAX_COST:
+            raise WrongArgumentValuesError(f'Стоимость должна быть от 1 до {MAX_COST}')
+        if self.costs is None:
+            if cost == 1:
+                return
+            self.costs = bytearray(b'\x01') * self.size
+        self.costs[index] = cost
+        self.min_cost = min(self.min_cost, cost)
+        self.max_cost = max(self.max_cost, cost)
+        self.touch(index)
+
+    def path_cost(self, path: List[Point]) -> int:
+        """Рассчитать стоимость пути.
+
+        Args:
+            path: список точек от конечной точки до начальной.
+
+        Returns:
+            Сумму стоимостей входа во все точки пути, кроме начальной.
+        """
+        costs = self.costs
+        if costs is None:
+            return max(len(path) - 1, 0)
+        return sum(costs[self.index(point)] for point in path[:-1])
+
+    def index(self, point: Point) -> int:
+        """Получить номер ячейки по точке.
+
+        Args:
+            point: точка на сетке.
+
+        Returns:
+            Номер ячейки в плоских массивах.
+        """
+        return point.y * self.width + point.x
+
+    def neighbours(self, index: int) -> List[int]:
+        """Получить проходимые соседние ячейки.
+
+        Args:
+            index: номер ячейки, не лежащей на границе сетки.
+
+        Returns:
+            Номера проходимых соседних ячеек в порядке смещений offsets.
+        """
+        passable = self.passable
+        return [index + offset for offset in self.offsets if passable[index + offset]]
+
+    def manhattan(self, first: int, second: int) -> int:
+        """Рассчитать манхэттенское расстояние между ячейками.
+
+        Args:
+            first: номер первой ячейки.
+            second: номер второй ячейки.
+
+        Returns:
+            Сумму модулей разностей координат.
+        """
+        first_y, first_x = divmod(first, self.width)
+        second_y, second_x = divmod(second, self.width)
+        return abs(first_x - second_x) + abs(first_y - second_y)
+
+    def point(self, index: int) -> Point:
+        """Получить точку по номеру ячейки.
+
+        Args:
+            index: номер ячейки в плоских массивах.
+
+        Returns:
+            Точку с координатами ячейки.
+        """
+        y, x = divmod(index, self.width)
+        return Point(x, y)
+
+    def __getitem__(self, point: Point) -> MapPoint:
+        """Получить ячейку сетки по точке.
+
+        Args:
+            point: точка, координаты которой совпадают с координатами ячейки.
+
+        Returns:
+            Представление ячейки.
+        """
+        return MapPoint(self, point.y * self.width + point.x)
+
+    def __setitem__(self, point: Point, value: MapPoint) -> None:
+        """Скопировать данные ячейки в ячейку сетки по точке.
+
+        Args:
+            point: точка, координаты которой совпадают с координатами ячейки.
+            value: ячейка, данные которой необходимо скопировать.
+        """
+        cell = self[point]
+        cell.passable = value.passable
+        cell.cost = value.cost
+        cell.distance = value.distance
+
+    def __iter__(self) -> Iterator[List[MapPoint]]:
+        """Получить итератор по строкам сетки.
+
+        Returns:
+            Списки представлений ячеек построчно.
+        """
+        for y in range(self.height):
+            start = y * self.width
+            yield [MapPoint(self, index) for index in range(start, start + self.width)]
+
+    def rows(self) -> Iterator[bytes]:
+        """Получить проходимость сетки построчно.
+
+        Returns:
+            Строки сетки в виде байт, где 1 - проходимая ячейка.
+        """
+        for start in range(0, self.size, self.width):
+            end = start + self.width
+            yield bytes(self.passable[start:end])
+
+    def allocate(self) -> Cells:
+        """Создать массив значений для всех ячеек сетки.
+
+        Returns:
+            Массив int32, заполненный значением UNREACHED.
+        """
+        return array('i', [UNREACHED]) * self.size
+
+    def flags(self) -> Cells:
+        """Создать массив отметок для всех ячеек сетки.
+
+        Returns:
+            Массив байт, заполненный нулями.
+        """
+        return bytearray(self.size)
+
+    def trace(self, parents: Cells, index: int) -> List[Point]:
+        """Восстановить путь по указателям на родительские ячейки.
+
+        Args:
+            parents: номера родительских ячеек, UNREACHED у корня.
+            index: номер ячейки, с которой начинается путь.
+
+        Returns:
+            Список точек от заданной ячейки до корня.
+        """
+        path = [self.point(index)]
+        index = parents[index]
+        while index != UNREACHED:
+            path.append(self.point(index))
+            index = parents[index]
+        return path
+
+    def splice(self, forward: Cells, backward: Cells, meet: int) -> List[Point]:
+        """Соединить пути двунаправленного поиска в ячейке встречи.
+
+        Args:
+            forward: номера родительских ячеек поиска от начальной точки.
+            backward: номера родительских ячеек поиска от конечной точки.
+            meet: номер ячейки, в которой встретились поиски.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
+        path = self.trace(backward, meet)
+        path.reverse()
+        path.extend(self.trace(forward, meet)[1:])
+        return path
+
+    def clear(self) -> None:
+        """Сбросить расстояния всех ячеек."""
+        self.distance = self.allocate()
+
+    def close(self) -> None:
+        """Освободить ресурсы сетки.
+
+        Сетка в памяти ничего не держит, наследники закрывают файлы, из которых читают ячейки.
+        """
+
+    def __enter__(self) -> 'Grid':
+        """Использовать сетку в блоке with.
+
+        Returns:
+            Эту сетку.
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Освободить ресурсы сетки при выходе из блока with.
+
+        Args:
+            args: сведения об исключении.
+        """
+        self.close()
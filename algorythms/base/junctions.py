@@ -0,0 +1,225 @@
+"""Граф перекрёстков, полученный стягиванием коридоров."""
+
+from heapq import heappop, heappush
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .exceptions import CalculationFailedError, WrongActionError
+from .grid import Grid
+from .logging import logger
+from .math_handlers import Point
+from .stats import SearchStats
+
+Edge = Tuple[int, int, int]
+
+
+class JunctionGraph:
+    """Граф перекрёстков и тупиков лабиринта.
+
+    Ячейки коридоров, у которых ровно два проходимых соседа, стягиваются во взвешенные рёбра
+    между перекрёстками и тупиками. Для ребра хранится только первая ячейка коридора: полный путь
+    восстанавливается повторным проходом по коридору и только для найденного ответа.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        """Построить граф.
+
+        Args:
+            grid: сетка карты.
+        """
+        self.grid = grid
+        self.version = grid.version
+        self.offsets = (1, -1, grid.width, -grid.width)
+        self.edges: Dict[int, List[Edge]] = {}
+        passable = grid.passable
+        cells = 0
+        for index in range(grid.size):
+            if passable[index]:
+                cells += 1
+                if len(self.neighbours(index)) != 2:
+                    self.edges[index] = []
+        seen = bytearray(grid.size)
+        for node in list(self.edges):
+            self.connect(node, seen)
+        for index in range(grid.size):
+            if passable[index] and not seen[index] and index not in self.edges:
+                self.edges[index] = []
+                self.connect(index, seen)
+        self.cells = cells
+        self.ratio = cells / len(self.edges) if self.edges else 1.0
+        logger.info(f'Граф перекрёстков: {cells} ячеек стянуто в {len(self.edges)} вершин, сжатие {self.ratio:.1f}')
+
+    @property
+    def valid(self) -> bool:
+        """Проверить, соответствует ли граф текущему состоянию карты.
+
+        Returns:
+            Логическое значение, не менялась ли карта после построения графа.
+        """
+        return self.grid.version == self.version
+
+    def neighbours(self, index: int) -> List[int]:
+        """Получить проходимых соседей ячейки.
+
+        Args:
+            index: номер ячейки.
+
+        Returns:
+            Номера проходимых соседних ячеек.
+        """
+        passable = self.grid.passable
+        return [index + offset for offset in self.offsets if passable[index + offset]]
+
+    def connect(self, node: int, seen: bytearray) -> None:
+        """Добавить рёбра из вершины по всем выходящим из неё коридорам.
+
+        Args:
+            node: номер ячейки-вершины.
+            seen: отметки ячеек, уже вошедших в рёбра.
+        """
+        seen[node] = 1
+        for first in self.neighbours(node):
+            length = 0
+            for index in self.corridor(node, first):
+                seen[index] = 1
+                length += 1
+            self.edges[node].append((index, length, first))
+
+    def corridor(self, index: int, first: int, stop: int = -1) -> Iterator[int]:
+        """Пройти по коридору от ячейки до ближайшей вершины.
+
+        Args:
+            index: номер ячейки, из которой начинается проход.
+            first: номер первой ячейки коридора.
+            stop: номер ячейки, на которой проход нужно остановить досрочно.
+
+        Returns:
+            Номера ячеек коридора, последней идёт вершина или ячейка stop.
+        """
+        previous, index = index, first
+        while True:
+            yield index
+            if index == stop or index in self.edges:
+                return
+            first, second = self.neighbours(index)
+            previous, index = index, second if first == previous else first
+
+    def attach(self, index: int, stop: int) -> Dict[int, Tuple[int, int, int]]:
+        """Найти вершины, ближайшие к ячейке по её коридору.
+
+        Args:
+            index: номер ячейки.
+            stop: номер ячейки, встреча с которой означает общий коридор.
+
+        Returns:
+            Словарь: вершина или ячейка stop -> (расстояние, первая ячейка коридора от index,
+            ячейка коридора перед найденной вершиной).
+        """
+        if index in self.edges:
+            return {index: (0, index, index)}
+        attached: Dict[int, Tuple[int, int, int]] = {}
+        for first in self.neighbours(index):
+            length = 0
+            last = cell = index
+            for cell in self.corridor(index, first, stop):
+                length += 1
+                if cell not in self.edges and cell != stop:
+                    last = cell
+            if cell not in attached or length < attached[cell][0]:
+                attached[cell] = (length, first, last)
+        return attached
+
+    def search(
+        self,
+        start: int,
+        end: int,
+        heuristic: bool = False,
+        stats: Optional[SearchStats] = None,
+    ) -> Tuple[List[Point], int]:
+        """Найти путь по графу перекрёстков.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+            heuristic: использовать ли манхэттенское расстояние до конечной ячейки (А*),
+                иначе поиск ведётся алгоритмом Дейкстры.
+            stats: статистика поиска.
+
+        Returns:
+            Список точек от конечной точки до начальной и количество раскрытых вершин.
+        """
+        if not self.valid:
+            raise WrongActionError('Карта изменилась после построения графа перекрёстков')
+        if stats is None:
+            stats = SearchStats()
+        on_expand = stats.on_expand
+        on_push = stats.on_push
+        if start == end:
+            return [self.grid.point(start)], 0
+        width = self.grid.width
+        end_y, end_x = divmod(end, width)
+        sources = self.attach(start, end)
+        direct = sources.pop(end, None)
+        best = direct[0] if direct else -1
+        best_node = -1
+        targets = self.attach(end, -1)
+        distance: Dict[int, int] = {}
+        parents: Dict[int, Tuple[int, int]] = {}
+        points: List[Tuple[int, int]] = []
+        for node, (length, first, _) in sources.items():
+            distance[node] = length
+            if node != start:
+                parents[node] = (start, first)
+            y, x = divmod(node, width)
+            heappush(points, (length + (abs(end_x - x) + abs(end_y - y) if heuristic else 0), node))
+            stats.pushed += 1
+            if on_push is not None:
+                on_push(node)
+        closed: Set[int] = set()
+        expanded = 0
+        while points:
+            stats.frontier = max(stats.frontier, len(points))
+            estimate, node = heappop(points)
+            if best != -1 and estimate >= best:
+                break
+            if node in closed:
+                continue
+            closed.add(node)
+            expanded += 1
+            if on_expand is not None:
+                on_expand(node)
+            if node in targets and (best == -1 or distance[node] + targets[node][0] < best):
+                best = distance[node] + targets[node][0]
+                best_node = node
+            for new_node, length, first in self.edges[node]:
+                new_distance = distance[node] + length
+                if new_node not in closed and (new_node not in distance or new_distance < distance[new_node]):
+                    distance[new_node] = new_distance
+                    parents[new_node] = (node, first)
+                    y, x = divmod(new_node, width)
+                    heappush(points, (new_distance + (abs(end_x - x) + abs(end_y - y) if heuristic else 0), new_node))
+                    stats.pushed += 1
+                    if on_push is not None:
+                        on_push(new_node)
+        if heuristic:
+            stats.heuristic = stats.pushed
+        if best == -1:
+            raise CalculationFailedError('Не удалось найти путь')
+        stats.backtrack()
+        if best_node == -1 and direct:
+            cells = [start]
+            cells.extend(self.corridor(start, direct[1], end))
+            cells.reverse()
+            return [self.grid.point(index) for index in cells], expanded
+        segments = []
+        node = best_node
+        while node != start:
+            previous, first = parents[node]
+            segments.append((previous, first, node))
+            node = previous
+        cells = [start]
+        for previous, first, node in reversed(segments):
+            cells.extend(self.corridor(previous, first, node))
+        if best_node != end:
+            cells.extend(self.corridor(best_node, targets[best_node][2], end))
+        cells.reverse()
+        return [self.grid.point(index) for index in cells], expanded
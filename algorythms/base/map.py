@@ -1,36 +1,25 @@
 """Обработка карты."""
 
-import random
-from typing import Any, List, Optional
-
-from .exceptions import DataNotProvidedError, WrongArgumentValuesError
-from .math_handlers import Matrix, Point, Vector
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .cache import PathCache
+from .exceptions import DataNotProvidedError, WrongActionError, WrongArgumentValuesError
+from .generators import GENERATORS
+from .grid import Grid
+from .junctions import JunctionGraph
+from .math_handlers import Point, Vector
+from .paths import waypoints
+from .stats import Hook, SearchStats, SearchStep
+from .storage import load_grid, save_grid
+from .tree import TreeIndex
 
 DIRECTIONS = [Vector(0, 1), Vector(1, 0), Vector(0, -1), Vector(-1, 0)]
 
 
-class MapPoint:
-    """Обработчик точки в карте."""
-
-    def __init__(self, passable: bool, distanse: Optional[int] = None):
-        """Инициализировать обработчик точки в карте.
-
-        Args:
-            passable: проходимая ли точка.
-            distanse: расстояние от начальной точки.
-        """
-        self.distance = distanse
-        self.passable = passable
-
-    def clear(self) -> None:
-        """Очистить ячейку таблицы."""
-        self.distance = None
-
-
 class Map:
     """Карта, содержащая проходимые и непроходимые точки."""
 
-    data: Matrix[MapPoint]
+    data: Grid
     _n: int
     _m: int
     _start_point: Optional[Point] = None
@@ -38,6 +27,23 @@ class Map:
     _height: int
     _width: int
     path: List[Point]
+    bidirectional: bool = False
+    expanded: int = 0
+    CACHE_SIZE = 128
+    TILE_CACHE_SIZE = 64
+    _cache: PathCache
+    _tree: TreeIndex
+    _junctions: JunctionGraph
+    JUNCTION_HEURISTIC = False
+    WEIGHTED = True
+    generator = 'backtracker'
+    seed: Optional[int] = None
+    heuristic = ''
+    diagonal = ''
+    stats: SearchStats
+    on_expand: Hook = None
+    on_push: Hook = None
+    on_done: Optional[Callable[[List[Point], SearchStats], None]] = None
 
     @property
     def start_point(self) -> Optional[Point]:
@@ -133,32 +139,101 @@ class Map:
             raise WrongArgumentValuesError('Значение должно быть больше 0')
         self._width = int_value
 
+    @property
+    def version(self) -> int:
+        """Получить версию карты.
+
+        Версия меняется при генерации карты и при изменении проходимости любой точки.
+
+        Returns:
+            Целое число, уникальное для каждого состояния карты.
+        """
+        if not hasattr(self, 'data'):
+            raise DataNotProvidedError('Карта ещё не сгенерирована')
+        return self.data.version
+
+    @property
+    def cache(self) -> PathCache:
+        """Получить кэш найденных путей.
+
+        Returns:
+            Кэш путей этой карты.
+        """
+        if not hasattr(self, '_cache'):
+            self._cache = PathCache(self.CACHE_SIZE)
+        return self._cache
+
+    @property
+    def cache_size(self) -> int:
+        """Получить вместимость кэша путей.
+
+        Returns:
+            Наибольшее количество хранимых путей.
+        """
+        return self.cache.capacity
+
+    @cache_size.setter
+    def cache_size(self, value: Any) -> None:
+        """Задать вместимость кэша путей.
+
+        Args:
+            value: наибольшее количество хранимых путей, 0 отключает кэш.
+        """
+        try:
+            int_value = int(value)
+        except ValueError:
+            raise WrongArgumentValuesError(f'Неверное значение ввода: "{value}". Должно быть целое число')
+        self.cache.capacity = int_value
+
     def generate_map(self) -> None:
         """Сгенерировать карту."""
+        if self.generator not in GENERATORS:
+            raise WrongArgumentValuesError(f'Неизвестный генератор: "{self.generator}"')
         self._n = 2 * self.height + 1
         self._m = 2 * self.width + 1
-        self.data = Matrix([[MapPoint(passable=False) for _ in range(self._m)] for _ in range(self._n)])
-
-        stack = [Point(0, 0)]
-        while len(stack) > 0:
-            point = stack[-1]
-            random.shuffle(DIRECTIONS)
-
-            for direction in DIRECTIONS:
-                next_point = point + direction
-                if (
-                    next_point.x >= 0
-                    and next_point.y >= 0
-                    and next_point.x < self.width
-                    and next_point.y < self.height
-                    and not self.data[self.to_raw(next_point)].passable
-                ):
-                    self.data[self.to_raw(next_point)].passable = True
-                    self.data[self.to_raw(point) + direction].passable = True
-                    stack.append(next_point)
-                    break
-            else:
-                stack.pop()
+        data = GENERATORS[self.generator](self.seed).generate(self.width, self.height)
+        self.close()
+        self.data = data
+
+    def save(self, path: str, tile_size: int = 0) -> None:
+        """Сохранить карту в файл.
+
+        Проходимость записывается по биту на ячейку вместе с размерами, начальной и конечной точками.
+
+        Args:
+            path: путь к файлу.
+            tile_size: размер стороны тайла, 0 - сохранить без разбиения на тайлы.
+        """
+        if not hasattr(self, 'data'):
+            raise DataNotProvidedError('Карта ещё не сгенерирована')
+        save_grid(self.data, path, self.start_point, self.end_point, tile_size)
+
+    def load(self, path: str, mapped: bool = True) -> None:
+        """Загрузить карту из файла.
+
+        При отображении в память файл не читается целиком: поиск подгружает только страницы
+        с посещёнными ячейками, поэтому открытие даже очень большой карты происходит сразу.
+        Карта из тайлов загружается по тайлам, в памяти хранится не более TILE_CACHE_SIZE тайлов.
+
+        Args:
+            path: путь к файлу.
+            mapped: отобразить файл в память вместо чтения целиком.
+        """
+        data, start, end = load_grid(path, mapped, self.TILE_CACHE_SIZE)
+        self.close()
+        self.data = data
+        self._n = data.height
+        self._m = data.width
+        self._height = max(1, (data.height - 1) // 2)
+        self._width = max(1, (data.width - 1) // 2)
+        self._start_point = self._end_point = None
+        self.start_point = start
+        self.end_point = end
+
+    def close(self) -> None:
+        """Закрыть файл, из которого читается текущая сетка карты."""
+        if hasattr(self, 'data'):
+            self.data.close()
 
     def __repr__(self) -> str:
         """Получить строковое предсавление карты.
@@ -180,14 +255,269 @@ class Map:
     def find_path(self) -> List[Point]:
         """Найти путь в лабиринте.
 
+        Результаты запоминаются в кэше по версии карты, начальной и конечной точкам,
+        поэтому повторный запрос к неизменённой карте не запускает поиск.
+
         Returns:
             Список точек.
         """
+        path, _ = self.find_path_with_stats()
+        return path
+
+    def find_waypoints(self) -> List[Point]:
+        """Найти путь в лабиринте в сжатом виде.
+
+        Полный путь восстанавливается функцией expand_waypoints из algorythms.base.paths.
+
+        Returns:
+            Конечную точку, точки поворота и начальную точку.
+        """
+        return waypoints(self.find_path())
+
+    def find_path_with_stats(self) -> Tuple[List[Point], SearchStats]:
+        """Найти путь в лабиринте и собрать статистику поиска.
+
+        Статистика последнего поиска также доступна в атрибуте stats. Обработчики on_expand
+        и on_push вызываются алгоритмом поиска с номером ячейки или вершины, on_done -
+        с найденным путём и статистикой после каждого запроса, в том числе из кэша.
+
+        Returns:
+            Список точек и статистику поиска.
+        """
+        start, end = self.query()
+        key = (self.version, start, end, self.diagonal, self.heuristic)
+        return self.answer(key, start, end, self.cache.get(key))
+
+    def answer(
+        self,
+        key: Tuple[Any, ...],
+        start: int,
+        end: int,
+        path: Optional[List[Point]],
+    ) -> Tuple[List[Point], SearchStats]:
+        """Ответить на запрос пути путём из кэша, индексом или поиском по ячейкам.
+
+        Args:
+            key: ключ запроса в кэше путей.
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+            path: путь из кэша или None, если его там нет.
+
+        Returns:
+            Список точек и статистику поиска.
+        """
+        stats = self.stats = SearchStats(self.on_expand, self.on_push)
+        if path is None:
+            self.clear()
+            source = self.index_source()
+            if source == 'tree':
+                stats.start('tree')
+                self.expanded = 0
+                path = self._tree.path(start, end)
+            elif source == 'junctions':
+                stats.start('junctions')
+                path, self.expanded = self._junctions.search(start, end, self.JUNCTION_HEURISTIC, stats)
+            else:
+                stats.start('search')
+                path = self.search(start, end)
+            stats.finish(len(path), self.expanded)
+            self.cache.put(key, path)
+        else:
+            stats.start('cache')
+            self.expanded = 0
+            stats.finish(len(path), 0)
+        if self.on_done is not None:
+            self.on_done(list(path), stats)
+        return list(path), stats
+
+    def find_path_steps(self, batch: int = 256) -> Iterator[SearchStep]:
+        """Найти путь в лабиринте пошагово.
+
+        Поиск выдаёт ход работы порциями по batch раскрытых ячеек, последняя порция алгоритма
+        выдаётся вместе с путём. Путь из кэша, индекса дерева или графа перекрёстков выдаётся
+        сразу, одной порцией.
+
+        Args:
+            batch: количество раскрытых ячеек в порции.
+
+        Returns:
+            Порции хода поиска.
+        """
+        start, end = self.query()
+        key = (self.version, start, end, self.diagonal, self.heuristic)
+        path = self.cache.get(key)
+        if path is not None or self.index_source():
+            path, _ = self.answer(key, start, end, path)
+            yield SearchStep([], [], end, path)
+            return
+        stats = self.stats = SearchStats(self.on_expand, self.on_push)
+        self.clear()
+        stats.start('search')
+        last = SearchStep([], [], end, [])
+        for step in self.steps(start, end, batch):
+            if step.path is None:
+                yield step
+            else:
+                last = step
+        path = last.path or []
+        stats.finish(len(path), self.expanded)
+        self.cache.put(key, path)
+        if self.on_done is not None:
+            self.on_done(list(path), stats)
+        yield SearchStep(last.visited, last.pushed, last.best, list(path))
+
+    def query(self) -> Tuple[int, int]:
+        """Проверить данные запроса пути.
+
+        Returns:
+            Номера начальной и конечной ячеек.
+        """
+        if not hasattr(self, 'data'):
+            raise DataNotProvidedError('Не задано поле')
+        if not self.start_point:
+            raise DataNotProvidedError('Не задана начальная точка')
+        if not self.end_point:
+            raise DataNotProvidedError('Не задана конечная точка')
+        if self.data.costs is not None and not self.WEIGHTED:
+            raise WrongActionError('Алгоритм не учитывает стоимости ячеек, выберите А* или алгоритм Дайала')
+        return self.data.index(self.start_point), self.data.index(self.end_point)
+
+    def index_source(self) -> str:
+        """Выбрать индекс, который ответит на запрос без поиска по ячейкам.
+
+        Индексы построены для прямых ходов, а граф перекрёстков к тому же не учитывает стоимости ячеек.
+
+        Returns:
+            tree, junctions или пустую строку, если подходящего актуального индекса нет.
+        """
+        if self.diagonal:
+            return ''
+        if hasattr(self, '_tree') and self._tree.valid:
+            return 'tree'
+        if hasattr(self, '_junctions') and self._junctions.valid and self.data.costs is None:
+            return 'junctions'
+        return ''
+
+    def build_tree_index(self) -> TreeIndex:
+        """Построить индекс наименьшего общего предка для лабиринта без циклов.
+
+        Пока индекс актуален, find_path получает путь из него без поиска.
+        Индекс устаревает при генерации карты и при изменении проходимости.
+
+        Returns:
+            Индекс наименьшего общего предка.
+        """
+        if not hasattr(self, 'data'):
+            raise DataNotProvidedError('Карта ещё не сгенерирована')
+        if not hasattr(self, '_tree') or not self._tree.valid:
+            self._tree = TreeIndex(self.data)
+        return self._tree
+
+    def build_junction_graph(self) -> JunctionGraph:
+        """Стянуть коридоры карты в граф перекрёстков.
+
+        Пока граф актуален и у ячеек нет стоимостей, find_path ищет путь по нему, а не по ячейкам.
+        Граф устаревает при генерации карты и при изменении проходимости.
+
+        Returns:
+            Граф перекрёстков.
+        """
+        if not hasattr(self, 'data'):
+            raise DataNotProvidedError('Карта ещё не сгенерирована')
+        if not hasattr(self, '_junctions') or not self._junctions.valid:
+            self._junctions = JunctionGraph(self.data)
+        return self._junctions
+
+    def indexes(self) -> Dict[str, Any]:
+        """Получить описание построенных актуальных индексов карты.
+
+        По описанию те же индексы можно построить на копии карты, например в другом процессе.
+
+        Returns:
+            Признаки tree и junctions актуальности индекса дерева и графа перекрёстков.
+        """
+        return {
+            'tree': hasattr(self, '_tree') and self._tree.valid,
+            'junctions': hasattr(self, '_junctions') and self._junctions.valid,
+        }
+
+    def build_indexes(self, indexes: Dict[str, Any]) -> None:
+        """Построить индексы по описанию, полученному методом indexes.
+
+        Args:
+            indexes: описание индексов.
+        """
+        if indexes.get('tree'):
+            self.build_tree_index()
+        if indexes.get('junctions'):
+            self.build_junction_graph()
+
+    def search(self, start: int, end: int) -> List[Point]:
+        """Найти путь между ячейками.
+
+        Реализация обновляет счётчики self.stats, вызывает его обработчики on_expand и on_push
+        и отмечает stats.backtrack() перед восстановлением пути.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
         return []
 
+    def steps(self, start: int, end: int, batch: int) -> Iterator[SearchStep]:
+        """Найти путь между ячейками пошагово.
+
+        Базовая реализация выполняет search целиком, записывая раскрытия и добавления в границу
+        через обработчики статистики, и затем выдаёт записанный ход порциями. Алгоритмы,
+        которые могут прерывать поиск, переопределяют метод и выдают порции по ходу поиска.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+            batch: количество раскрытых ячеек в порции, 0 - только последняя порция.
+
+        Returns:
+            Порции хода поиска, последняя содержит путь.
+        """
+        stats = self.stats
+        on_expand = stats.on_expand
+        on_push = stats.on_push
+        events: List[Tuple[bool, int]] = []
+
+        def expand(index: int) -> None:
+            events.append((True, index))
+            if on_expand is not None:
+                on_expand(index)
+
+        def push(index: int) -> None:
+            events.append((False, index))
+            if on_push is not None:
+                on_push(index)
+
+        stats.on_expand = expand
+        stats.on_push = push
+        try:
+            path = self.search(start, end)
+        finally:
+            stats.on_expand = on_expand
+            stats.on_push = on_push
+        visited: List[int] = []
+        pushed: List[int] = []
+        for expanded, index in events:
+            if not expanded:
+                pushed.append(index)
+                continue
+            visited.append(index)
+            if batch and len(visited) >= batch:
+                yield SearchStep(visited, pushed, index)
+                visited = []
+                pushed = []
+        yield SearchStep(visited, pushed, end, path)
+
     def clear(self) -> None:
         """Очистить данные всех точек."""
         if hasattr(self, 'data'):
-            for row in self.data:
-                for cell in row:
-                    cell.clear()
+            self.data.clear()
@@ -1,67 +1,51 @@
 """Обработка математических составляющих."""
 
-from typing import Generic, Iterator, List, TypeVar
+from typing import Any, Iterator
 
-from .exceptions import WrongArgumentValuesError
+from .exceptions import WrongActionError, WrongArgumentValuesError
 
 
-class Vector:
-    """Класс для обработки вектора."""
-
-    def __init__(self, x: int, y: int) -> None:
-        """Инициализировать вектор.
+class Coordinates:
+    """Неизменяемая пара целых координат.
 
-        Args:
-            x: позиция вектора по оси x.
-            y: позиция вектора по оси y.
-        """
-        self.x = x
-        self.y = y
+    Координаты хранятся в слотах и не меняются после создания, поэтому объекты можно
+    использовать как ключи словарей и элементы множеств.
+    """
 
+    __slots__ = ('x', 'y')
 
-class Point:
-    """Класс для обработки точки."""
+    x: int
+    y: int
 
     def __init__(self, x: int, y: int) -> None:
-        """Инициализировать точку.
+        """Инициализировать координаты.
 
         Args:
-            x: позиция точки по оси x.
-            y: позиция точки по оси y.
+            x: координата по оси x.
+            y: координата по оси y.
         """
-        self.x = x
-        self.y = y
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
 
-    def __add__(self, vector: Vector) -> 'Point':
-        """Прибавление вектора к точке.
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Запретить изменение координат.
 
         Args:
-            Прибавляемый вектор.
-
-        Returns:
-            Точку с прибавленными значениями координат согласно вектору.
+            name: название атрибута.
+            value: новое значение.
         """
-        if not isinstance(vector, Vector):
-            raise WrongArgumentValuesError('К точке можно прибавлять только вектор')
-
-        return Point(self.x + vector.x, self.y + vector.y)
+        raise WrongActionError(f'{type(self).__name__} нельзя изменить')
 
-    def __mul__(self, number: int) -> 'Point':
-        """Умножить точку на число.
+    def __delattr__(self, name: str) -> None:
+        """Запретить удаление координат.
 
         Args:
-            number: число, на которое необходимо умножить координаты точки.
-
-        Returns:
-            Точку, координаты которой умножены на заданное число.
+            name: название атрибута.
         """
-        if not isinstance(number, int):
-            raise WrongArgumentValuesError('Точку можно умножать только на число')
-
-        return Point(self.x * number, self.y * number)
+        raise WrongActionError(f'{type(self).__name__} нельзя изменить')
 
     def __iter__(self) -> Iterator[int]:
-        """Итерировать координаты точки.
+        """Итерировать координаты.
 
         Returns:
             Координаты x и y последовательно.
@@ -70,63 +54,89 @@ class Point:
         yield self.y
 
     def __eq__(self, value: object) -> bool:
-        """Сравнить точку с другой точкой.
+        """Сравнить с другими координатами того же типа.
 
         Args:
             value: сравниваемое значение.
 
         Returns:
-            Логическое значение, являются ли точки равными.
+            Логическое значение, равны ли координаты.
         """
-        return isinstance(value, Point) and value.x == self.x and value.y == self.y
+        return (
+            isinstance(value, Coordinates)
+            and value.__class__ is self.__class__
+            and value.x == self.x
+            and value.y == self.y
+        )
 
-    def __repr__(self) -> str:
-        """Получить строковое представление точки.
+    def __hash__(self) -> int:
+        """Получить хэш координат.
 
         Returns:
-            Строку с координатами точки.
+            Хэш пары координат.
         """
-        return f'Точка ({self.x}, {self.y})'
+        return hash((self.__class__, self.x, self.y))
 
+    def __reduce__(self) -> Any:
+        """Получить данные для сериализации.
 
-CellVar = TypeVar('CellVar')
+        Returns:
+            Класс и аргументы для воссоздания объекта.
+        """
+        return self.__class__, (self.x, self.y)
 
 
-class Matrix(Generic[CellVar]):
-    """Обработчик матрицы с переменным типом содержимого."""
+class Vector(Coordinates):
+    """Класс для обработки вектора."""
 
-    def __init__(self, data: List[List[CellVar]]) -> None:
-        """Инициализировать обработчик матрицы.
+    __slots__ = ()
 
-        Args:
-            data: тип используемого содержимого.
+    def __repr__(self) -> str:
+        """Получить строковое представление вектора.
+
+        Returns:
+            Строку с координатами вектора.
         """
-        self.data = data
+        return f'Вектор ({self.x}, {self.y})'
+
+
+class Point(Coordinates):
+    """Класс для обработки точки."""
 
-    def __getitem__(self, point: Point) -> CellVar:
-        """Получить элемент из матрицы по точке.
+    __slots__ = ()
+
+    def __add__(self, vector: Vector) -> 'Point':
+        """Прибавление вектора к точке.
 
         Args:
-            point: точка, координаты которой совпадают с координатами желаемого значения.
+            Прибавляемый вектор.
 
         Returns:
-            Значение по заданным координатам.
+            Точку с прибавленными значениями координат согласно вектору.
         """
-        return self.data[point.y][point.x]
+        if not isinstance(vector, Vector):
+            raise WrongArgumentValuesError('К точке можно прибавлять только вектор')
 
-    def __setitem__(self, point: Point, value: CellVar) -> None:
-        """Задать значение элементу матрицы по точке.
+        return Point(self.x + vector.x, self.y + vector.y)
+
+    def __mul__(self, number: int) -> 'Point':
+        """Умножить точку на число.
 
         Args:
-            point: точка, координаты которой совпадают с координатами желаемого значения.
-            value: желаемое значение, которое необходимо разместить в ячейку.
+            number: число, на которое необходимо умножить координаты точки.
+
+        Returns:
+            Точку, координаты которой умножены на заданное число.
         """
-        self.data[point.y][point.x] = value
+        if not isinstance(number, int):
+            raise WrongArgumentValuesError('Точку можно умножать только на число')
 
-    def __iter__(self) -> Iterator[List[CellVar]]:
-        """Получить итератор матрицы.
+        return Point(self.x * number, self.y * number)
+
+    def __repr__(self) -> str:
+        """Получить строковое представление точки.
 
         Returns:
-            Итератор хранимого списка.
+            Строку с координатами точки.
         """
-        return self.data.__iter__()
+        return f'Точка ({self.x}, {self.y})'
@@ -0,0 +1,144 @@
+"""Ходы по сетке и эвристики поиска пути."""
+
+from typing import Callable, Dict, Tuple
+
+from .exceptions import WrongArgumentValuesError
+
+STRAIGHT_COST = 10
+
+DIAGONAL_COST = 14
+
+CORNERS = {'': 0, 'strict': 2, 'corner': 1, 'always': 0}
+
+Heuristic = Callable[[int, int, int, int], int]
+
+Move = Tuple[int, int, int, int]
+
+
+def manhattan(dx: int, dy: int, straight: int, diagonal: int) -> int:
+    """Оценить стоимость пути манхэттенским расстоянием.
+
+    Args:
+        dx: модуль разности координат x.
+        dy: модуль разности координат y.
+        straight: стоимость прямого хода.
+        diagonal: стоимость диагонального хода.
+
+    Returns:
+        Стоимость пути прямыми ходами.
+    """
+    return straight * (dx + dy)
+
+
+def octile(dx: int, dy: int, straight: int, diagonal: int) -> int:
+    """Оценить стоимость пути октильным расстоянием.
+
+    Args:
+        dx: модуль разности координат x.
+        dy: модуль разности координат y.
+        straight: стоимость прямого хода.
+        diagonal: стоимость диагонального хода.
+
+    Returns:
+        Стоимость пути по диагонали и затем прямо без препятствий.
+    """
+    if dx < dy:
+        dx, dy = dy, dx
+    return straight * (dx - dy) + diagonal * dy
+
+
+def chebyshev(dx: int, dy: int, straight: int, diagonal: int) -> int:
+    """Оценить стоимость пути расстоянием Чебышёва.
+
+    Args:
+        dx: модуль разности координат x.
+        dy: модуль разности координат y.
+        straight: стоимость прямого хода.
+        diagonal: стоимость диагонального хода.
+
+    Returns:
+        Стоимость пути, если диагональный ход стоит как прямой.
+    """
+    return straight * max(dx, dy)
+
+
+HEURISTICS: Dict[str, Heuristic] = {
+    'manhattan': manhattan,
+    'octile': octile,
+    'chebyshev': chebyshev,
+}
+
+
+def default_heuristic(diagonal: str) -> str:
+    """Получить название наиболее точной допустимой эвристики для правила диагональных ходов.
+
+    Args:
+        diagonal: правило диагональных ходов из CORNERS.
+
+    Returns:
+        octile при диагональных ходах, иначе manhattan.
+    """
+    return 'octile' if diagonal else 'manhattan'
+
+
+class Neighbourhood:
+    """Допустимые ходы из ячейки сетки и их стоимости.
+
+    Без диагоналей ход стоит 1, как и раньше. С диагоналями прямой ход стоит STRAIGHT_COST,
+    диагональный - DIAGONAL_COST, то есть примерно в √2 раз дороже. Правило diagonal задаёт,
+    когда диагональный ход разрешён: strict - оба ортогональных соседа проходимы, corner -
+    хотя бы один (путь срезает угол), always - всегда, даже между двумя стенами.
+
+    Ход описывается смещением номера ячейки, стоимостью и смещениями двух ортогональных соседей,
+    через углы которых он проходит; у прямого хода они равны 0.
+    """
+
+    __slots__ = ('diagonal', 'straight_cost', 'diagonal_cost', 'corners', 'moves')
+
+    def __init__(self, width: int, diagonal: str = '') -> None:
+        """Инициализировать окрестность.
+
+        Args:
+            width: количество столбцов сетки.
+            diagonal: правило диагональных ходов, пустая строка - только прямые ходы.
+        """
+        if diagonal not in CORNERS:
+            raise WrongArgumentValuesError(f'Неизвестное правило диагональных ходов: "{diagonal}"')
+        self.diagonal = diagonal
+        self.corners = CORNERS[diagonal]
+        moves = []
+        if diagonal:
+            self.straight_cost = STRAIGHT_COST
+            self.diagonal_cost = DIAGONAL_COST
+        else:
+            self.straight_cost = 1
+            self.diagonal_cost = 2
+        for offset in (width, 1, -width, -1):
+            moves.append((offset, self.straight_cost, 0, 0))
+        if diagonal:
+            for vertical in (width, -width):
+                for horizontal in (1, -1):
+                    moves.append((vertical + horizontal, self.diagonal_cost, vertical, horizontal))
+        self.moves: Tuple[Move, ...] = tuple(moves)
+
+    def heuristic(self, name: str) -> Heuristic:
+        """Получить эвристику, проверив её допустимость для окрестности.
+
+        Эвристика допустима, если не переоценивает ни один ход, в частности диагональный:
+        манхэттенское расстояние с диагональными ходами недопустимо.
+
+        Args:
+            name: название эвристики из HEURISTICS, пустая строка - default_heuristic.
+
+        Returns:
+            Функцию эвристики.
+        """
+        name = name or default_heuristic(self.diagonal)
+        if name not in HEURISTICS:
+            raise WrongArgumentValuesError(f'Неизвестная эвристика: "{name}"')
+        heuristic = HEURISTICS[name]
+        if self.diagonal and heuristic(1, 1, self.straight_cost, self.diagonal_cost) > self.diagonal_cost:
+            raise WrongArgumentValuesError(
+                f'Эвристика "{name}" недопустима при диагональных ходах, выберите octile или chebyshev',
+            )
+        return heuristic
@@ -0,0 +1,98 @@
+"""Сжатые представления пути."""
+
+from typing import Dict, List, Sequence, Tuple
+
+from .exceptions import WrongArgumentValuesError
+from .math_handlers import Point
+
+STEPS = ((0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (-1, 1), (1, -1), (-1, -1))
+
+CODES: Dict[Tuple[int, int], int] = {step: code for code, step in enumerate(STEPS)}
+
+Run = Tuple[int, int]
+
+
+def waypoints(path: Sequence[Point]) -> List[Point]:
+    """Оставить в пути только концы и точки поворота.
+
+    Args:
+        path: список соседних точек.
+
+    Returns:
+        Первую точку, точки смены направления и последнюю точку.
+    """
+    if len(path) < 3:
+        return list(path)
+    result = [path[0]]
+    direction = (path[1].x - path[0].x, path[1].y - path[0].y)
+    for point, following in zip(path[1:], path[2:]):
+        step = (following.x - point.x, following.y - point.y)
+        if step != direction:
+            result.append(point)
+            direction = step
+    result.append(path[-1])
+    return result
+
+
+def expand_waypoints(points: Sequence[Point]) -> List[Point]:
+    """Восстановить путь по точкам поворота.
+
+    Args:
+        points: точки поворота, соединённые прямыми или диагональными отрезками.
+
+    Returns:
+        Список всех точек пути.
+    """
+    path = list(points[:1])
+    for point, following in zip(points, points[1:]):
+        dx = following.x - point.x
+        dy = following.y - point.y
+        if dx and dy and abs(dx) != abs(dy):
+            raise WrongArgumentValuesError('Точки поворота должны соединяться прямыми или диагональными отрезками')
+        step_x = (dx > 0) - (dx < 0)
+        step_y = (dy > 0) - (dy < 0)
+        for step in range(1, max(abs(dx), abs(dy)) + 1):
+            path.append(Point(point.x + step * step_x, point.y + step * step_y))
+    return path
+
+
+def encode_runs(path: Sequence[Point]) -> List[Run]:
+    """Закодировать путь серией направлений.
+
+    Args:
+        path: список соседних точек.
+
+    Returns:
+        Пары из кода направления (номера в STEPS) и количества шагов в этом направлении.
+    """
+    runs: List[List[int]] = []
+    for point, following in zip(path, path[1:]):
+        code = CODES.get((following.x - point.x, following.y - point.y))
+        if code is None:
+            raise WrongArgumentValuesError('Соседние точки пути должны быть соседними ячейками')
+        if runs and runs[-1][0] == code:
+            runs[-1][1] += 1
+        else:
+            runs.append([code, 1])
+    return [(code, count) for code, count in runs]
+
+
+def decode_runs(start: Point, runs: Sequence[Run]) -> List[Point]:
+    """Восстановить путь по серии направлений.
+
+    Args:
+        start: первая точка пути.
+        runs: пары из кода направления и количества шагов.
+
+    Returns:
+        Список всех точек пути.
+    """
+    path = [start]
+    x, y = start.x, start.y
+    for code, count in runs:
+        dx, dy = STEPS[code]
+        for _ in range(count):
+            x += dx
+            y += dy
+            path.append(Point(x, y))
+    return path
@@ -0,0 +1,134 @@
+"""Статистика и ход поиска пути."""
+
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from .math_handlers import Point
+
+Hook = Optional[Callable[[int], None]]
+
+
+class SearchStep:
+    """Порция хода пошагового поиска.
+
+    Порция содержит изменения с предыдущей порции: раскрытые ячейки и ячейки, добавленные
+    в границу поиска, а также лучшую на данный момент ячейку. Граница поиска - все добавленные
+    ячейки без раскрытых, она не пересчитывается алгоритмом, поэтому порция стоит O(batch).
+    Последняя порция дополнительно содержит найденный путь.
+    """
+
+    __slots__ = ('visited', 'pushed', 'best', 'path')
+
+    def __init__(self, visited: List[int], pushed: List[int], best: int, path: Optional[List[Point]] = None) -> None:
+        """Инициализировать порцию.
+
+        Args:
+            visited: номера ячеек, раскрытых после предыдущей порции.
+            pushed: номера ячеек, добавленных в границу поиска после предыдущей порции.
+            best: номер лучшей на данный момент ячейки.
+            path: найденный путь от конечной точки до начальной, только в последней порции.
+        """
+        self.visited = visited
+        self.pushed = pushed
+        self.best = best
+        self.path = path
+
+
+class SearchStats:
+    """Статистика одного поиска пути.
+
+    Алгоритмы поиска увеличивают счётчики по ходу работы и вызывают обработчики on_expand
+    и on_push с номером ячейки или вершины. Обработчики проверяются на None один раз
+    за шаг, поэтому без них накладные расходы сводятся к сравнению.
+    """
+
+    __slots__ = (
+        'source',
+        'expanded',
+        'pushed',
+        'frontier',
+        'heuristic',
+        'length',
+        'search_time',
+        'backtrack_time',
+        'on_expand',
+        'on_push',
+        '_started',
+        '_backtracked',
+    )
+
+    def __init__(self, on_expand: Hook = None, on_push: Hook = None) -> None:
+        """Инициализировать статистику.
+
+        Args:
+            on_expand: обработчик раскрытия вершины.
+            on_push: обработчик добавления вершины в границу поиска.
+        """
+        self.source = ''
+        self.expanded = 0
+        self.pushed = 0
+        self.frontier = 0
+        self.heuristic = 0
+        self.length = 0
+        self.search_time = 0.0
+        self.backtrack_time = 0.0
+        self.on_expand = on_expand
+        self.on_push = on_push
+        self._started = 0.0
+        self._backtracked: Optional[float] = None
+
+    def start(self, source: str) -> None:
+        """Отметить начало поиска.
+
+        Args:
+            source: способ получения пути: search, tree, junctions или cache.
+        """
+        self.source = source
+        self._started = perf_counter()
+        self._backtracked = None
+
+    def backtrack(self) -> None:
+        """Отметить окончание поиска и начало восстановления пути."""
+        self._backtracked = perf_counter()
+        self.search_time = self._backtracked - self._started
+
+    def finish(self, length: int, expanded: int) -> None:
+        """Отметить окончание восстановления пути.
+
+        Args:
+            length: количество точек найденного пути.
+            expanded: количество раскрытых вершин.
+        """
+        finished = perf_counter()
+        if self._backtracked is None:
+            self.search_time = finished - self._started
+        else:
+            self.backtrack_time = finished - self._backtracked
+        self.length = max(length - 1, 0)
+        self.expanded = expanded
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Получить статистику в виде словаря.
+
+        Returns:
+            Словарь значений счётчиков и времени.
+        """
+        return {
+            'source': self.source,
+            'expanded': self.expanded,
+            'pushed': self.pushed,
+            'frontier': self.frontier,
+            'heuristic': self.heuristic,
+            'length': self.length,
+            'search_time': self.search_time,
+            'backtrack_time': self.backtrack_time,
+        }
+
+    def __repr__(self) -> str:
+        """Получить строковое представление статистики.
+
+        Returns:
+            Значения счётчиков и времени.
+        """
+        values = ', '.join(f'{name}={value!r}' for name, value in self.as_dict().items())
+        return f'SearchStats({values})'
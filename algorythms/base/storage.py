@@ -0,0 +1,483 @@
+"""Хранение карты на диске в упакованном виде."""
+
+import mmap
+from array import array
+from struct import Struct
+from typing import Dict, Iterable, Iterator, List, MutableSequence, Optional, Sequence, Tuple, Union
+
+from .exceptions import WrongArgumentValuesError
+from .grid import UNREACHED, Cells, Grid
+from .math_handlers import Point
+
+HEADER = Struct('<4sIIiiii')
+
+MAGIC = b'MAZ1'
+
+TILED_MAGIC = b'MAZT'
+
+BATCH_HEADER = Struct('<4sIII')
+
+BATCH_MAGIC = b'MAZN'
+
+CHUNK = 1 << 16
+
+NO_POINT = (-1, -1)
+
+TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+FROM_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def pack(cells: bytes) -> bytes:
+    """Упаковать проходимость ячеек по биту на ячейку.
+
+    Ячейка с номером i попадает в бит i % 8 байта i // 8.
+
+    Args:
+        cells: проходимость ячеек по байту на ячейку, длина кратна 8.
+
+    Returns:
+        Упакованные биты.
+    """
+    if not cells:
+        return b''
+    return int(cells.translate(TO_DIGITS)[::-1], 2).to_bytes(len(cells) // 8, 'little')
+
+
+def unpack(data: bytes, count: int) -> bytes:
+    """Распаковать проходимость ячеек в байт на ячейку.
+
+    Args:
+        data: упакованные биты.
+        count: количество ячеек, которое нужно получить.
+
+    Returns:
+        Проходимость первых count ячеек по байту на ячейку.
+    """
+    if not data:
+        return b''
+    digits = format(int.from_bytes(data, 'little'), f'0{len(data) * 8}b')[::-1]
+    return digits[:count].encode().translate(FROM_DIGITS)
+
+
+class PackedCells(MutableSequence[int]):
+    """Проходимость ячеек, упакованная по биту на ячейку в буфере.
+
+    Буфер обычно является отображённым в память файлом, поэтому чтение ячейки подгружает
+    с диска только страницу, в которой она лежит.
+    """
+
+    __slots__ = ('buffer', 'offset', 'size')
+
+    def __init__(self, buffer: Union[bytearray, mmap.mmap], offset: int, size: int) -> None:
+        """Инициализировать представление.
+
+        Args:
+            buffer: буфер с упакованными битами.
+            offset: смещение первого байта ячеек в буфере.
+            size: количество ячеек.
+        """
+        self.buffer = buffer
+        self.offset = offset
+        self.size = size
+
+    def __len__(self) -> int:
+        """Получить количество ячеек.
+
+        Returns:
+            Количество ячеек.
+        """
+        return self.size
+
+    def __getitem__(self, index: int) -> int:  # type: ignore[override]
+        """Получить проходимость ячейки.
+
+        Args:
+            index: номер ячейки.
+
+        Returns:
+            1 для проходимой ячейки, иначе 0.
+        """
+        return self.buffer[self.offset + (index >> 3)] >> (index & 7) & 1
+
+    def __setitem__(self, index: int, value: int) -> None:  # type: ignore[override]
+        """Задать проходимость ячейки.
+
+        Args:
+            index: номер ячейки.
+            value: проходима ли ячейка.
+        """
+        position = self.offset + (index >> 3)
+        mask = 1 << (index & 7)
+        byte = self.buffer[position]
+        self.buffer[position] = byte | mask if value else byte & ~mask
+
+    def __delitem__(self, index: int) -> None:  # type: ignore[override]
+        """Удалить ячейку.
+
+        Args:
+            index: номер ячейки.
+        """
+        raise WrongArgumentValuesError('Количество ячеек сетки не меняется')
+
+    def insert(self, index: int, value: int) -> None:
+        """Вставить ячейку.
+
+        Args:
+            index: номер ячейки.
+            value: проходимость ячейки.
+        """
+        raise WrongArgumentValuesError('Количество ячеек сетки не меняется')
+
+    def cells(self, start: int, end: int) -> bytes:
+        """Распаковать проходимость диапазона ячеек.
+
+        Args:
+            start: номер первой ячейки.
+            end: номер ячейки после последней.
+
+        Returns:
+            Проходимость ячеек по байту на ячейку.
+        """
+        first = self.offset + (start >> 3)
+        last = self.offset + ((end + 7) >> 3)
+        skip = start & 7
+        stop = skip + end - start
+        return unpack(bytes(self.buffer[first:last]), stop)[skip:]
+
+
+class SparseCells(MutableSequence[int]):
+    """Массив значений ячеек, хранящий только изменённые значения.
+
+    Используется вместо плотных массивов для сеток, не помещающихся в память: поиск
+    занимает память пропорционально количеству посещённых ячеек, а не размеру карты.
+    """
+
+    __slots__ = ('size', 'default', 'values')
+
+    def __init__(self, size: int, default: int) -> None:
+        """Инициализировать массив.
+
+        Args:
+            size: количество ячеек.
+            default: значение ячеек, которым не присваивали значение.
+        """
+        self.size = size
+        self.default = default
+        self.values: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        """Получить количество ячеек.
+
+        Returns:
+            Количество ячеек.
+        """
+        return self.size
+
+    def __getitem__(self, index: int) -> int:  # type: ignore[override]
+        """Получить значение ячейки.
+
+        Args:
+            index: номер ячейки.
+
+        Returns:
+            Значение ячейки.
+        """
+        return self.values.get(index, self.default)
+
+    def __setitem__(self, index: int, value: int) -> None:  # type: ignore[override]
+        """Задать значение ячейки.
+
+        Args:
+            index: номер ячейки.
+            value: значение ячейки.
+        """
+        self.values[index] = value
+
+    def __delitem__(self, index: int) -> None:  # type: ignore[override]
+        """Удалить ячейку.
+
+        Args:
+            index: номер ячейки.
+        """
+        raise WrongArgumentValuesError('Количество ячеек сетки не меняется')
+
+    def insert(self, index: int, value: int) -> None:
+        """Вставить ячейку.
+
+        Args:
+            index: номер ячейки.
+            value: значение ячейки.
+        """
+        raise WrongArgumentValuesError('Количество ячеек сетки не меняется')
+
+    def count(self, value: int) -> int:
+        """Посчитать ячейки с заданным значением.
+
+        Args:
+            value: искомое значение.
+
+        Returns:
+            Количество ячеек с этим значением.
+        """
+        stored = sum(1 for item in self.values.values() if item == value)
+        if value == self.default:
+            return self.size - len(self.values) + stored
+        return stored
+
+
+class MappedGrid(Grid):
+    """Сетка карты, проходимость которой читается из отображённого в память файла.
+
+    Проходимость хранится по биту на ячейку прямо в файле, расстояния и служебные массивы
+    поиска - в разреженных массивах, поэтому открытие карты не читает файл целиком,
+    а поиск подгружает только страницы файла с посещёнными ячейками. Файл отображается
+    с копированием при записи: изменения проходимости видны карте, но не попадают в файл.
+    """
+
+    dense = False
+
+    def __init__(self, width: int, height: int, file: mmap.mmap) -> None:
+        """Инициализировать сетку.
+
+        Args:
+            width: количество столбцов сетки.
+            height: количество строк сетки.
+            file: отображённый в память файл карты.
+        """
+        self.file = file
+        self.cells = PackedCells(file, HEADER.size, width * height)
+        super().__init__(width, height, self.cells)
+
+    def rows(self) -> Iterator[bytes]:
+        """Получить проходимость сетки построчно.
+
+        Returns:
+            Строки сетки в виде байт, где 1 - проходимая ячейка.
+        """
+        for start in range(0, self.size, self.width):
+            yield self.cells.cells(start, start + self.width)
+
+    def allocate(self) -> Cells:
+        """Создать массив значений для всех ячеек сетки.
+
+        Returns:
+            Разреженный массив со значением UNREACHED по умолчанию.
+        """
+        return SparseCells(self.size, UNREACHED)
+
+    def flags(self) -> Cells:
+        """Создать массив отметок для всех ячеек сетки.
+
+        Returns:
+            Разреженный массив со значением 0 по умолчанию.
+        """
+        return SparseCells(self.size, 0)
+
+    def close(self) -> None:
+        """Закрыть отображение файла."""
+        self.file.close()
+
+
+def check_rows(rows: Iterable[bytes], width: int, height: int) -> Iterator[bytes]:
+    """Проверить размеры и непроходимость границы записываемой карты.
+
+    Граница карты должна быть непроходимой: поиск опирается на неё и не проверяет
+    выход за пределы сетки.
+
+    Args:
+        rows: строки сетки в виде байт, где 1 - проходимая ячейка.
+        width: количество столбцов сетки.
+        height: количество строк сетки.
+
+    Returns:
+        Проверенные строки сетки.
+    """
+    written = 0
+    for row in rows:
+        if len(row) != width or written == height:
+            raise WrongArgumentValuesError('Размер данных не совпадает с размером сетки')
+        if row[0] or row[width - 1] or ((written == 0 or written == height - 1) and any(row)):
+            raise WrongArgumentValuesError('Граница карты должна быть непроходимой')
+        written += 1
+        yield row
+    if written != height:
+        raise WrongArgumentValuesError('Размер данных не совпадает с размером сетки')
+
+
+def read_point(x: int, y: int) -> Optional[Point]:
+    """Получить точку из заголовка файла карты.
+
+    Args:
+        x: координата x точки или -1.
+        y: координата y точки или -1.
+
+    Returns:
+        Точку или None, если точка не была задана.
+    """
+    return Point(x, y) if x >= 0 else None
+
+
+def dump_rows(
+    path: str,
+    width: int,
+    height: int,
+    rows: Iterable[bytes],
+    start: Optional[Point] = None,
+    end: Optional[Point] = None,
+) -> None:
+    """Записать карту в файл построчно.
+
+    Строки упаковываются по мере поступления, поэтому карту можно записать прямо из генератора,
+    не храня её в памяти целиком. Граница карты должна быть непроходимой.
+
+    Args:
+        path: путь к файлу.
+        width: количество столбцов сетки.
+        height: количество строк сетки.
+        rows: строки сетки в виде байт, где 1 - проходимая ячейка.
+        start: начальная точка.
+        end: конечная точка.
+    """
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, width, height, *(start or NO_POINT), *(end or NO_POINT)))
+        buffer = bytearray()
+        for row in check_rows(rows, width, height):
+            buffer += row
+            if len(buffer) >= CHUNK:
+                whole = len(buffer) - len(buffer) % 8
+                file.write(pack(bytes(buffer[:whole])))
+                del buffer[:whole]
+        buffer += bytes(-len(buffer) % 8)
+        file.write(pack(bytes(buffer)))
+
+
+def save_grid(
+    grid: Grid,
+    path: str,
+    start: Optional[Point] = None,
+    end: Optional[Point] = None,
+    tile_size: int = 0,
+) -> None:
+    """Сохранить сетку в файл.
+
+    Args:
+        grid: сетка карты.
+        path: путь к файлу.
+        start: начальная точка.
+        end: конечная точка.
+        tile_size: размер стороны тайла, 0 - сохранить без разбиения на тайлы.
+    """
+    if tile_size:
+        from .tiles import dump_tiles
+
+        dump_tiles(path, grid.width, grid.height, grid.rows(), tile_size, start, end)
+    else:
+        dump_rows(path, grid.width, grid.height, grid.rows(), start, end)
+
+
+def load_grid(path: str, mapped: bool = True, tiles: int = 64) -> Tuple[Grid, Optional[Point], Optional[Point]]:
+    """Загрузить сетку из файла.
+
+    Файл, разбитый на тайлы, всегда загружается лениво, по тайлам.
+
+    Args:
+        path: путь к файлу.
+        mapped: отобразить файл в память вместо чтения целиком.
+        tiles: наибольшее количество тайлов, одновременно хранимых в памяти.
+
+    Returns:
+        Сетку карты, начальную и конечную точки.
+    """
+    with open(path, 'rb') as file:
+        header = file.read(HEADER.size)
+        if len(header) != HEADER.size or header[:4] not in (MAGIC, TILED_MAGIC):
+            raise WrongArgumentValuesError(f'Файл "{path}" не является файлом карты')
+        if header[:4] == TILED_MAGIC:
+            from .tiles import TiledGrid
+
+            tiled = TiledGrid(path, tiles)
+            return tiled, tiled.start, tiled.end
+        _, width, height, start_x, start_y, end_x, end_y = HEADER.unpack(header)
+        size = width * height
+        file.seek(0, 2)
+        if file.tell() != HEADER.size + (size + 7) // 8:
+            raise WrongArgumentValuesError(f'Файл "{path}" повреждён')
+        if mapped:
+            grid: Grid = MappedGrid(width, height, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+        else:
+            file.seek(HEADER.size)
+            passable = bytearray()
+            while len(passable) < size:
+                passable += unpack(file.read(CHUNK), size - len(passable))
+            grid = Grid(width, height, passable)
+    return grid, read_point(start_x, start_y), read_point(end_x, end_y)
+
+
+def dump_batch(path: str, width: int, height: int, seeds: Sequence[int], mazes: Iterable[bytes]) -> None:
+    """Записать набор сеток одного размера в один файл.
+
+    После заголовка записываются зёрна в виде int64, затем сетки, каждая упакована по биту
+    на ячейку и дополнена до целого байта, поэтому сетка с любым номером читается одним чтением.
+
+    Args:
+        path: путь к файлу.
+        width: количество столбцов сеток.
+        height: количество строк сеток.
+        seeds: зёрна, из которых сгенерированы сетки.
+        mazes: проходимость сеток по байту на ячейку, в порядке зёрен.
+    """
+    padding = bytes(-(width * height) % 8)
+    written = 0
+    with open(path, 'wb') as file:
+        file.write(BATCH_HEADER.pack(BATCH_MAGIC, len(seeds), width, height))
+        file.write(array('q', seeds).tobytes())
+        for maze in mazes:
+            if len(maze) != width * height:
+                raise WrongArgumentValuesError('Размер данных не совпадает с размером сетки')
+            file.write(pack(bytes(maze) + padding))
+            written += 1
+    if written != len(seeds):
+        raise WrongArgumentValuesError('Количество сеток не совпадает с количеством зёрен')
+
+
+def read_batch(path: str) -> Tuple[int, int, List[int]]:
+    """Прочитать заголовок файла с набором сеток.
+
+    Args:
+        path: путь к файлу.
+
+    Returns:
+        Количество столбцов и строк сеток и зёрна сеток.
+    """
+    with open(path, 'rb') as file:
+        header = file.read(BATCH_HEADER.size)
+        if len(header) != BATCH_HEADER.size or header[:4] != BATCH_MAGIC:
+            raise WrongArgumentValuesError(f'Файл "{path}" не является файлом набора карт')
+        _, count, width, height = BATCH_HEADER.unpack(header)
+        seeds = array('q')
+        seeds.frombytes(file.read(8 * count))
+        file.seek(0, 2)
+        if len(seeds) != count or file.tell() != BATCH_HEADER.size + 8 * count + count * ((width * height + 7) // 8):
+            raise WrongArgumentValuesError(f'Файл "{path}" повреждён')
+    return width, height, seeds.tolist()
+
+
+def load_batch_grid(path: str, index: int) -> Grid:
+    """Загрузить одну сетку из файла с набором сеток.
+
+    Args:
+        path: путь к файлу.
+        index: номер сетки в наборе.
+
+    Returns:
+        Сетку.
+    """
+    width, height, seeds = read_batch(path)
+    if not 0 <= index < len(seeds):
+        raise WrongArgumentValuesError(f'В наборе нет карты с номером {index}')
+    size = width * height
+    stride = (size + 7) // 8
+    with open(path, 'rb') as file:
+        file.seek(BATCH_HEADER.size + 8 * len(seeds) + index * stride)
+        return Grid(width, height, bytearray(unpack(file.read(stride), size)))
@@ -0,0 +1,296 @@
+"""Карта, разбитая на тайлы с ленивой загрузкой с диска."""
+
+from struct import Struct
+from typing import Any, Callable, Dict, Iterable, Iterator, List, MutableSequence, Optional, Tuple
+
+from .cache import LRUCache
+from .exceptions import WrongArgumentValuesError
+from .grid import UNREACHED, Cells, Grid
+from .math_handlers import Point
+from .storage import NO_POINT, TILED_MAGIC, SparseCells, check_rows, pack, read_point, unpack
+
+TILED_HEADER = Struct('<4sIIiiiiI')
+
+
+def dump_tiles(
+    path: str,
+    width: int,
+    height: int,
+    rows: Iterable[bytes],
+    tile_size: int,
+    start: Optional[Point] = None,
+    end: Optional[Point] = None,
+) -> None:
+    """Записать карту в файл, разбив её на тайлы.
+
+    Тайлы записываются по строкам тайлов, каждый тайл упакован по биту на ячейку и дополнен
+    до полного квадрата, поэтому смещение любого тайла в файле вычисляется по его номеру.
+    В памяти одновременно хранится только одна полоса строк высотой в тайл.
+
+    Args:
+        path: путь к файлу.
+        width: количество столбцов сетки.
+        height: количество строк сетки.
+        rows: строки сетки в виде байт, где 1 - проходимая ячейка.
+        tile_size: размер стороны тайла в ячейках.
+        start: начальная точка.
+        end: конечная точка.
+    """
+    if tile_size < 1:
+        raise WrongArgumentValuesError('Значение должно быть больше 0')
+    padding = bytes(-(tile_size * tile_size) % 8)
+    empty = bytes(tile_size)
+    with open(path, 'wb') as file:
+        file.write(TILED_HEADER.pack(TILED_MAGIC, width, height, *(start or NO_POINT), *(end or NO_POINT), tile_size))
+        band: List[bytes] = []
+        for row in check_rows(rows, width, height):
+            band.append(row + bytes(-width % tile_size))
+            if len(band) < tile_size:
+                continue
+            write_band(file.write, band, tile_size, padding)
+            band = []
+        if band:
+            band.extend(empty * (len(band[0]) // tile_size) for _ in range(tile_size - len(band)))
+            write_band(file.write, band, tile_size, padding)
+
+
+def write_band(write: Callable[[bytes], Any], band: List[bytes], tile_size: int, padding: bytes) -> None:
+    """Записать полосу строк высотой в тайл.
+
+    Args:
+        write: функция записи в файл.
+        band: строки полосы, дополненные до целого числа тайлов.
+        tile_size: размер стороны тайла в ячейках.
+        padding: нули, дополняющие тайл до целого числа байт.
+    """
+    for left in range(0, len(band[0]), tile_size):
+        right = left + tile_size
+        write(pack(b''.join(row[left:right] for row in band) + padding))
+
+
+class TiledCells(MutableSequence[int]):
+    """Проходимость ячеек, загружаемая с диска по тайлам.
+
+    Тайл загружается при первом обращении к его ячейке и хранится в ограниченном кэше
+    с вытеснением давно не использованных тайлов. Изменённые тайлы не вытесняются, а хранятся
+    отдельно, поэтому изменения проходимости не теряются, но и не записываются в файл.
+    """
+
+    def __init__(self, path: str, capacity: int) -> None:
+        """Открыть файл с тайлами.
+
+        Args:
+            path: путь к файлу.
+            capacity: наибольшее количество тайлов, одновременно хранимых в памяти.
+        """
+        self.file = open(path, 'rb')
+        header = self.file.read(TILED_HEADER.size)
+        if len(header) != TILED_HEADER.size or header[:4] != TILED_MAGIC:
+            self.file.close()
+            raise WrongArgumentValuesError(f'Файл "{path}" не является файлом карты из тайлов')
+        _, self.width, self.height, start_x, start_y, end_x, end_y, self.tile_size = TILED_HEADER.unpack(header)
+        self.start = read_point(start_x, start_y)
+        self.end = read_point(end_x, end_y)
+        self.size = self.width * self.height
+        self.columns = -(-self.width // self.tile_size)
+        self.rows = -(-self.height // self.tile_size)
+        self.tile_bytes = (self.tile_size * self.tile_size + 7) // 8
+        self.file.seek(0, 2)
+        if self.file.tell() != TILED_HEADER.size + self.columns * self.rows * self.tile_bytes:
+            self.file.close()
+            raise WrongArgumentValuesError(f'Файл "{path}" повреждён')
+        self.tiles: LRUCache[bytearray] = LRUCache(capacity)
+        self.edited: Dict[int, bytearray] = {}
+        self.loads = 0
+
+    def __len__(self) -> int:
+        """Получить количество ячеек.
+
+        Returns:
+            Количество ячеек.
+        """
+        return self.size
+
+    def tile(self, tile: int) -> bytearray:
+        """Получить проходимость ячеек тайла, загрузив его при необходимости.
+
+        Args:
+            tile: номер тайла.
+
+        Returns:
+            Проходимость ячеек тайла по байту на ячейку, построчно.
+        """
+        cells = self.edited.get(tile)
+        if cells is not None:
+            return cells
+        cells = self.tiles.get(tile)
+        if cells is None:
+            self.file.seek(TILED_HEADER.size + tile * self.tile_bytes)
+            cells = bytearray(unpack(self.file.read(self.tile_bytes), self.tile_size * self.tile_size))
+            self.loads += 1
+            self.tiles.put(tile, cells)
+        return cells
+
+    def locate(self, index: int) -> Tuple[int, int]:
+        """Найти тайл ячейки и её номер внутри тайла.
+
+        Args:
+            index: номер ячейки.
+
+        Returns:
+            Номер тайла и номер ячейки в тайле.
+        """
+        size = self.tile_size
+        y, x = divmod(index, self.width)
+        tile_y, inner_y = divmod(y, size)
+        tile_x, inner_x = divmod(x, size)
+        return tile_y * self.columns + tile_x, inner_y * size + inner_x
+
+    def __getitem__(self, index: int) -> int:  # type: ignore[override]
+        """Получить проходимость ячейки.
+
+        Args:
+            index: номер ячейки.
+
+        Returns:
+            1 для проходимой ячейки, иначе 0.
+        """
+        tile, inner = self.locate(index)
+        return self.tile(tile)[inner]
+
+    def __setitem__(self, index: int, value: int) -> None:  # type: ignore[override]
+        """Задать проходимость ячейки.
+
+        Args:
+            index: номер ячейки.
+            value: проходима ли ячейка.
+        """
+        tile, inner = self.locate(index)
+        cells = self.tile(tile)
+        self.tiles.pop(tile)
+        self.edited[tile] = cells
+        cells[inner] = 1 if value else 0
+
+    def __delitem__(self, index: int) -> None:  # type: ignore[override]
+        """Удалить ячейку.
+
+        Args:
+            index: номер ячейки.
+        """
+        raise WrongArgumentValuesError('Количество ячеек сетки не меняется')
+
+    def insert(self, index: int, value: int) -> None:
+        """Вставить ячейку.
+
+        Args:
+            index: номер ячейки.
+            value: проходимость ячейки.
+        """
+        raise WrongArgumentValuesError('Количество ячеек сетки не меняется')
+
+    def close(self) -> None:
+        """Закрыть файл с тайлами."""
+        self.file.close()
+
+    def __enter__(self) -> 'TiledCells':
+        """Использовать ячейки в блоке with.
+
+        Returns:
+            Эти ячейки.
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Закрыть файл с тайлами при выходе из блока with.
+
+        Args:
+            args: сведения об исключении.
+        """
+        self.close()
+
+    def row(self, y: int) -> bytes:
+        """Получить проходимость строки сетки.
+
+        Args:
+            y: номер строки.
+
+        Returns:
+            Строку сетки в виде байт, где 1 - проходимая ячейка.
+        """
+        size = self.tile_size
+        tile_y, inner_y = divmod(y, size)
+        left = inner_y * size
+        right = left + size
+        width = self.width
+        row = b''.join(bytes(self.tile(tile_y * self.columns + tile_x)[left:right]) for tile_x in range(self.columns))
+        return row[:width]
+
+
+class TiledGrid(Grid):
+    """Сетка карты, проходимость которой загружается с диска по тайлам.
+
+    В памяти хранится ограниченное количество тайлов, а расстояния и служебные массивы поиска
+    хранятся в разреженных массивах, поэтому память сетки не зависит от размера карты.
+    Счётчики загрузок, попаданий и вытеснений тайлов помогают подобрать размер тайла.
+    """
+
+    dense = False
+
+    def __init__(self, path: str, capacity: int) -> None:
+        """Открыть карту из тайлов.
+
+        Args:
+            path: путь к файлу.
+            capacity: наибольшее количество тайлов, одновременно хранимых в памяти.
+        """
+        self.cells = TiledCells(path, capacity)
+        self.start = self.cells.start
+        self.end = self.cells.end
+        super().__init__(self.cells.width, self.cells.height, self.cells)
+
+    @property
+    def tiles(self) -> LRUCache[bytearray]:
+        """Получить кэш загруженных тайлов.
+
+        Returns:
+            Кэш тайлов со счётчиками попаданий, промахов и вытеснений.
+        """
+        return self.cells.tiles
+
+    @property
+    def loads(self) -> int:
+        """Получить количество загрузок тайлов с диска.
+
+        Returns:
+            Количество загрузок.
+        """
+        return self.cells.loads
+
+    def rows(self) -> Iterator[bytes]:
+        """Получить проходимость сетки построчно.
+
+        Returns:
+            Строки сетки в виде байт, где 1 - проходимая ячейка.
+        """
+        for y in range(self.height):
+            yield self.cells.row(y)
+
+    def allocate(self) -> Cells:
+        """Создать массив значений для всех ячеек сетки.
+
+        Returns:
+            Разреженный массив со значением UNREACHED по умолчанию.
+        """
+        return SparseCells(self.size, UNREACHED)
+
+    def flags(self) -> Cells:
+        """Создать массив отметок для всех ячеек сетки.
+
+        Returns:
+            Разреженный массив со значением 0 по умолчанию.
+        """
+        return SparseCells(self.size, 0)
+
+    def close(self) -> None:
+        """Закрыть файл с тайлами."""
+        self.cells.close()
@@ -0,0 +1,151 @@
+"""Индекс наименьшего общего предка для идеальных лабиринтов."""
+
+from typing import List
+
+from .exceptions import CalculationFailedError, WrongActionError
+from .grid import UNREACHED, Grid
+from .math_handlers import Point
+
+
+class TreeIndex:
+    """Индекс наименьшего общего предка (LCA) для лабиринта без циклов.
+
+    Идеальный лабиринт является остовным деревом своих ячеек, поэтому между любыми двумя
+    ячейками существует ровно один путь. Дерево подвешивается за корень, и для каждой ячейки
+    хранятся родитель, глубина и указатель прыжка (skew-binary jump pointer). Указатели прыжков
+    дают подъём на заданную глубину и поиск общего предка за O(log n) при O(n) памяти.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        """Построить индекс.
+
+        Args:
+            grid: сетка карты, проходимые ячейки которой образуют лес.
+        """
+        self.grid = grid
+        self.version = grid.version
+        self.parents = grid.allocate()
+        self.depth = grid.allocate()
+        self.jumps = grid.allocate()
+        self.roots = grid.allocate()
+        passable = grid.passable
+        parents = self.parents
+        depth = self.depth
+        jumps = self.jumps
+        roots = self.roots
+        offsets = (1, -1, grid.width, -grid.width)
+        for root in range(grid.size):
+            if not passable[root] or depth[root] != UNREACHED:
+                continue
+            depth[root] = 0
+            jumps[root] = root
+            roots[root] = root
+            points = [root]
+            while points:
+                index = points.pop()
+                parent = parents[index]
+                for offset in offsets:
+                    new_index = index + offset
+                    if not passable[new_index] or new_index == parent:
+                        continue
+                    if depth[new_index] != UNREACHED:
+                        raise CalculationFailedError('Лабиринт содержит циклы')
+                    parents[new_index] = index
+                    depth[new_index] = depth[index] + 1
+                    roots[new_index] = root
+                    jump = jumps[index]
+                    if depth[index] - depth[jump] == depth[jump] - depth[jumps[jump]]:
+                        jumps[new_index] = jumps[jump]
+                    else:
+                        jumps[new_index] = index
+                    points.append(new_index)
+
+    @property
+    def valid(self) -> bool:
+        """Проверить, соответствует ли индекс текущему состоянию карты.
+
+        Returns:
+            Логическое значение, не менялась ли карта после построения индекса.
+        """
+        return self.grid.version == self.version
+
+    def ancestor(self, index: int, depth: int) -> int:
+        """Подняться от ячейки к её предку на заданной глубине.
+
+        Args:
+            index: номер ячейки.
+            depth: глубина искомого предка.
+
+        Returns:
+            Номер ячейки-предка.
+        """
+        while self.depth[index] > depth:
+            jump = self.jumps[index]
+            index = jump if self.depth[jump] >= depth else self.parents[index]
+        return index
+
+    def lowest_common_ancestor(self, first: int, second: int) -> int:
+        """Найти наименьшего общего предка двух ячеек.
+
+        Args:
+            first: номер первой ячейки.
+            second: номер второй ячейки.
+
+        Returns:
+            Номер ячейки - наименьшего общего предка.
+        """
+        if not self.valid:
+            raise WrongActionError('Карта изменилась после построения индекса')
+        if self.depth[first] == UNREACHED or self.depth[second] == UNREACHED:
+            raise CalculationFailedError('Выбрана непроходимая точка')
+        if self.roots[first] != self.roots[second]:
+            raise CalculationFailedError('Не удалось найти путь')
+        depth = min(self.depth[first], self.depth[second])
+        first = self.ancestor(first, depth)
+        second = self.ancestor(second, depth)
+        while first != second:
+            if self.jumps[first] != self.jumps[second]:
+                first = self.jumps[first]
+                second = self.jumps[second]
+            else:
+                first = self.parents[first]
+                second = self.parents[second]
+        return first
+
+    def distance(self, start: int, end: int) -> int:
+        """Получить длину единственного пути между ячейками.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Количество шагов между ячейками.
+        """
+        ancestor = self.lowest_common_ancestor(start, end)
+        return self.depth[start] + self.depth[end] - 2 * self.depth[ancestor]
+
+    def path(self, start: int, end: int) -> List[Point]:
+        """Получить единственный путь между ячейками.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
+        ancestor = self.lowest_common_ancestor(start, end)
+        path = []
+        index = end
+        while index != ancestor:
+            path.append(self.grid.point(index))
+            index = self.parents[index]
+        tail = []
+        index = start
+        while index != ancestor:
+            tail.append(self.grid.point(index))
+            index = self.parents[index]
+        path.append(self.grid.point(ancestor))
+        path.extend(reversed(tail))
+        return path
@@ -0,0 +1,278 @@
+"""Пакетный поиск путей без графического интерфейса."""
+
+from itertools import islice
+from multiprocessing import Pool, cpu_count
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.util import Finalize
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, cast
+
+from .base import Map
+from .base.exceptions import CalculationFailedError, DataNotProvidedError, WrongActionError, WrongArgumentValuesError
+from .base.grid import Cells, Grid
+from .base.math_handlers import Point
+from .base.paths import encode_runs, waypoints
+
+Query = Tuple[Point, Point]
+
+Result = Dict[str, Any]
+
+CHUNK_SIZE = 64
+
+worker_maze: Optional[Map] = None
+
+worker_memory: Optional[SharedMemory] = None
+
+
+def read_queries(lines: Iterable[str], raw: bool = False) -> Iterator[Query]:
+    """Прочитать запросы путей.
+
+    Каждая строка содержит четыре целых числа через пробел: координаты x и y начальной
+    и конечной точек. Пустые строки и строки, начинающиеся с #, пропускаются.
+
+    Args:
+        lines: строки с запросами.
+        raw: координаты заданы в ячейках сетки, а не в клетках лабиринта.
+
+    Returns:
+        Пары начальной и конечной точек в координатах сетки.
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            start_x, start_y, end_x, end_y = (int(value) for value in line.split())
+        except ValueError:
+            raise WrongArgumentValuesError(f'Неверный запрос в строке {number}: "{line}"')
+        start, end = Point(start_x, start_y), Point(end_x, end_y)
+        yield (start, end) if raw else (Map.to_raw(start), Map.to_raw(end))
+
+
+def run_queries(maze: Map, queries: Iterable[Query], path_format: str = '') -> Iterator[Result]:
+    """Выполнить запросы путей по одному, выдавая результаты по мере готовности.
+
+    Ошибка отдельного запроса не прерывает обработку: она записывается в его результат.
+    Путь выводится от начальной точки до конечной: всеми точками (points), только точками
+    поворота (waypoints) или серией направлений (runs) - парами из кода направления
+    в algorythms.base.paths.STEPS и количества шагов.
+
+    Args:
+        maze: карта с загруженным или сгенерированным лабиринтом.
+        queries: пары начальной и конечной точек в координатах сетки.
+        path_format: вид пути в результате, пустая строка - без пути.
+
+    Returns:
+        Результаты запросов со статистикой поиска или текстом ошибки.
+    """
+    grid = maze.data
+    for start, end in queries:
+        result: Result = {'start': [start.x, start.y], 'end': [end.x, end.y]}
+        try:
+            for point in (start, end):
+                if not (0 <= point.x < grid.width and 0 <= point.y < grid.height):
+                    raise WrongArgumentValuesError(f'Точка ({point.x}, {point.y}) за пределами карты')
+            maze.start_point = start
+            maze.end_point = end
+            path, stats = maze.find_path_with_stats()
+        except (CalculationFailedError, DataNotProvidedError, WrongActionError, WrongArgumentValuesError) as ex:
+            result['error'] = str(ex)
+        else:
+            result['length'] = stats.length
+            result['stats'] = stats.as_dict()
+            path.reverse()
+            if path_format == 'points':
+                result['path'] = [[point.x, point.y] for point in path]
+            elif path_format == 'waypoints':
+                result['path'] = [[point.x, point.y] for point in waypoints(path)]
+            elif path_format == 'runs':
+                result['path'] = [list(run) for run in encode_runs(path)]
+        yield result
+
+
+def map_settings(maze: Map) -> Dict[str, Any]:
+    """Получить настройки карты, которые нужно повторить на карте процесса.
+
+    Настройками считаются открытые атрибуты классов карты со значениями bool, int или str,
+    например heuristic, diagonal, bidirectional, vectorized или CLUSTER_SIZE, а также размер
+    кэша путей. Обработчики статистики в процессы не передаются.
+
+    Args:
+        maze: карта.
+
+    Returns:
+        Значения настроек карты по названиям.
+    """
+    names = {
+        name
+        for klass in type(maze).__mro__
+        for name, value in vars(klass).items()
+        if not name.startswith('_') and isinstance(value, (bool, int, str))
+    }
+    settings = {name: getattr(maze, name) for name in names - {'expanded'}}
+    settings['cache_size'] = maze.cache_size
+    return settings
+
+
+def init_worker(
+    engine: Type[Map],
+    settings: Dict[str, Any],
+    indexes: Dict[str, Any],
+    name: str,
+    width: int,
+    height: int,
+    weighted: bool,
+) -> None:
+    """Подготовить карту в процессе-обработчике.
+
+    Проходимость и стоимости ячеек сетки процесса - участки общей памяти, поэтому все процессы
+    читают одну сетку без копирования. Процесс остаётся подключённым к общей памяти до своего
+    завершения.
+
+    Args:
+        engine: класс карты алгоритма.
+        settings: значения настроек карты, полученные map_settings.
+        indexes: описание индексов карты, полученное Map.indexes.
+        name: имя блока общей памяти с проходимостью и стоимостями ячеек.
+        width: количество столбцов сетки.
+        height: количество строк сетки.
+        weighted: в блоке после проходимости записаны стоимости ячеек.
+    """
+    global worker_maze, worker_memory
+    size = width * height
+    total = 2 * size
+    memory = SharedMemory(name=name)
+    grid = Grid(width, height, cast(Cells, memory.buf[:size]))
+    if weighted:
+        grid.set_costs(memory.buf[size:total], copy=False)
+    maze = engine()
+    for setting, value in settings.items():
+        setattr(maze, setting, value)
+    maze.data = grid
+    maze.build_indexes(indexes)
+    worker_maze = maze
+    worker_memory = memory
+    Finalize(None, close_worker, exitpriority=10)
+
+
+def close_worker() -> None:
+    """Освободить карту процесса-обработчика и отключиться от общей памяти."""
+    global worker_maze, worker_memory
+    if worker_maze is not None:
+        grid = worker_maze.data
+        worker_maze = None
+        for cells in (grid.passable, grid.costs):
+            if isinstance(cells, memoryview):
+                cells.release()
+    if worker_memory is not None:
+        worker_memory.close()
+        worker_memory = None
+
+
+def run_chunk(task: Tuple[List[Query], str]) -> Tuple[List[Result], float]:
+    """Выполнить часть запросов в процессе-обработчике.
+
+    Args:
+        task: запросы части и вид пути в результате.
+
+    Returns:
+        Результаты запросов и время их выполнения в секундах.
+    """
+    queries, path_format = task
+    if worker_maze is None:
+        raise DataNotProvidedError('Карта процесса не подготовлена')
+    started = perf_counter()
+    results = list(run_queries(worker_maze, queries, path_format))
+    return results, perf_counter() - started
+
+
+def share_grid(grid: Grid) -> SharedMemory:
+    """Скопировать проходимость и стоимости ячеек сетки в общую память.
+
+    Args:
+        grid: сетка.
+
+    Returns:
+        Блок общей памяти, который нужно освободить после использования.
+    """
+    size = grid.size
+    total = size if grid.costs is None else 2 * size
+    memory = SharedMemory(create=True, size=max(1, total))
+    offset = 0
+    for row in grid.rows():
+        end = offset + len(row)
+        memory.buf[offset:end] = row
+        offset = end
+    if grid.costs is not None:
+        memory.buf[size:total] = bytes(grid.costs)
+    return memory
+
+
+def find_paths(
+    maze: Map,
+    queries: Iterable[Query],
+    path_format: str = '',
+    processes: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    on_chunk: Optional[Callable[[int, float], None]] = None,
+) -> Iterator[Result]:
+    """Выполнить запросы путей пулом процессов, выдавая результаты в порядке запросов.
+
+    Сетка передаётся процессам один раз через общую память, запросы делятся на части
+    по chunk_size, и каждая часть выполняется на карте процесса с теми же настройками
+    и индексами, поэтому карта maze не изменяется. Результаты совпадают с результатами run_queries. С одним процессом
+    запросы выполняются на карте maze по одному, и каждый результат выдаётся сразу.
+
+    Args:
+        maze: карта с загруженным или сгенерированным лабиринтом.
+        queries: пары начальной и конечной точек в координатах сетки.
+        path_format: вид пути в результате, пустая строка - без пути.
+        processes: количество процессов, по умолчанию по количеству ядер, 1 - без пула процессов.
+        chunk_size: количество запросов в одной части.
+        on_chunk: обработчик готовой части, получает количество запросов и время их выполнения.
+
+    Returns:
+        Результаты запросов со статистикой поиска или текстом ошибки.
+    """
+    if chunk_size < 1:
+        raise WrongArgumentValuesError('Значение должно быть больше 0')
+    if not hasattr(maze, 'data'):
+        raise DataNotProvidedError('Карта ещё не сгенерирована')
+    workers = processes or cpu_count()
+    if workers == 1:
+        count = 0
+        started = perf_counter()
+        for result in run_queries(maze, queries, path_format):
+            yield result
+            count += 1
+            if on_chunk is not None and count == chunk_size:
+                on_chunk(count, perf_counter() - started)
+                count = 0
+                started = perf_counter()
+        if on_chunk is not None and count:
+            on_chunk(count, perf_counter() - started)
+        return
+    pending = iter(queries)
+    tasks = iter(lambda: (list(islice(pending, chunk_size)), path_format), ([], path_format))
+    grid = maze.data
+    memory = share_grid(grid)
+    try:
+        arguments = (
+            type(maze),
+            map_settings(maze),
+            maze.indexes(),
+            memory.name,
+            grid.width,
+            grid.height,
+            grid.costs is not None,
+        )
+        with Pool(workers, init_worker, arguments) as pool:
+            for results, elapsed in pool.imap(run_chunk, tasks):
+                if on_chunk is not None:
+                    on_chunk(len(results), elapsed)
+                yield from results
+            pool.close()
+            pool.join()
+    finally:
+        memory.close()
+        memory.unlink()
@@ -0,0 +1,293 @@
+"""Замеры производительности генерации лабиринтов и поиска пути."""
+
+import json
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type
+
+from .base import Map
+from .base.generators import GENERATORS
+from .base.grid import Grid
+from .base.math_handlers import Point
+from .base.moves import default_heuristic
+from .engines import ENGINES
+
+SIZES = (25, 50, 100)
+
+SEEDS = (0, 1, 2)
+
+INDEXES = ('tree', 'junctions')
+
+Run = Dict[str, Any]
+
+
+def measure(action: Callable[[], Any], repeat: int) -> Tuple[float, int, Any]:
+    """Замерить время и пиковую память действия.
+
+    Время - лучшее из repeat запусков без трассировки памяти, пиковая память замеряется
+    отдельным запуском под tracemalloc, чтобы трассировка не искажала время.
+
+    Args:
+        action: замеряемое действие.
+        repeat: количество запусков для замера времени.
+
+    Returns:
+        Время в секундах, пиковую память в байтах и результат последнего запуска.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        started = perf_counter()
+        action()
+        best = min(best, perf_counter() - started)
+    tracemalloc.start()
+    try:
+        result = action()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak, result
+
+
+def prepare(
+    engine: Type[Map],
+    grid: Grid,
+    start: Point,
+    end: Point,
+    heuristic: str = Map.heuristic,
+    diagonal: str = Map.diagonal,
+) -> Map:
+    """Создать карту алгоритма поверх готовой сетки.
+
+    Args:
+        engine: класс карты алгоритма.
+        grid: сетка с лабиринтом.
+        start: начальная точка.
+        end: конечная точка.
+        heuristic: название эвристики.
+        diagonal: правило диагональных ходов.
+
+    Returns:
+        Карту без кэша путей.
+    """
+    maze = engine()
+    maze.heuristic = heuristic
+    maze.diagonal = diagonal
+    maze.cache_size = 0
+    maze.data = grid
+    maze.start_point = start
+    maze.end_point = end
+    return maze
+
+
+def run(
+    sizes: Iterable[int] = SIZES,
+    seeds: Iterable[int] = SEEDS,
+    engines: Iterable[str] = tuple(ENGINES),
+    generator: str = 'backtracker',
+    repeat: int = 3,
+    heuristic: str = Map.heuristic,
+    diagonal: str = Map.diagonal,
+    indexes: Iterable[str] = (),
+) -> List[Run]:
+    """Провести замеры.
+
+    Для каждого размера и зерна замеряется генерация лабиринта и поиск пути между
+    противоположными углами каждым алгоритмом. Каждый поиск выполняется новой картой,
+    поэтому кэши и сохранённое состояние алгоритмов не влияют на результат. Эвристика
+    и правило диагональных ходов, отличные от стандартных, добавляются к названию замера,
+    чтобы количество раскрытых вершин можно было сравнить между запусками.
+
+    Для каждого индекса из indexes отдельно замеряется его построение, а затем поиск
+    каждым алгоритмом по заранее построенному индексу; название такого замера
+    дополняется названием индекса, например search/astar+junctions.
+
+    Args:
+        sizes: размеры стороны лабиринта в клетках.
+        seeds: зёрна генератора.
+        engines: названия алгоритмов из ENGINES.
+        generator: название генератора из GENERATORS.
+        repeat: количество запусков для замера времени.
+        heuristic: название эвристики.
+        diagonal: правило диагональных ходов.
+        indexes: названия индексов из INDEXES.
+
+    Returns:
+        Список замеров.
+    """
+    runs: List[Run] = []
+    variant = ''
+    heuristic = heuristic or default_heuristic(diagonal)
+    if (heuristic, diagonal) != (default_heuristic(Map.diagonal), Map.diagonal):
+        variant = f'[{heuristic},{diagonal or "straight"}]'
+
+    for size in sizes:
+        for seed in seeds:
+            elapsed, peak, grid = measure(lambda: GENERATORS[generator](seed).generate(size, size), repeat)
+            runs.append(
+                {
+                    'name': f'generate/{generator}',
+                    'size': size,
+                    'seed': seed,
+                    'time': elapsed,
+                    'peak': peak,
+                    'expanded': 0,
+                    'pushed': 0,
+                    'frontier': 0,
+                },
+            )
+            start = Map.to_raw(Point(0, 0))
+            end = Map.to_raw(Point(size - 1, size - 1))
+            for name in engines:
+                engine = ENGINES[name]
+
+                def search() -> Map:
+                    maze = prepare(engine, grid, start, end, heuristic, diagonal)
+                    maze.find_path()
+                    return maze
+
+                elapsed, peak, maze = measure(search, repeat)
+                runs.append(
+                    {
+                        'name': f'search/{name}{variant}',
+                        'size': size,
+                        'seed': seed,
+                        'time': elapsed,
+                        'peak': peak,
+                        'expanded': maze.stats.expanded,
+                        'pushed': maze.stats.pushed,
+                        'frontier': maze.stats.frontier,
+                    },
+                )
+            for source in indexes:
+                elapsed, peak, _ = measure(
+                    lambda: prepare(Map, grid, start, end, heuristic, diagonal).build_indexes({source: True}),
+                    repeat,
+                )
+                runs.append(
+                    {
+                        'name': f'index/{source}',
+                        'size': size,
+                        'seed': seed,
+                        'time': elapsed,
+                        'peak': peak,
+                        'expanded': 0,
+                        'pushed': 0,
+                        'frontier': 0,
+                    },
+                )
+                for name in engines:
+                    indexed = prepare(ENGINES[name], grid, start, end, heuristic, diagonal)
+                    indexed.build_indexes({source: True})
+                    if indexed.index_source() != source:
+                        continue
+
+                    def search_index() -> Map:
+                        indexed.find_path()
+                        return indexed
+
+                    elapsed, peak, maze = measure(search_index, repeat)
+                    runs.append(
+                        {
+                            'name': f'search/{name}{variant}+{source}',
+                            'size': size,
+                            'seed': seed,
+                            'time': elapsed,
+                            'peak': peak,
+                            'expanded': maze.stats.expanded,
+                            'pushed': maze.stats.pushed,
+                            'frontier': maze.stats.frontier,
+                        },
+                    )
+    return runs
+
+
+def speedups(runs: List[Run]) -> List[str]:
+    """Сравнить поиск по индексам с поиском по ячейкам в тех же замерах.
+
+    Args:
+        runs: замеры, в том числе поиска по индексам.
+
+    Returns:
+        Описания ускорения по времени и количеству раскрытых вершин для каждого замера по индексу.
+    """
+    reference = {key(item): item for item in runs}
+    result = []
+    for item in runs:
+        name, size, seed = key(item)
+        if not name.startswith('search/') or '+' not in name:
+            continue
+        base = reference.get((name.rsplit('+', 1)[0], size, seed))
+        if base is None:
+            continue
+        ratio = base['time'] / item['time'] if item['time'] else float('inf')
+        result.append(
+            f'{name} size={size} seed={seed}: время x{ratio:.1f}, '
+            f'раскрыто {base["expanded"]} -> {item["expanded"]}',
+        )
+    return result
+
+
+def key(item: Run) -> Tuple[str, int, int]:
+    """Получить ключ замера для сравнения с эталоном.
+
+    Args:
+        item: замер.
+
+    Returns:
+        Название, размер и зерно замера.
+    """
+    return item['name'], item['size'], item['seed']
+
+
+def compare(runs: List[Run], baseline: List[Run], threshold: float) -> List[str]:
+    """Сравнить замеры с эталонными.
+
+    Время и пиковая память считаются ухудшившимися, если превышают эталон больше чем
+    на долю threshold, количество раскрытых вершин - при любом увеличении, так как оно
+    не зависит от машины.
+
+    Args:
+        runs: новые замеры.
+        baseline: эталонные замеры.
+        threshold: допустимая доля ухудшения.
+
+    Returns:
+        Описания ухудшений, пустой список, если их нет.
+    """
+    reference = {key(item): item for item in baseline}
+    regressions = []
+    for item in runs:
+        base = reference.get(key(item))
+        if base is None:
+            continue
+        name = '{} size={} seed={}'.format(*key(item))
+        for metric in ('time', 'peak'):
+            if base[metric] and item[metric] > base[metric] * (1 + threshold):
+                regressions.append(f'{name}: {metric} {base[metric]:.6g} -> {item[metric]:.6g}')
+        if item['expanded'] > base['expanded']:
+            regressions.append(f'{name}: expanded {base["expanded"]} -> {item["expanded"]}')
+    return regressions
+
+
+def save(runs: List[Run], path: str) -> None:
+    """Сохранить замеры в файл JSON.
+
+    Args:
+        runs: замеры.
+        path: путь к файлу.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({'runs': runs}, file, indent=2)
+
+
+def load(path: str) -> List[Run]:
+    """Загрузить замеры из файла JSON.
+
+    Args:
+        path: путь к файлу.
+
+    Returns:
+        Замеры.
+    """
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)['runs']
@@ -0,0 +1,23 @@
+"""Алгоритм Дейкстры с очередью из корзин (алгоритм Дайала) для карт со стоимостями."""
+
+from typing import Any
+
+from .map import DialMap
+
+__all__ = ('DialMap', 'DialGraphic')
+
+
+def __getattr__(name: str) -> Any:
+    """Загрузить класс визуализации при первом обращении к нему.
+
+    Args:
+        name: имя атрибута пакета.
+
+    Returns:
+        Класс визуализации.
+    """
+    if name == 'DialGraphic':
+        from .graphics import DialGraphic
+
+        return DialGraphic
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,10 @@
+"""Обработка визуального отображения алгоритма Дайала."""
+
+from ..base import Graphic
+from .map import DialMap
+
+
+class DialGraphic(Graphic[DialMap]):
+    """Обработчик визуального отображения алгоритма Дайала."""
+
+    MAP_TYPE = DialMap
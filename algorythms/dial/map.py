@@ -0,0 +1,112 @@
+"""Обработка карты с алгоритмом Дайала."""
+
+from typing import Iterator, List
+
+from ..base import Map
+from ..base.exceptions import CalculationFailedError
+from ..base.grid import UNREACHED
+from ..base.math_handlers import Point
+from ..base.stats import SearchStep
+
+
+class DialMap(Map):
+    """Карта алгоритма Дайала, учитывающего стоимости входа в ячейки."""
+
+    def search(self, start: int, end: int) -> List[Point]:
+        """Найти путь наименьшей стоимости между ячейками.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
+        path: List[Point] = []
+        for step in self.steps(start, end, 0):
+            path = step.path or path
+        return path
+
+    def steps(self, start: int, end: int, batch: int) -> Iterator[SearchStep]:
+        """Найти путь наименьшей стоимости между ячейками пошагово.
+
+        Очередь с приоритетом заменена кольцом из max_cost + 1 корзин: ячейка с расстоянием d
+        лежит в корзине d % (max_cost + 1), а корзины просматриваются по возрастанию расстояния.
+        Все расстояния в очереди отличаются от текущего не больше чем на max_cost, поэтому
+        добавление стоит O(1), а весь поиск - O(n + C), где C - стоимость пути. Устаревшие
+        записи, расстояние которых уменьшилось после добавления, пропускаются при извлечении.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+            batch: количество раскрытых ячеек в порции, 0 - только последняя порция.
+
+        Returns:
+            Порции хода поиска, последняя содержит путь.
+        """
+        grid = self.data
+        passable = grid.passable
+        distance = grid.distance
+        offsets = grid.offsets
+        costs = grid.costs
+        parents = grid.allocate()
+        closed = grid.flags()
+        stats = self.stats
+        on_expand = stats.on_expand
+        on_push = stats.on_push
+        buckets: List[List[int]] = [[] for _ in range(grid.max_cost + 1)]
+        size = len(buckets)
+        distance[start] = 0
+        buckets[0].append(start)
+        queued = 1
+        current = 0
+        path_found = False
+        visited: List[int] = []
+        added: List[int] = []
+        self.expanded = 0
+        pushed = frontier = 0
+        while queued:
+            bucket = buckets[current % size]
+            if not bucket:
+                current += 1
+                continue
+            if queued > frontier:
+                frontier = queued
+            index = bucket.pop()
+            queued -= 1
+            if closed[index] or distance[index] != current:
+                continue
+            if index == end:
+                path_found = True
+                break
+            closed[index] = 1
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(index)
+            if batch:
+                visited.append(index)
+                if len(visited) >= batch:
+                    yield SearchStep(visited, added, index)
+                    visited = []
+                    added = []
+            for offset in offsets:
+                new_index = index + offset
+                if not passable[new_index] or closed[new_index]:
+                    continue
+                new_distance = current + (1 if costs is None else costs[new_index])
+                if distance[new_index] == UNREACHED or new_distance < distance[new_index]:
+                    distance[new_index] = new_distance
+                    parents[new_index] = index
+                    buckets[new_distance % size].append(new_index)
+                    queued += 1
+                    pushed += 1
+                    if batch:
+                        added.append(new_index)
+                    if on_push is not None:
+                        on_push(new_index)
+        stats.pushed = pushed
+        stats.frontier = frontier
+        if not path_found:
+            raise CalculationFailedError('Не удалось найти путь')
+        stats.backtrack()
+        yield SearchStep(visited, added, end, grid.trace(parents, end))
@@ -0,0 +1,24 @@
+"""Инкрементальный алгоритм D* Lite поиска пути в лабиринте."""
+
+from typing import Any
+
+from .map import DStarLiteMap
+from .planner import DStarLite
+
+__all__ = ('DStarLiteMap', 'DStarLiteGraphic', 'DStarLite')
+
+
+def __getattr__(name: str) -> Any:
+    """Загрузить класс визуализации при первом обращении к нему.
+
+    Args:
+        name: имя атрибута пакета.
+
+    Returns:
+        Класс визуализации.
+    """
+    if name == 'DStarLiteGraphic':
+        from .graphics import DStarLiteGraphic
+
+        return DStarLiteGraphic
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,10 @@
+"""Обработка визуального отображения метода D* Lite."""
+
+from ..base import Graphic
+from .map import DStarLiteMap
+
+
+class DStarLiteGraphic(Graphic[DStarLiteMap]):
+    """Обработчик визуального отображения метода D* Lite."""
+
+    MAP_TYPE = DStarLiteMap
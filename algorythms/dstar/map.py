@@ -0,0 +1,45 @@
+"""Обработка карты c инкрементальным алгоритмом D* Lite."""
+
+from typing import List
+
+from ..base import Map
+from ..base.exceptions import CalculationFailedError
+from ..base.math_handlers import Point
+from .planner import DStarLite
+
+
+class DStarLiteMap(Map):
+    """Карта метода D* Lite, содержащая проходимые и непроходимые точки.
+
+    Состояние поиска сохраняется между запросами с той же конечной точкой. Перемещение
+    начальной точки и изменение проходимости ячеек исправляют только затронутую часть
+    рассчитанных расстояний, поэтому небольшие изменения пересчитываются быстрее полного поиска.
+    """
+
+    WEIGHTED = False
+    _planner: DStarLite
+
+    def search(self, start: int, end: int) -> List[Point]:
+        """Найти путь между ячейками.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
+        if not hasattr(self, '_planner') or self._planner.grid is not self.data or self._planner.end != end:
+            self._planner = DStarLite(self.data, start, end, self.stats)
+        self._planner.stats = self.stats
+        if self._planner.start != start:
+            self._planner.move(start)
+        self._planner.sync()
+        self._planner.compute()
+        self.expanded = self._planner.expanded
+        self.stats.backtrack()
+        path = self._planner.path()
+        if not path:
+            raise CalculationFailedError('Не удалось найти путь')
+        path.reverse()
+        return [self.data.point(index) for index in path]
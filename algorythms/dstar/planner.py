@@ -0,0 +1,219 @@
+"""Инкрементальный планировщик D* Lite."""
+
+from heapq import heappop, heappush
+from typing import Dict, List, Optional, Tuple
+
+from ..base.grid import Grid
+from ..base.stats import SearchStats
+
+INFINITY = float('inf')
+Key = Tuple[float, float]
+
+
+class DStarLite:
+    """Планировщик D* Lite на сетке карты.
+
+    Поиск ведётся от конечной ячейки к начальной, поэтому при перемещении начальной точки
+    и при изменении проходимости ячеек состояние поиска не сбрасывается: исправляются
+    только значения вершин, которых коснулось изменение.
+    """
+
+    def __init__(self, grid: Grid, start: int, end: int, stats: Optional[SearchStats] = None) -> None:
+        """Инициализировать планировщик.
+
+        Args:
+            grid: сетка карты.
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+            stats: статистика поиска.
+        """
+        self.grid = grid
+        self.end = end
+        self.start = start
+        self.version = grid.version
+        grid.subscribe(self)
+        self.g: Dict[int, float] = {}
+        self.rhs: Dict[int, float] = {}
+        self.keys: Dict[int, Key] = {}
+        self.queue: List[Tuple[Key, int]] = []
+        self.stats = stats or SearchStats()
+        self.reset()
+        self.expanded = 0
+
+    def reset(self) -> None:
+        """Сбросить рассчитанные расстояния и начать поиск от конечной ячейки заново."""
+        self.km = 0
+        self.g.clear()
+        self.rhs.clear()
+        self.rhs[self.end] = 0
+        self.keys.clear()
+        self.queue.clear()
+        self.push(self.end)
+
+    def heuristic(self, index: int) -> int:
+        """Рассчитать манхэттенское расстояние от начальной ячейки.
+
+        Args:
+            index: номер ячейки.
+
+        Returns:
+            Расстояние от ячейки до начальной ячейки.
+        """
+        self.stats.heuristic += 1
+        y, x = divmod(index, self.grid.width)
+        start_y, start_x = divmod(self.start, self.grid.width)
+        return abs(start_x - x) + abs(start_y - y)
+
+    def neighbours(self, index: int) -> List[int]:
+        """Получить соседние ячейки, лежащие внутри сетки.
+
+        Изменённая ячейка может лежать на краю сетки, поэтому соседи за пределами сетки
+        и ячейки с другой стороны строки пропускаются.
+
+        Args:
+            index: номер ячейки.
+
+        Returns:
+            Номера соседних ячеек.
+        """
+        width = self.grid.width
+        column = index % width
+        neighbours = []
+        if column + 1 < width:
+            neighbours.append(index + 1)
+        if column > 0:
+            neighbours.append(index - 1)
+        if index + width < self.grid.size:
+            neighbours.append(index + width)
+        if index >= width:
+            neighbours.append(index - width)
+        return neighbours
+
+    def key(self, index: int) -> Key:
+        """Рассчитать ключ приоритета ячейки.
+
+        Args:
+            index: номер ячейки.
+
+        Returns:
+            Пару значений, по которой упорядочена очередь.
+        """
+        value = min(self.g.get(index, INFINITY), self.rhs.get(index, INFINITY))
+        return value + self.heuristic(index) + self.km, value
+
+    def push(self, index: int) -> None:
+        """Поместить ячейку в очередь с актуальным ключом.
+
+        Args:
+            index: номер ячейки.
+        """
+        key = self.key(index)
+        self.keys[index] = key
+        heappush(self.queue, (key, index))
+        self.stats.pushed += 1
+        if self.stats.on_push is not None:
+            self.stats.on_push(index)
+
+    def update(self, index: int) -> None:
+        """Пересчитать значение rhs ячейки и её положение в очереди.
+
+        Args:
+            index: номер ячейки.
+        """
+        passable = self.grid.passable
+        if index != self.end:
+            if passable[index]:
+                neighbours = self.neighbours(index)
+                self.rhs[index] = min(
+                    (self.g.get(neighbour, INFINITY) + 1 for neighbour in neighbours if passable[neighbour]),
+                    default=INFINITY,
+                )
+            else:
+                self.rhs[index] = INFINITY
+        self.keys.pop(index, None)
+        if self.g.get(index, INFINITY) != self.rhs.get(index, INFINITY):
+            self.push(index)
+
+    def move(self, start: int) -> None:
+        """Переместить начальную ячейку.
+
+        Args:
+            start: номер новой начальной ячейки.
+        """
+        self.km += self.heuristic(start)
+        self.start = start
+
+    def sync(self) -> None:
+        """Учесть ячейки, проходимость которых изменилась после прошлого поиска."""
+        if self.version == self.grid.version:
+            return
+        changes = self.grid.read_changes(self)
+        self.version = self.grid.version
+        if changes is None:
+            self.reset()
+            return
+        for index in set(changes):
+            self.update(index)
+            for neighbour in self.neighbours(index):
+                self.update(neighbour)
+
+    def compute(self) -> None:
+        """Пересчитать кратчайшие расстояния до начальной ячейки.
+
+        Счётчики и обработчики поиска берутся из статистики self.stats.
+        """
+        passable = self.grid.passable
+        g = self.g
+        rhs = self.rhs
+        stats = self.stats
+        on_expand = stats.on_expand
+        self.expanded = 0
+        while self.queue:
+            stats.frontier = max(stats.frontier, len(self.queue))
+            key, index = self.queue[0]
+            start_key = self.key(self.start)
+            if key >= start_key and rhs.get(self.start, INFINITY) == g.get(self.start, INFINITY):
+                break
+            heappop(self.queue)
+            if self.keys.get(index) != key:
+                continue
+            del self.keys[index]
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(index)
+            new_key = self.key(index)
+            if key < new_key:
+                self.push(index)
+            elif g.get(index, INFINITY) > rhs.get(index, INFINITY):
+                g[index] = rhs[index]
+                for neighbour in self.neighbours(index):
+                    if passable[neighbour]:
+                        self.update(neighbour)
+            else:
+                g[index] = INFINITY
+                self.update(index)
+                for neighbour in self.neighbours(index):
+                    if passable[neighbour]:
+                        self.update(neighbour)
+
+    def path(self) -> List[int]:
+        """Получить путь по рассчитанным расстояниям.
+
+        Returns:
+            Номера ячеек от начальной до конечной или пустой список, если путь не найден.
+        """
+        g = self.g
+        passable = self.grid.passable
+        index = self.start
+        if g.get(index, INFINITY) == INFINITY:
+            return []
+        path = [index]
+        while index != self.end:
+            index = min(
+                (neighbour for neighbour in self.neighbours(index) if passable[neighbour]),
+                key=lambda neighbour: g.get(neighbour, INFINITY),
+            )
+            if g.get(index, INFINITY) == INFINITY or len(path) > self.grid.size:
+                return []
+            path.append(index)
+        return path
@@ -0,0 +1,20 @@
+"""Алгоритмы поиска пути, доступные по названию."""
+
+from typing import Dict, Type
+
+from .a_star import AStarMap
+from .base import Map
+from .dial import DialMap
+from .dstar import DStarLiteMap
+from .hpa import HPAMap
+from .jps import JPSMap
+from .wave import WaveMap
+
+ENGINES: Dict[str, Type[Map]] = {
+    'wave': WaveMap,
+    'astar': AStarMap,
+    'jps': JPSMap,
+    'hpa': HPAMap,
+    'dstar': DStarLiteMap,
+    'dial': DialMap,
+}
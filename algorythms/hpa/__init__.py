@@ -0,0 +1,24 @@
+"""Иерархический алгоритм HPA* поиска пути в лабиринте."""
+
+from typing import Any
+
+from .clusters import ClusterGraph
+from .map import HPAMap
+
+__all__ = ('HPAMap', 'HPAGraphic', 'ClusterGraph')
+
+
+def __getattr__(name: str) -> Any:
+    """Загрузить класс визуализации при первом обращении к нему.
+
+    Args:
+        name: имя атрибута пакета.
+
+    Returns:
+        Класс визуализации.
+    """
+    if name == 'HPAGraphic':
+        from .graphics import HPAGraphic
+
+        return HPAGraphic
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,196 @@
+"""Абстракция карты из кластеров для иерархического поиска."""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..base.grid import Grid
+
+Border = Tuple[int, int]
+
+
+class ClusterGraph:
+    """Абстрактный граф кластеров карты.
+
+    Сетка делится на квадратные кластеры. На каждой общей границе соседних кластеров
+    выбираются входы: пары проходимых ячеек по обе стороны границы. Входы образуют вершины
+    графа, пары входов соединяются рёбрами веса 1, а входы одного кластера - рёбрами
+    с расстоянием внутри кластера. При изменении ячеек перестраиваются только затронутые
+    кластеры.
+    """
+
+    def __init__(self, grid: Grid, size: int) -> None:
+        """Построить абстрактный граф.
+
+        Args:
+            grid: сетка карты.
+            size: размер стороны кластера в ячейках.
+        """
+        self.grid = grid
+        self.size = size
+        self.columns = -(-grid.width // size)
+        self.rows = -(-grid.height // size)
+        self.edges: Dict[int, Dict[int, int]] = {}
+        self.nodes: Dict[int, Set[int]] = {cluster: set() for cluster in range(self.columns * self.rows)}
+        self.transitions: Dict[Border, List[Tuple[int, int]]] = {}
+        self.version = grid.version
+        grid.subscribe(self)
+        self.rebuild(self.nodes)
+
+    def cluster(self, index: int) -> int:
+        """Получить номер кластера ячейки.
+
+        Args:
+            index: номер ячейки.
+
+        Returns:
+            Номер кластера.
+        """
+        y, x = divmod(index, self.grid.width)
+        return y // self.size * self.columns + x // self.size
+
+    def bounds(self, cluster: int) -> Tuple[int, int, int, int]:
+        """Получить границы кластера.
+
+        Args:
+            cluster: номер кластера.
+
+        Returns:
+            Координаты x0, y0, x1, y1, правая и нижняя границы не включаются.
+        """
+        row, column = divmod(cluster, self.columns)
+        x0 = column * self.size
+        y0 = row * self.size
+        return x0, y0, min(x0 + self.size, self.grid.width), min(y0 + self.size, self.grid.height)
+
+    def neighbours(self, cluster: int) -> List[int]:
+        """Получить соседние кластеры.
+
+        Args:
+            cluster: номер кластера.
+
+        Returns:
+            Номера кластеров, имеющих с заданным общую границу.
+        """
+        row, column = divmod(cluster, self.columns)
+        result = []
+        if column > 0:
+            result.append(cluster - 1)
+        if column < self.columns - 1:
+            result.append(cluster + 1)
+        if row > 0:
+            result.append(cluster - self.columns)
+        if row < self.rows - 1:
+            result.append(cluster + self.columns)
+        return result
+
+    def sync(self) -> None:
+        """Обновить граф после изменения проходимости ячеек сетки."""
+        if self.version == self.grid.version:
+            return
+        changes = self.grid.read_changes(self)
+        self.version = self.grid.version
+        self.rebuild(self.nodes if changes is None else {self.cluster(index) for index in changes})
+
+    def rebuild(self, clusters: Iterable[int]) -> None:
+        """Перестроить входы и внутренние рёбра заданных кластеров.
+
+        Args:
+            clusters: номера изменившихся кластеров.
+        """
+        changed = set(clusters)
+        borders = {
+            (min(cluster, other), max(cluster, other)) for cluster in changed for other in self.neighbours(cluster)
+        }
+        affected = changed | {cluster for border in borders for cluster in border}
+        for border in borders:
+            for first, second in self.transitions.pop(border, []):
+                self.edges[first].pop(second, None)
+                self.edges[second].pop(first, None)
+        for border in borders:
+            self.transitions[border] = self.find_transitions(border)
+        for cluster in affected:
+            nodes: Set[int] = set()
+            for other in self.neighbours(cluster):
+                for pair in self.transitions.get((min(cluster, other), max(cluster, other)), []):
+                    nodes.update(index for index in pair if self.cluster(index) == cluster)
+            for node in self.nodes[cluster]:
+                for other_node in list(self.edges[node]):
+                    if self.cluster(other_node) == cluster:
+                        del self.edges[node][other_node]
+                if node not in nodes:
+                    del self.edges[node]
+            for node in nodes:
+                self.edges.setdefault(node, {})
+            self.nodes[cluster] = nodes
+        for border in borders:
+            for first, second in self.transitions[border]:
+                self.edges[first][second] = 1
+                self.edges[second][first] = 1
+        for cluster in affected:
+            for node in self.nodes[cluster]:
+                distance, _ = self.explore(node)
+                for other_node in self.nodes[cluster]:
+                    if other_node != node and other_node in distance:
+                        self.edges[node][other_node] = distance[other_node]
+
+    def find_transitions(self, border: Border) -> List[Tuple[int, int]]:
+        """Найти входы на общей границе двух кластеров.
+
+        На каждом непрерывном проходимом участке границы короче 6 ячеек выбирается вход
+        посередине, на более длинных - по входу на каждом краю.
+
+        Args:
+            border: номера двух соседних кластеров, меньший первым.
+
+        Returns:
+            Список пар ячеек по обе стороны границы.
+        """
+        first, second = border
+        x0, y0, x1, y1 = self.bounds(first)
+        width = self.grid.width
+        passable = self.grid.passable
+        if first // self.columns == second // self.columns:
+            pairs = [(y * width + x1 - 1, y * width + x1) for y in range(y0, y1)]
+        else:
+            pairs = [((y1 - 1) * width + x, y1 * width + x) for x in range(x0, x1)]
+        transitions: List[Tuple[int, int]] = []
+        run: List[Tuple[int, int]] = []
+        for pair in pairs + [(-1, -1)]:
+            if pair[0] >= 0 and passable[pair[0]] and passable[pair[1]]:
+                run.append(pair)
+                continue
+            if len(run) >= 6:
+                transitions.extend((run[0], run[-1]))
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+        return transitions
+
+    def explore(self, start: int, end: Optional[int] = None) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """Распространить волну от ячейки внутри её кластера.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер ячейки, при достижении которой волна останавливается.
+
+        Returns:
+            Расстояния до достигнутых ячеек и их родительские ячейки.
+        """
+        x0, y0, x1, y1 = self.bounds(self.cluster(start))
+        width = self.grid.width
+        passable = self.grid.passable
+        distance = {start: 0}
+        parents: Dict[int, int] = {}
+        points = [start]
+        while points and end not in distance:
+            new_points = []
+            for index in points:
+                for new_index in (index + 1, index - 1, index + width, index - width):
+                    if new_index in distance or not passable[new_index]:
+                        continue
+                    y, x = divmod(new_index, width)
+                    if x0 <= x < x1 and y0 <= y < y1:
+                        distance[new_index] = distance[index] + 1
+                        parents[new_index] = index
+                        new_points.append(new_index)
+            points = new_points
+        return distance, parents
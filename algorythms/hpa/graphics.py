@@ -0,0 +1,10 @@
+"""Обработка визуального отображения метода HPA*."""
+
+from ..base import Graphic
+from .map import HPAMap
+
+
+class HPAGraphic(Graphic[HPAMap]):
+    """Обработчик визуального отображения метода HPA*."""
+
+    MAP_TYPE = HPAMap
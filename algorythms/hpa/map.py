@@ -0,0 +1,118 @@
+"""Обработка карты c иерархическим алгоритмом HPA*."""
+
+from heapq import heappop, heappush
+from typing import Dict, List, Set, Tuple
+
+from ..base import Map
+from ..base.exceptions import CalculationFailedError
+from ..base.math_handlers import Point
+from .clusters import ClusterGraph
+
+
+class HPAMap(Map):
+    """Карта иерархического метода HPA*, содержащая проходимые и непроходимые точки.
+
+    Поиск сначала ведётся по абстрактному графу входов в кластеры, затем найденный
+    абстрактный путь уточняется волной только внутри выбранных кластеров. Путь получается
+    близким к кратчайшему, но не обязательно кратчайшим.
+    """
+
+    WEIGHTED = False
+    CLUSTER_SIZE = 16
+    _clusters: ClusterGraph
+
+    @property
+    def clusters(self) -> ClusterGraph:
+        """Получить абстрактный граф кластеров, актуальный для текущей карты.
+
+        Returns:
+            Абстрактный граф кластеров.
+        """
+        if not hasattr(self, '_clusters') or self._clusters.grid is not self.data:
+            self._clusters = ClusterGraph(self.data, self.CLUSTER_SIZE)
+        else:
+            self._clusters.sync()
+        return self._clusters
+
+    def search(self, start: int, end: int) -> List[Point]:
+        """Найти путь между ячейками.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
+        clusters = self.clusters
+        width = self.data.width
+        end_y, end_x = divmod(end, width)
+        start_distance, _ = clusters.explore(start)
+        end_distance, _ = clusters.explore(end)
+        start_links = {
+            node: start_distance[node] for node in clusters.nodes[clusters.cluster(start)] if node in start_distance
+        }
+        end_links = {node: end_distance[node] for node in clusters.nodes[clusters.cluster(end)] if node in end_distance}
+        best = start_distance.get(end, -1)
+        route = [start, end]
+        distance = {start: 0}
+        parents: Dict[int, int] = {}
+        points: List[Tuple[int, int]] = [(0, start)]
+        closed: Set[int] = set()
+        stats = self.stats
+        on_expand = stats.on_expand
+        on_push = stats.on_push
+        self.expanded = 0
+        pushed = frontier = 0
+        while points:
+            if len(points) > frontier:
+                frontier = len(points)
+            estimate, node = heappop(points)
+            if best != -1 and estimate >= best:
+                break
+            if node in closed:
+                continue
+            closed.add(node)
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(node)
+            if node == end:
+                best = distance[node]
+                route = [end]
+                while node != start:
+                    node = parents[node]
+                    route.append(node)
+                route.reverse()
+                break
+            links = list(clusters.edges.get(node, {}).items())
+            if node == start:
+                links.extend(start_links.items())
+            if node in end_links:
+                links.append((end, end_links[node]))
+            for new_node, length in links:
+                new_distance = distance[node] + length
+                if new_node not in closed and (new_node not in distance or new_distance < distance[new_node]):
+                    distance[new_node] = new_distance
+                    parents[new_node] = node
+                    y, x = divmod(new_node, width)
+                    heappush(points, (new_distance + abs(end_x - x) + abs(end_y - y), new_node))
+                    pushed += 1
+                    if on_push is not None:
+                        on_push(new_node)
+        stats.pushed = stats.heuristic = pushed
+        stats.frontier = frontier
+        if best == -1:
+            raise CalculationFailedError('Не удалось найти путь')
+        stats.backtrack()
+        cells = [start]
+        for node, next_node in zip(route, route[1:]):
+            if clusters.cluster(node) != clusters.cluster(next_node):
+                cells.append(next_node)
+                continue
+            _, cluster_parents = clusters.explore(node, next_node)
+            segment = [next_node]
+            while segment[-1] != node:
+                segment.append(cluster_parents[segment[-1]])
+            cells.extend(reversed(segment[:-1]))
+        cells.reverse()
+        return [self.data.point(index) for index in cells]
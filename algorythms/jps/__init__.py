@@ -0,0 +1,23 @@
+"""Алгоритм Jump Point Search поиска пути в лабиринте."""
+
+from typing import Any
+
+from .map import JPSMap
+
+__all__ = ('JPSMap', 'JPSGraphic')
+
+
+def __getattr__(name: str) -> Any:
+    """Загрузить класс визуализации при первом обращении к нему.
+
+    Args:
+        name: имя атрибута пакета.
+
+    Returns:
+        Класс визуализации.
+    """
+    if name == 'JPSGraphic':
+        from .graphics import JPSGraphic
+
+        return JPSGraphic
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
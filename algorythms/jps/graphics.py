@@ -0,0 +1,10 @@
+"""Обработка визуального отображения метода Jump Point Search."""
+
+from ..base import Graphic
+from .map import JPSMap
+
+
+class JPSGraphic(Graphic[JPSMap]):
+    """Обработчик визуального отображения метода Jump Point Search."""
+
+    MAP_TYPE = JPSMap
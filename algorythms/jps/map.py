@@ -0,0 +1,160 @@
+"""Обработка карты c алгоритмом Jump Point Search."""
+
+from heapq import heappop, heappush
+from typing import List, Tuple
+
+from ..base import Map
+from ..base.exceptions import CalculationFailedError
+from ..base.grid import UNREACHED
+from ..base.math_handlers import Point
+
+
+class JPSMap(Map):
+    """Карта метода Jump Point Search, содержащая проходимые и непроходимые точки.
+
+    Поиск А* ведётся только по точкам прыжка: начальной и конечной точкам и ячейкам
+    с вынужденными соседями. Горизонтальный прыжок останавливается, когда сбоку открывается
+    проход, закрытый у предыдущей ячейки, вертикальный - также в ячейке, из которой
+    горизонтальный прыжок находит точку прыжка. Ячейки открытых областей и прямых коридоров
+    пропускаются, поэтому в открытое множество не попадают промежуточные ячейки.
+
+    Алгоритм рассчитан на сетки с одинаковой стоимостью ячеек: на сетке со стоимостями
+    прыжок мог бы пропустить более дешёвый обход, поэтому такие сетки не поддерживаются.
+    """
+
+    WEIGHTED = False
+
+    def search(self, start: int, end: int) -> List[Point]:
+        """Найти путь между ячейками.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
+        grid = self.data
+        distance = grid.distance
+        width = grid.width
+        end_y, end_x = divmod(end, width)
+        offsets = grid.offsets
+        parents = grid.allocate()
+        closed = grid.flags()
+        stats = self.stats
+        on_expand = stats.on_expand
+        on_push = stats.on_push
+        distance[start] = 0
+        points: List[Tuple[int, int]] = [(0, start)]
+        path_found = False
+        self.expanded = 0
+        pushed = frontier = 0
+        while points:
+            if len(points) > frontier:
+                frontier = len(points)
+            _, index = heappop(points)
+            if closed[index]:
+                continue
+            if index == end:
+                path_found = True
+                break
+            closed[index] = 1
+            self.expanded += 1
+            if on_expand is not None:
+                on_expand(index)
+            back = self.direction(index, parents[index]) if parents[index] != UNREACHED else 0
+            for offset in offsets:
+                if offset == back:
+                    continue
+                new_index = self.jump(index, offset, end)
+                if new_index == UNREACHED or closed[new_index]:
+                    continue
+                new_distance = distance[index] + (new_index - index) // offset
+                if distance[new_index] == UNREACHED or new_distance < distance[new_index]:
+                    distance[new_index] = new_distance
+                    parents[new_index] = index
+                    y, x = divmod(new_index, width)
+                    heappush(points, (new_distance + abs(end_x - x) + abs(end_y - y), new_index))
+                    pushed += 1
+                    if on_push is not None:
+                        on_push(new_index)
+        stats.pushed = stats.heuristic = pushed
+        stats.frontier = frontier
+        if not path_found:
+            raise CalculationFailedError('Не удалось найти путь')
+        stats.backtrack()
+        path = []
+        index = end
+        while parents[index] != UNREACHED:
+            parent = parents[index]
+            step = self.direction(index, parent)
+            while index != parent:
+                path.append(grid.point(index))
+                index += step
+        path.append(grid.point(start))
+        return path
+
+    def direction(self, index: int, target: int) -> int:
+        """Получить смещение одного шага от ячейки в сторону ячейки на той же линии.
+
+        Args:
+            index: номер исходной ячейки.
+            target: номер ячейки в той же строке или в том же столбце.
+
+        Returns:
+            Смещение номера ячейки на один шаг.
+        """
+        difference = target - index
+        step = 1 if abs(difference) < self.data.width else self.data.width
+        return step if difference > 0 else -step
+
+    def jump(self, index: int, offset: int, end: int) -> int:
+        """Прыгнуть от ячейки по прямой до следующей точки прыжка.
+
+        Args:
+            index: номер ячейки, из которой совершается прыжок.
+            offset: смещение номера ячейки на один шаг в направлении прыжка.
+            end: номер конечной ячейки.
+
+        Returns:
+            Номер найденной точки прыжка или UNREACHED, если прямая упирается в стену.
+        """
+        if abs(offset) == 1:
+            return self.jump_across(index, offset, end)
+        passable = self.data.passable
+        while True:
+            index += offset
+            if not passable[index]:
+                return UNREACHED
+            if index == end:
+                return index
+            if (passable[index + 1] and not passable[index + 1 - offset]) or (
+                passable[index - 1] and not passable[index - 1 - offset]
+            ):
+                return index
+            if self.jump_across(index, 1, end) != UNREACHED or self.jump_across(index, -1, end) != UNREACHED:
+                return index
+
+    def jump_across(self, index: int, offset: int, end: int) -> int:
+        """Прыгнуть от ячейки по строке до следующей точки прыжка.
+
+        Args:
+            index: номер ячейки, из которой совершается прыжок.
+            offset: смещение номера ячейки на один шаг по строке.
+            end: номер конечной ячейки.
+
+        Returns:
+            Номер ячейки с вынужденным соседом или конечной ячейки, UNREACHED, если строка упирается в стену.
+        """
+        passable = self.data.passable
+        width = self.data.width
+        while True:
+            index += offset
+            if not passable[index]:
+                return UNREACHED
+            if index == end:
+                return index
+            if (passable[index + width] and not passable[index + width - offset]) or (
+                passable[index - width] and not passable[index - width - offset]
+            ):
+                return index
@@ -1,6 +1,24 @@
 """Волновой алгоритм поиска пути в лабиринте."""
 
-from .graphics import WaveGraphic
+from typing import Any
+
+from .field import DistanceField
 from .map import WaveMap
 
-__all__ = ('WaveMap', 'WaveGraphic')
+__all__ = ('WaveMap', 'WaveGraphic', 'DistanceField')
+
+
+def __getattr__(name: str) -> Any:
+    """Загрузить класс визуализации при первом обращении к нему.
+
+    Args:
+        name: имя атрибута пакета.
+
+    Returns:
+        Класс визуализации.
+    """
+    if name == 'WaveGraphic':
+        from .graphics import WaveGraphic
+
+        return WaveGraphic
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
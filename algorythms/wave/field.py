@@ -0,0 +1,97 @@
+"""Поле расстояний от одной исходной точки."""
+
+from typing import List
+
+from ..base.exceptions import CalculationFailedError, WrongActionError, WrongArgumentValuesError
+from ..base.grid import UNREACHED, Grid
+from ..base.math_handlers import Point
+
+
+class DistanceField:
+    """Поле расстояний волнового метода от исходной точки до всех достижимых точек.
+
+    Волна распространяется один раз по всей карте, после чего расстояние и путь до любой
+    точки получаются без нового поиска, только восстановлением пути по родительским ячейкам.
+    """
+
+    def __init__(self, grid: Grid, source: Point) -> None:
+        """Рассчитать поле расстояний.
+
+        Args:
+            grid: сетка карты.
+            source: исходная точка.
+        """
+        if not grid[source].passable:
+            raise WrongArgumentValuesError('Выбрана непроходимая точка')
+        self.grid = grid
+        self.source = source
+        self.version = grid.version
+        self.distance = grid.allocate()
+        self.parents = grid.allocate()
+        passable = grid.passable
+        distance = self.distance
+        parents = self.parents
+        offsets = grid.offsets
+        start = grid.index(source)
+        distance[start] = 0
+        points = [start]
+        layer = 0
+        while points:
+            layer += 1
+            new_points = []
+            for index in points:
+                for offset in offsets:
+                    new_index = index + offset
+                    if passable[new_index] and distance[new_index] == UNREACHED:
+                        distance[new_index] = layer
+                        parents[new_index] = index
+                        new_points.append(new_index)
+            points = new_points
+        self.reached = grid.size - distance.count(UNREACHED)
+
+    @property
+    def valid(self) -> bool:
+        """Проверить, соответствует ли поле текущему состоянию карты.
+
+        Returns:
+            Логическое значение, не менялась ли карта после расчёта поля.
+        """
+        return self.grid.version == self.version
+
+    def _index(self, point: Point) -> int:
+        """Получить номер достижимой ячейки в актуальном поле.
+
+        Args:
+            point: точка, до которой запрашивается расстояние.
+
+        Returns:
+            Номер ячейки.
+        """
+        if not self.valid:
+            raise WrongActionError('Карта изменилась после расчёта поля расстояний')
+        index = self.grid.index(point)
+        if self.distance[index] == UNREACHED:
+            raise CalculationFailedError('Не удалось найти путь')
+        return index
+
+    def distance_to(self, point: Point) -> int:
+        """Получить расстояние от исходной точки до заданной.
+
+        Args:
+            point: конечная точка.
+
+        Returns:
+            Количество шагов от исходной точки.
+        """
+        return self.distance[self._index(point)]
+
+    def path_to(self, point: Point) -> List[Point]:
+        """Получить путь от исходной точки до заданной.
+
+        Args:
+            point: конечная точка.
+
+        Returns:
+            Список точек от заданной точки до исходной.
+        """
+        return self.grid.trace(self.parents, self._index(point))
@@ -1,56 +1,306 @@
 """Обработка карты."""
 
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from ..base import DIRECTIONS, Map
-from ..base.exceptions import CalculationFailedError, DataNotProvidedError
+from ..base import Map
+from ..base.exceptions import CalculationFailedError, DataNotProvidedError, WrongActionError
+from ..base.grid import UNREACHED, Cells
 from ..base.math_handlers import Point
+from ..base.stats import SearchStep
+from .field import DistanceField
 
 
 class WaveMap(Map):
     """Карта волнового метода, содержащая проходимые и непроходимые точки."""
 
-    def find_path(self) -> List[Point]:
-        """Найти путь в лабиринте.
+    WEIGHTED = False
+    vectorized: bool = False
+    _fields: Dict[int, DistanceField]
+
+    def search(self, start: int, end: int) -> List[Point]:
+        """Найти путь между ячейками.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
+        field = self.valid_field(start)
+        if field is not None:
+            self.expanded = 0
+            self.stats.backtrack()
+            return field.path_to(self.data.point(end))
+        if self.bidirectional:
+            return self.search_bidirectional(start, end)
+        grid = self.data
+        if self.vectorized and grid.dense:
+            from .vectorized import spread_wave
+
+            path_found = spread_wave(grid, start, end, self.stats)
+            self.expanded = grid.size - grid.distance.count(UNREACHED)
+            if not path_found:
+                raise CalculationFailedError('Не удалось найти путь')
+            self.stats.backtrack()
+            return self.backtrack(start, end)
+        parents = grid.allocate()
+        path_found = self.spread_wave(grid.point(start), grid.point(end), parents)
+        self.expanded = grid.size - grid.distance.count(UNREACHED)
+        if not path_found:
+            raise CalculationFailedError('Не удалось найти путь')
+        self.stats.backtrack()
+        return grid.trace(parents, end)
+
+    def steps(self, start: int, end: int, batch: int) -> Iterator[SearchStep]:
+        """Найти путь между ячейками пошагово.
+
+        По ходу поиска порции выдаёт только волна на чистом Python, готовое поле расстояний,
+        встречные волны и векторизованная волна выдают записанный ход после завершения поиска.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+            batch: количество раскрытых ячеек в порции, 0 - только последняя порция.
+
+        Returns:
+            Порции хода поиска, последняя содержит путь.
+        """
+        grid = self.data
+        if self.valid_field(start) is not None or self.bidirectional or (self.vectorized and grid.dense):
+            yield from super().steps(start, end, batch)
+            return
+        parents = grid.allocate()
+        yield from self.spread_steps(start, end, batch, parents)
+        self.expanded = grid.size - grid.distance.count(UNREACHED)
+        if grid.distance[end] == UNREACHED:
+            raise CalculationFailedError('Не удалось найти путь')
+        self.stats.backtrack()
+        yield SearchStep([], [], end, grid.trace(parents, end))
+
+    def valid_field(self, source: int) -> Optional[DistanceField]:
+        """Получить актуальное поле расстояний от ячейки, если оно уже рассчитано.
+
+        Args:
+            source: номер исходной ячейки.
+
+        Returns:
+            Поле расстояний или None.
+        """
+        field = self._fields.get(source) if hasattr(self, '_fields') else None
+        return field if field is not None and field.valid else None
+
+    def backtrack(self, start: int, end: int) -> List[Point]:
+        """Восстановить путь по расстояниям, рассчитанным векторизованной волной.
+
+        Векторизованная волна не хранит указатели на родительские ячейки, поэтому на каждом шаге
+        среди соседей ищется ячейка с расстоянием на 1 меньше.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
+        grid = self.data
+        distance = grid.distance
+        path = [grid.point(end)]
+        index = end
+        while index != start:
+            for offset in grid.offsets:
+                if distance[index + offset] == distance[index] - 1:
+                    index += offset
+                    break
+            path.append(grid.point(index))
+        return path
+
+    def distance_field(self, source: Optional[Point] = None) -> DistanceField:
+        """Получить поле расстояний от исходной точки до всех точек карты.
+
+        Поле рассчитывается один раз и хранится до изменения карты. Пока оно актуально,
+        find_path из этой точки отвечает без нового поиска.
+
+        Args:
+            source: исходная точка, по умолчанию начальная точка карты.
 
         Returns:
-            Список точек.
+            Поле расстояний.
         """
-        self.clear()
         if not hasattr(self, 'data'):
             raise DataNotProvidedError('Не задано поле')
-        if not self.start_point:
+        if source is None:
+            source = self.start_point
+        if not source:
             raise DataNotProvidedError('Не задана начальная точка')
-        if not self.end_point:
-            raise DataNotProvidedError('Не задана конечная точка')
-        distance = 0
-        points = [self.start_point]
+        if self.data.costs is not None:
+            raise WrongActionError('Поле расстояний не учитывает стоимости ячеек')
+        if not hasattr(self, '_fields'):
+            self._fields = {}
+        index = self.data.index(source)
+        field = self._fields.get(index)
+        if field is None or not field.valid:
+            self._fields = {key: value for key, value in self._fields.items() if value.valid}
+            field = DistanceField(self.data, source)
+            self._fields[index] = field
+        return field
+
+    def indexes(self) -> Dict[str, Any]:
+        """Получить описание построенных актуальных индексов карты.
+
+        Returns:
+            Описание индексов базовой карты и номера исходных ячеек актуальных полей расстояний в fields.
+        """
+        indexes = super().indexes()
+        fields = self._fields if hasattr(self, '_fields') else {}
+        indexes['fields'] = [source for source, field in fields.items() if field.valid]
+        return indexes
+
+    def build_indexes(self, indexes: Dict[str, Any]) -> None:
+        """Построить индексы по описанию, полученному методом indexes.
+
+        Args:
+            indexes: описание индексов.
+        """
+        super().build_indexes(indexes)
+        for source in indexes.get('fields', []):
+            self.distance_field(self.data.point(source))
+
+    def spread_wave(self, start_point: Point, end_point: Point, parents: Optional[Cells] = None) -> bool:
+        """Распространить волну от начальной точки до конечной.
+
+        Args:
+            start_point: точка, из которой распространяется волна.
+            end_point: точка, до которой распространяется волна.
+            parents: массив для номеров родительских ячеек, по которому путь восстанавливается Grid.trace.
+
+        Returns:
+            Логическое значение, достигнута ли конечная точка.
+        """
+        end = self.data.index(end_point)
+        if parents is None:
+            parents = self.data.allocate()
+        for _ in self.spread_steps(self.data.index(start_point), end, 0, parents):
+            pass
+        return self.data.distance[end] != UNREACHED
+
+    def spread_steps(self, start: int, end: int, batch: int, parents: Cells) -> Iterator[SearchStep]:
+        """Распространить волну от начальной ячейки до конечной пошагово.
+
+        Для каждой достигнутой ячейки записывается номер родительской ячейки, поэтому путь
+        восстанавливается за O(длины пути) без просмотра соседей. Лучшая ячейка порции -
+        ближайшая к конечной по манхэттенскому расстоянию среди раскрытых.
+
+        Args:
+            start: номер ячейки, из которой распространяется волна.
+            end: номер ячейки, до которой распространяется волна.
+            batch: количество раскрытых ячеек в порции, 0 - без порций.
+            parents: массив для номеров родительских ячеек.
+
+        Returns:
+            Порции хода поиска без пути.
+        """
+        grid = self.data
+        passable = grid.passable
+        distance = grid.distance
+        offsets = grid.offsets
+        stats = self.stats
+        on_expand = stats.on_expand
+        on_push = stats.on_push
+        queued = grid.flags()
+        queued[start] = 1
+        layer = 0
+        points = [start]
         path_found = False
+        visited: List[int] = []
+        added: List[int] = []
+        best = start
+        best_distance = grid.manhattan(start, end)
         while points and not path_found:
-            new_points = []
-            for point in points:
-                if point == self.end_point:
+            stats.frontier = max(stats.frontier, len(points))
+            new_points: List[int] = []
+            for index in points:
+                if index == end:
                     path_found = True
-                self.data[point].distance = distance
-                for direction in DIRECTIONS:
-                    new_point = point + direction
-                    if (
-                        self.data[new_point].passable
-                        and self.data[new_point].distance is None
-                        and new_point not in new_points
-                    ):
-                        new_points.append(new_point)
+                distance[index] = layer
+                if on_expand is not None:
+                    on_expand(index)
+                if batch:
+                    visited.append(index)
+                    if len(visited) >= batch:
+                        for item in visited:
+                            if grid.manhattan(item, end) < best_distance:
+                                best, best_distance = item, grid.manhattan(item, end)
+                        yield SearchStep(visited, added, best)
+                        visited = []
+                        added = []
+                for offset in offsets:
+                    new_index = index + offset
+                    if passable[new_index] and not queued[new_index]:
+                        queued[new_index] = 1
+                        parents[new_index] = index
+                        new_points.append(new_index)
+                        if batch:
+                            added.append(new_index)
+                        if on_push is not None:
+                            on_push(new_index)
+            stats.pushed += len(new_points)
             points = new_points
-            distance += 1
-        if not path_found:
+            layer += 1
+        if visited or added:
+            yield SearchStep(visited, added, end if path_found else best)
+
+    def search_bidirectional(self, start: int, end: int) -> List[Point]:
+        """Найти путь двумя встречными волнами.
+
+        Волны распространяются от начальной и конечной ячеек, каждый шаг слой добавляется
+        к волне с меньшим фронтом. Поиск останавливается на первом слое, в котором волны встретились.
+
+        Args:
+            start: номер начальной ячейки.
+            end: номер конечной ячейки.
+
+        Returns:
+            Список точек от конечной точки до начальной.
+        """
+        grid = self.data
+        passable = grid.passable
+        offsets = grid.offsets
+        distances = (grid.distance, grid.allocate())
+        parents = (grid.allocate(), grid.allocate())
+        points: Tuple[List[int], List[int]] = ([start], [end])
+        distances[0][start] = 0
+        distances[1][end] = 0
+        meet = start if start == end else UNREACHED
+        stats = self.stats
+        on_expand = stats.on_expand
+        on_push = stats.on_push
+        self.expanded = 0
+        while meet == UNREACHED and points[0] and points[1]:
+            stats.frontier = max(stats.frontier, len(points[0]) + len(points[1]))
+            side = 0 if len(points[0]) <= len(points[1]) else 1
+            distance, other_distance = distances[side], distances[1 - side]
+            new_points = []
+            for index in points[side]:
+                self.expanded += 1
+                if on_expand is not None:
+                    on_expand(index)
+                new_distance = distance[index] + 1
+                for offset in offsets:
+                    new_index = index + offset
+                    if passable[new_index] and distance[new_index] == UNREACHED:
+                        distance[new_index] = new_distance
+                        parents[side][new_index] = index
+                        new_points.append(new_index)
+                        if on_push is not None:
+                            on_push(new_index)
+                        if other_distance[new_index] != UNREACHED and (
+                            meet == UNREACHED or other_distance[new_index] < other_distance[meet]
+                        ):
+                            meet = new_index
+            stats.pushed += len(new_points)
+            points[side][:] = new_points
+        if meet == UNREACHED:
             raise CalculationFailedError('Не удалось найти путь')
-        path = [self.end_point]
-        point = self.end_point
-        while not point == self.start_point:
-            for direction in DIRECTIONS:
-                new_point = point + direction
-                if self.data[new_point].distance == self.data[point].distance - 1:  # type: ignore[operator]
-                    path.append(new_point)
-                    point = new_point
-                    break
-        return path
+        stats.backtrack()
+        return grid.splice(parents[0], parents[1], meet)
@@ -0,0 +1,54 @@
+"""Векторизованное распространение волны средствами NumPy."""
+
+from array import array
+from typing import Optional, cast
+
+import numpy as np
+
+from ..base.grid import UNREACHED, Grid
+from ..base.stats import SearchStats
+
+
+def spread_wave(grid: Grid, start: int, end: int, stats: Optional[SearchStats] = None) -> bool:
+    """Распространить волну от начальной ячейки до конечной.
+
+    Каждый слой волны обрабатывается целиком операциями над массивами: соседи всего фронта
+    вычисляются сдвигом номеров ячеек, отбираются по маске свободных ячеек, а расстояния
+    записываются в сетку одной операцией. Сетка должна быть плотной (grid.dense). Обработчики
+    статистики вызываются для ячеек всего слоя после его обработки и только если они заданы.
+
+    Args:
+        grid: сетка карты, расстояния записываются в grid.distance.
+        start: номер начальной ячейки.
+        end: номер конечной ячейки.
+        stats: статистика поиска.
+
+    Returns:
+        Логическое значение, достигнута ли конечная ячейка.
+    """
+    distance = np.frombuffer(cast(array, grid.distance), dtype=np.int32)
+    free = np.frombuffer(cast(bytearray, grid.passable), dtype=np.uint8).astype(bool)
+    offsets = np.array(grid.offsets)
+    if stats is None:
+        stats = SearchStats()
+    points = np.array([start])
+    free[start] = False
+    layer = 0
+    while points.size:
+        stats.frontier = max(stats.frontier, int(points.size))
+        distance[points] = layer
+        if stats.on_expand is not None:
+            for index in points.tolist():
+                stats.on_expand(index)
+        if distance[end] != UNREACHED:
+            return True
+        new_points = (points[:, None] + offsets).ravel()
+        new_points = np.unique(new_points[free[new_points]])
+        free[new_points] = False
+        stats.pushed += int(new_points.size)
+        if stats.on_push is not None:
+            for index in new_points.tolist():
+                stats.on_push(index)
+        points = new_points
+        layer += 1
+    return False
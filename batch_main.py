@@ -0,0 +1,84 @@
+"""Исполняемый файл для пакетного поиска путей без графического интерфейса."""
+
+import json
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+
+from algorythms.base.exceptions import WrongArgumentValuesError
+from algorythms.base.generators import GENERATORS
+from algorythms.base.moves import CORNERS, HEURISTICS, Neighbourhood
+from algorythms.batch import CHUNK_SIZE, find_paths, read_queries
+from algorythms.engines import ENGINES
+
+
+def report_chunk(count: int, elapsed: float) -> None:
+    """Вывести в stderr скорость выполнения части запросов.
+
+    Args:
+        count: количество запросов в части.
+        elapsed: время выполнения части в секундах.
+    """
+    sys.stderr.write(f'Часть: {count} запросов за {elapsed:.3f} с, {count / elapsed if elapsed else 0:.1f} в секунду\n')
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Поиск путей по запросам из файла с выводом результатов в формате JSON Lines')
+    parser.add_argument('queries', nargs='?', default='-', help='файл запросов "x1 y1 x2 y2", - для чтения из stdin')
+    parser.add_argument('--engine', default='astar', choices=list(ENGINES), help='алгоритм')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--load', metavar='PATH', help='загрузить лабиринт из файла')
+    source.add_argument('--size', type=int, nargs=2, metavar=('WIDTH', 'HEIGHT'), help='сгенерировать лабиринт')
+    parser.add_argument('--generator', default='backtracker', choices=list(GENERATORS), help='генератор лабиринтов')
+    parser.add_argument('--seed', type=int, help='зерно генератора')
+    parser.add_argument('--save', metavar='PATH', help='сохранить сгенерированный лабиринт в файл')
+    parser.add_argument(
+        '--heuristic',
+        default='',
+        choices=list(HEURISTICS),
+        help='эвристика, по умолчанию octile при диагональных ходах, иначе manhattan',
+    )
+    parser.add_argument('--diagonal', default='', choices=list(CORNERS), help='правило диагональных ходов')
+    parser.add_argument('--raw', action='store_true', help='координаты запросов заданы в ячейках сетки')
+    parser.add_argument(
+        '--path',
+        nargs='?',
+        const='points',
+        default='',
+        choices=('points', 'waypoints', 'runs'),
+        help='выводить путь: всеми точками, точками поворота или серией направлений',
+    )
+    parser.add_argument('--processes', type=int, default=1, help='количество процессов, 0 - по количеству ядер')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='количество запросов в части для процесса')
+    arguments = parser.parse_args()
+    try:
+        Neighbourhood(1, arguments.diagonal).heuristic(arguments.heuristic)
+    except WrongArgumentValuesError as ex:
+        parser.error(str(ex))
+    maze = ENGINES[arguments.engine]()
+    maze.heuristic = arguments.heuristic
+    maze.diagonal = arguments.diagonal
+    if arguments.load:
+        maze.load(arguments.load)
+    else:
+        maze.width, maze.height = arguments.size
+        maze.generator = arguments.generator
+        maze.seed = arguments.seed
+        maze.generate_map()
+        if arguments.save:
+            maze.save(arguments.save)
+    file = sys.stdin if arguments.queries == '-' else open(arguments.queries, encoding='utf-8')
+    count = 0
+    started = perf_counter()
+    with file:
+        try:
+            queries = read_queries(file, arguments.raw)
+            results = find_paths(maze, queries, arguments.path, arguments.processes, arguments.chunk_size, report_chunk)
+            for result in results:
+                sys.stdout.write(json.dumps(result, ensure_ascii=False) + '\n')
+                sys.stdout.flush()
+                count += 1
+        except WrongArgumentValuesError as ex:
+            parser.exit(2, f'{ex}\n')
+    elapsed = perf_counter() - started
+    sys.stderr.write(f'{count} запросов за {elapsed:.2f} с, {count / elapsed if elapsed else 0:.1f} в секунду\n')
@@ -0,0 +1,72 @@
+"""Исполняемый файл для замеров производительности."""
+
+import sys
+from argparse import ArgumentParser
+
+from algorythms.base.exceptions import WrongArgumentValuesError
+from algorythms.base.generators import GENERATORS
+from algorythms.base.moves import CORNERS, HEURISTICS, Neighbourhood
+from algorythms.benchmark import INDEXES, SEEDS, SIZES, compare, load, run, save, speedups
+from algorythms.engines import ENGINES
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Замеры генерации лабиринтов и поиска пути')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='размеры стороны лабиринта')
+    parser.add_argument('--seeds', type=int, nargs='+', default=SEEDS, help='зёрна генератора')
+    parser.add_argument('--engines', nargs='+', default=list(ENGINES), choices=list(ENGINES), help='алгоритмы')
+    parser.add_argument('--generator', default='backtracker', choices=list(GENERATORS), help='генератор лабиринтов')
+    parser.add_argument('--repeat', type=int, default=3, help='количество запусков для замера времени')
+    parser.add_argument(
+        '--heuristic',
+        default='',
+        choices=list(HEURISTICS),
+        help='эвристика, по умолчанию octile при диагональных ходах, иначе manhattan',
+    )
+    parser.add_argument('--diagonal', default='', choices=list(CORNERS), help='правило диагональных ходов')
+    parser.add_argument(
+        '--indexes',
+        nargs='*',
+        default=[],
+        choices=list(INDEXES),
+        help='индексы, поиск по которым сравнивается с поиском по ячейкам',
+    )
+    parser.add_argument('--output', default='benchmark.json', help='файл для результатов')
+    parser.add_argument('--baseline', default='benchmark_baseline.json', help='файл с эталонными замерами')
+    parser.add_argument('--threshold', type=float, default=0.25, help='допустимая доля ухудшения')
+    parser.add_argument('--save-baseline', action='store_true', help='сохранить результаты как эталон')
+    arguments = parser.parse_args()
+    try:
+        Neighbourhood(1, arguments.diagonal).heuristic(arguments.heuristic)
+    except WrongArgumentValuesError as ex:
+        parser.error(str(ex))
+    runs = run(
+        arguments.sizes,
+        arguments.seeds,
+        arguments.engines,
+        arguments.generator,
+        arguments.repeat,
+        arguments.heuristic,
+        arguments.diagonal,
+        arguments.indexes,
+    )
+    for item in runs:
+        sys.stdout.write(
+            f'{item["name"]:<36} size={item["size"]:<5} seed={item["seed"]:<3} '
+            f'time={item["time"] * 1000:10.2f} ms  peak={item["peak"] / 1024:10.1f} KiB  '
+            f'expanded={item["expanded"]}\n',
+        )
+    for speedup in speedups(runs):
+        sys.stdout.write(f'Индекс: {speedup}\n')
+    save(runs, arguments.output)
+    if arguments.save_baseline:
+        save(runs, arguments.baseline)
+        sys.exit(0)
+    try:
+        baseline = load(arguments.baseline)
+    except FileNotFoundError:
+        sys.stdout.write(f'Эталон {arguments.baseline} не найден, сравнение пропущено\n')
+        sys.exit(0)
+    regressions = compare(runs, baseline, arguments.threshold)
+    for regression in regressions:
+        sys.stdout.write(f'Ухудшение: {regression}\n')
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,6 @@
+"""Исполняемый файл для алгоритма Дайала."""
+
+from algorythms.dial import DialGraphic
+
+if __name__ == '__main__':
+    DialGraphic().draw_maze()
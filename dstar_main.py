@@ -0,0 +1,6 @@
+"""Исполняемый файл для алгоритма D* Lite."""
+
+from algorythms.dstar import DStarLiteGraphic
+
+if __name__ == '__main__':
+    DStarLiteGraphic().draw_maze()
@@ -0,0 +1,25 @@
+"""Исполняемый файл для параллельной генерации набора лабиринтов."""
+
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+
+from algorythms.base.bulk import generate_batch
+from algorythms.base.generators import GENERATORS
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Параллельная генерация набора лабиринтов в один файл')
+    parser.add_argument('output', help='файл для набора лабиринтов')
+    parser.add_argument('--count', type=int, default=100, help='количество лабиринтов')
+    parser.add_argument('--size', type=int, nargs=2, default=(100, 100), metavar=('WIDTH', 'HEIGHT'), help='размер')
+    parser.add_argument('--generator', default='backtracker', choices=list(GENERATORS), help='генератор лабиринтов')
+    parser.add_argument('--first-seed', type=int, default=0, help='зерно первого лабиринта')
+    parser.add_argument('--processes', type=int, help='количество процессов, по умолчанию по количеству ядер')
+    arguments = parser.parse_args()
+    seeds = range(arguments.first_seed, arguments.first_seed + arguments.count)
+    started = perf_counter()
+    width, height = arguments.size
+    with generate_batch(width, height, seeds, arguments.generator, arguments.processes) as batch:
+        elapsed = perf_counter() - started
+        batch.save(arguments.output)
+    sys.stdout.write(f'{len(seeds)} лабиринтов за {elapsed:.2f} с, {len(seeds) / elapsed:.1f} в секунду\n')
@@ -0,0 +1,6 @@
+"""Исполняемый файл для алгоритма HPA*."""
+
+from algorythms.hpa import HPAGraphic
+
+if __name__ == '__main__':
+    HPAGraphic().draw_maze()
@@ -0,0 +1,6 @@
+"""Исполняемый файл для алгоритма Jump Point Search."""
+
+from algorythms.jps import JPSGraphic
+
+if __name__ == '__main__':
+    JPSGraphic().draw_maze()
@@ -0,0 +1,135 @@
+"""Заготовки карт и эталонный поиск для проверок."""
+
+from heapq import heappop, heappush
+from random import Random
+from typing import Dict, List, Optional, Type, TypeVar
+
+from algorythms.base import Map
+from algorythms.base.grid import Grid
+from algorythms.base.math_handlers import Point
+from algorythms.base.moves import Neighbourhood
+
+MapType = TypeVar('MapType', bound=Map)
+
+
+def generate(engine: Type[MapType], width: int, height: int, seed: int, generator: str = 'backtracker') -> MapType:
+    """Сгенерировать лабиринт с начальной и конечной точками в противоположных углах.
+
+    Args:
+        engine: класс карты алгоритма.
+        width: количество столбцов клеток лабиринта.
+        height: количество строк клеток лабиринта.
+        seed: зерно генератора.
+        generator: название генератора из GENERATORS.
+
+    Returns:
+        Карту с лабиринтом.
+    """
+    maze = engine()
+    maze.width = width
+    maze.height = height
+    maze.seed = seed
+    maze.generator = generator
+    maze.generate_map()
+    maze.start_point = Map.to_raw(Point(0, 0))
+    maze.end_point = Map.to_raw(Point(width - 1, height - 1))
+    return maze
+
+
+def open_grid(width: int, height: int, seed: int, walls: float = 0.25) -> Grid:
+    """Создать сетку с непроходимой рамкой и случайными стенами, в которой между точками много путей.
+
+    Args:
+        width: количество столбцов сетки.
+        height: количество строк сетки.
+        seed: зерно расстановки стен.
+        walls: доля непроходимых ячеек внутри рамки.
+
+    Returns:
+        Сетку, в которой углы внутри рамки проходимы.
+    """
+    random = Random(seed)
+    passable = bytearray(width * height)
+    for y in range(1, height - 1):
+        for x in range(1, width - 1):
+            passable[y * width + x] = random.random() >= walls
+    passable[width + 1] = passable[width * (height - 1) - 2] = 1
+    return Grid(width, height, passable)
+
+
+def place(engine: Type[MapType], grid: Grid) -> MapType:
+    """Создать карту алгоритма поверх сетки с точками в углах внутри рамки.
+
+    Args:
+        engine: класс карты алгоритма.
+        grid: сетка с непроходимой рамкой.
+
+    Returns:
+        Карту на этой сетке.
+    """
+    maze = engine()
+    maze.data = grid
+    maze.start_point = Point(1, 1)
+    maze.end_point = Point(grid.width - 2, grid.height - 2)
+    return maze
+
+
+def shortest(grid: Grid, start: Point, end: Point, diagonal: str = '') -> Optional[int]:
+    """Рассчитать стоимость кратчайшего пути простым алгоритмом Дейкстры.
+
+    Args:
+        grid: сетка карты.
+        start: начальная точка.
+        end: конечная точка.
+        diagonal: правило диагональных ходов.
+
+    Returns:
+        Стоимость пути или None, если пути нет.
+    """
+    neighbourhood = Neighbourhood(grid.width, diagonal)
+    passable = grid.passable
+    costs = grid.costs
+    source = grid.index(start)
+    target = grid.index(end)
+    distance: Dict[int, int] = {source: 0}
+    queue = [(0, source)]
+    while queue:
+        current, index = heappop(queue)
+        if index == target:
+            return current
+        if current > distance[index]:
+            continue
+        for offset, cost, first, second in neighbourhood.moves:
+            following = index + offset
+            if not passable[following]:
+                continue
+            if first and passable[index + first] + passable[index + second] < neighbourhood.corners:
+                continue
+            new_distance = current + (cost if costs is None else cost * costs[following])
+            if new_distance < distance.get(following, new_distance + 1):
+                distance[following] = new_distance
+                heappush(queue, (new_distance, following))
+    return None
+
+
+def route_cost(grid: Grid, path: List[Point], diagonal: str = '') -> int:
+    """Рассчитать стоимость найденного пути по тем же правилам, что и shortest.
+
+    Args:
+        grid: сетка карты.
+        path: список точек от конечной точки до начальной.
+        diagonal: правило диагональных ходов.
+
+    Returns:
+        Стоимость пути.
+    """
+    neighbourhood = Neighbourhood(grid.width, diagonal)
+    costs = {offset: cost for offset, cost, _, _ in neighbourhood.moves}
+    total = 0
+    for point, previous in zip(path, path[1:]):
+        index = grid.index(point)
+        offset = index - grid.index(previous)
+        if offset not in costs or abs(point.x - previous.x) > 1 or not grid.passable[index]:
+            raise ValueError(f'Недопустимый ход {previous} -> {point}')
+        total += costs[offset] * (1 if grid.costs is None else grid.costs[index])
+    return total
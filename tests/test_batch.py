@@ -0,0 +1,107 @@
+"""Проверки пакетной генерации лабиринтов и пакетного поиска путей."""
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from algorythms.a_star.map import AStarMap
+from algorythms.base.bulk import generate_batch
+from algorythms.base.exceptions import WrongArgumentValuesError
+from algorythms.base.generators import GENERATORS
+from algorythms.base.math_handlers import Point
+from algorythms.base.storage import load_batch_grid, read_batch
+from algorythms.batch import find_paths, read_queries, run_queries
+from algorythms.dial.map import DialMap
+from algorythms.wave.map import WaveMap
+
+from .mazes import generate
+
+QUERIES = ['# x y x y', '0 0 7 5', '', '7 5 0 0', '3 2 3 2', '0 0 8 0', '1 4 6 1']
+
+
+class BulkTest(TestCase):
+    """Генерация набора лабиринтов в общей памяти."""
+
+    def test_generate_batch(self) -> None:
+        """Лабиринты набора совпадают с лабиринтами генератора при любом количестве процессов."""
+        seeds = [5, 0, 9, 2, 7]
+        for processes in (1, 2):
+            with self.subTest(processes=processes):
+                with generate_batch(6, 4, seeds, 'wilson', processes) as batch:
+                    self.assertEqual(len(batch), len(seeds))
+                    for index, seed in enumerate(seeds):
+                        expected = bytes(GENERATORS['wilson'](seed).generate(6, 4).passable)
+                        self.assertEqual(bytes(batch.maze(index)), expected)
+                        self.assertEqual(bytes(batch.grid(index).passable), expected)
+
+    def test_save(self) -> None:
+        """Набор записывается в файл и читается по номеру лабиринта."""
+        seeds = [1, 2, 3]
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'batch.mazes')
+            with generate_batch(5, 3, seeds, processes=1) as batch:
+                batch.save(path)
+                expected = [bytes(batch.maze(index)) for index in range(len(seeds))]
+            self.assertEqual(read_batch(path), (11, 7, seeds))
+            for index in range(len(seeds)):
+                self.assertEqual(bytes(load_batch_grid(path, index).passable), expected[index])
+
+    def test_unknown_generator(self) -> None:
+        """Неизвестный генератор отклоняется."""
+        with self.assertRaises(WrongArgumentValuesError):
+            generate_batch(3, 3, [0], 'unknown', 1)
+
+
+class QueriesTest(TestCase):
+    """Пакетный поиск путей."""
+
+    def test_read_queries(self) -> None:
+        """Запросы читаются в координатах сетки, комментарии и пустые строки пропускаются."""
+        queries = list(read_queries(QUERIES))
+        self.assertEqual(len(queries), 5)
+        self.assertEqual(queries[0], (Point(1, 1), Point(15, 11)))
+        self.assertEqual(list(read_queries(['1 2 3 4'], raw=True)), [(Point(1, 2), Point(3, 4))])
+        with self.assertRaises(WrongArgumentValuesError):
+            list(read_queries(['1 2 3']))
+
+    def test_run_queries(self) -> None:
+        """Ошибка отдельного запроса записывается в его результат, путь выводится от начала."""
+        maze = generate(AStarMap, 8, 6, 0)
+        results = list(run_queries(maze, read_queries(QUERIES), 'points'))
+        self.assertNotIn('error', results[0])
+        self.assertEqual(results[0]['path'][0], [1, 1])
+        self.assertEqual(results[0]['length'], len(results[0]['path']) - 1)
+        self.assertEqual(results[2]['length'], 0)
+        self.assertIn('error', results[3])
+
+    def test_find_paths(self) -> None:
+        """Результаты пула процессов совпадают с последовательным выполнением запросов."""
+        wave = generate(WaveMap, 8, 6, 1)
+        wave.vectorized = True
+        junctions = generate(AStarMap, 8, 6, 1)
+        junctions.build_junction_graph()
+        dial = generate(DialMap, 8, 6, 1)
+        dial.data.set_costs([1 + index % 4 for index in range(dial.data.size)])
+        for maze in (wave, junctions, dial):
+            expected = [
+                {key: value for key, value in result.items() if key != 'stats'}
+                for result in run_queries(maze, read_queries(QUERIES), 'runs')
+            ]
+            for processes in (1, 2):
+                with self.subTest(engine=type(maze).__name__, processes=processes):
+                    chunks = []
+                    results = list(
+                        find_paths(
+                            maze,
+                            read_queries(QUERIES),
+                            'runs',
+                            processes,
+                            2,
+                            lambda count, elapsed: chunks.append(count),
+                        ),
+                    )
+                    self.assertEqual(
+                        [{key: value for key, value in result.items() if key != 'stats'} for result in results],
+                        expected,
+                    )
+                    self.assertEqual(sum(chunks), len(expected))
@@ -0,0 +1,118 @@
+"""Проверки кратчайших путей всех алгоритмов."""
+
+from unittest import TestCase
+
+from algorythms.a_star.map import AStarMap
+from algorythms.base.exceptions import CalculationFailedError, WrongActionError, WrongArgumentValuesError
+from algorythms.base.generators import GENERATORS
+from algorythms.base.math_handlers import Point
+from algorythms.dial.map import DialMap
+from algorythms.engines import ENGINES
+from algorythms.wave.map import WaveMap
+
+from .mazes import generate, open_grid, place, route_cost, shortest
+
+
+class MazeTest(TestCase):
+    """Поиск в лабиринтах всех генераторов."""
+
+    def test_same_length_as_wave(self) -> None:
+        """Длина пути каждого алгоритма совпадает с длиной пути волнового алгоритма."""
+        for generator in GENERATORS:
+            for seed in range(3):
+                wave = generate(WaveMap, 12, 9, seed, generator)
+                expected = wave.find_path()
+                for name, engine in ENGINES.items():
+                    with self.subTest(generator=generator, seed=seed, engine=name):
+                        maze = engine()
+                        maze.data = wave.data
+                        maze.start_point = wave.start_point
+                        maze.end_point = wave.end_point
+                        path = maze.find_path()
+                        self.assertEqual(len(path), len(expected))
+                        self.assertEqual(path[0], wave.end_point)
+                        self.assertEqual(path[-1], wave.start_point)
+                        route_cost(wave.data, path)
+
+
+class OpenGridTest(TestCase):
+    """Поиск на сетках со множеством путей между точками."""
+
+    def test_shortest(self) -> None:
+        """Каждый алгоритм находит кратчайший путь или сообщает, что пути нет."""
+        for seed in range(8):
+            grid = open_grid(17, 13, seed)
+            expected = shortest(grid, Point(1, 1), Point(15, 11))
+            for name, engine in ENGINES.items():
+                with self.subTest(seed=seed, engine=name):
+                    maze = place(engine, grid)
+                    if expected is None:
+                        with self.assertRaises(CalculationFailedError):
+                            maze.find_path()
+                    else:
+                        self.assertEqual(route_cost(grid, maze.find_path()), expected)
+
+    def test_variants(self) -> None:
+        """Векторизованная и двунаправленная волна и двунаправленный А* находят кратчайший путь."""
+        for seed in range(8):
+            grid = open_grid(17, 13, seed, 0.2)
+            expected = shortest(grid, Point(1, 1), Point(15, 11))
+            if expected is None:
+                continue
+            for engine, attribute in ((WaveMap, 'vectorized'), (WaveMap, 'bidirectional'), (AStarMap, 'bidirectional')):
+                with self.subTest(seed=seed, engine=engine.__name__, attribute=attribute):
+                    maze = place(engine, grid)
+                    setattr(maze, attribute, True)
+                    self.assertEqual(route_cost(grid, maze.find_path()), expected)
+
+    def test_diagonal(self) -> None:
+        """А* с диагональными ходами находит кратчайший путь с каждой допустимой эвристикой."""
+        for seed in range(6):
+            grid = open_grid(15, 11, seed, 0.3)
+            for diagonal in ('strict', 'corner', 'always'):
+                expected = shortest(grid, Point(1, 1), Point(13, 9), diagonal)
+                if expected is None:
+                    continue
+                for heuristic in ('', 'octile', 'chebyshev'):
+                    with self.subTest(seed=seed, diagonal=diagonal, heuristic=heuristic):
+                        maze = place(AStarMap, grid)
+                        maze.diagonal = diagonal
+                        maze.heuristic = heuristic
+                        self.assertEqual(route_cost(grid, maze.find_path(), diagonal), expected)
+
+    def test_inadmissible_heuristic(self) -> None:
+        """Манхэттенская эвристика с диагональными ходами отклоняется."""
+        maze = place(AStarMap, open_grid(9, 9, 0))
+        maze.diagonal = 'corner'
+        maze.heuristic = 'manhattan'
+        with self.assertRaises(WrongArgumentValuesError):
+            maze.find_path()
+
+
+class CostTest(TestCase):
+    """Поиск на сетках со стоимостями ячеек."""
+
+    def test_cheapest(self) -> None:
+        """А* и алгоритм Дайала находят путь наименьшей стоимости."""
+        for seed in range(8):
+            grid = open_grid(15, 11, seed, 0.15)
+            grid.set_costs([1 + (index * 7 + seed) % 9 for index in range(grid.size)])
+            expected = shortest(grid, Point(1, 1), Point(13, 9))
+            if expected is None:
+                continue
+            for engine in (AStarMap, DialMap):
+                with self.subTest(seed=seed, engine=engine.__name__):
+                    path = place(engine, grid).find_path()
+                    self.assertEqual(route_cost(grid, path), expected)
+                    self.assertEqual(grid.path_cost(path), expected)
+
+    def test_unweighted_engines(self) -> None:
+        """Алгоритмы, не учитывающие стоимости, отказываются искать на сетке со стоимостями."""
+        grid = open_grid(9, 9, 0, 0)
+        grid.set_cost(grid.index(Point(4, 4)), 5)
+        for name, engine in ENGINES.items():
+            if engine.WEIGHTED:
+                continue
+            with self.subTest(engine=name):
+                with self.assertRaises(WrongActionError):
+                    place(engine, grid).find_path()
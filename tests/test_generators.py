@@ -0,0 +1,60 @@
+"""Проверки генераторов лабиринтов."""
+
+from io import BytesIO
+from unittest import TestCase
+
+from algorythms.base.exceptions import WrongArgumentValuesError
+from algorythms.base.generators import GENERATORS
+from algorythms.base.math_handlers import Point
+from algorythms.wave.map import WaveMap
+
+from .mazes import generate
+
+
+class GeneratorTest(TestCase):
+    """Идеальные лабиринты всех генераторов."""
+
+    def test_perfect(self) -> None:
+        """Лабиринт без циклов, и из угла достижимы все проходимые ячейки."""
+        for name, generator in GENERATORS.items():
+            for width, height in ((1, 1), (1, 6), (7, 1), (9, 5)):
+                with self.subTest(generator=name, width=width, height=height):
+                    maze = WaveMap()
+                    maze.data = generator(0).generate(width, height)
+                    grid = maze.data
+                    self.assertEqual((grid.width, grid.height), (2 * width + 1, 2 * height + 1))
+                    self.assertEqual(sum(grid.passable), 2 * width * height - 1)
+                    passable = grid.passable
+                    edges = sum(
+                        passable[index] and passable[index + offset]
+                        for index in range(grid.size - grid.width)
+                        for offset in (1, grid.width)
+                    )
+                    self.assertEqual(edges, sum(passable) - 1)
+                    field = maze.distance_field(Point(1, 1))
+                    for index in range(grid.size):
+                        if grid.passable[index]:
+                            field.distance_to(grid.point(index))
+
+    def test_seed(self) -> None:
+        """Одно зерно даёт один лабиринт, построчная генерация и запись в файл совпадают с сеткой."""
+        for name, generator in GENERATORS.items():
+            with self.subTest(generator=name):
+                grid = generator(5).generate(8, 6)
+                self.assertEqual(bytes(generator(5).generate(8, 6).passable), bytes(grid.passable))
+                self.assertNotEqual(bytes(generator(6).generate(8, 6).passable), bytes(grid.passable))
+                self.assertEqual(list(generator(5).rows(8, 6)), list(grid.rows()))
+                file = BytesIO()
+                generator(5).stream(file, 8, 6)
+                self.assertEqual(file.getvalue(), bytes(grid.passable))
+
+    def test_map_generator(self) -> None:
+        """Карта генерирует лабиринт выбранным генератором и отклоняет неизвестный."""
+        for name, generator in GENERATORS.items():
+            with self.subTest(generator=name):
+                maze = generate(WaveMap, 6, 4, 2, name)
+                self.assertEqual(bytes(maze.data.passable), bytes(generator(2).generate(6, 4).passable))
+        maze = WaveMap()
+        maze.generator = 'unknown'
+        with self.assertRaises(WrongArgumentValuesError):
+            maze.generate_map()
@@ -0,0 +1,28 @@
+"""Проверки иерархического поиска пути."""
+
+from unittest import TestCase
+
+from algorythms.base.math_handlers import Point
+from algorythms.hpa.map import HPAMap
+from algorythms.wave.map import WaveMap
+
+
+class NarrowMapTest(TestCase):
+    """Поиск на картах шириной или высотой в один кластер."""
+
+    def test_same_length_as_wave(self) -> None:
+        """Длина пути совпадает с длиной пути волнового алгоритма."""
+        for width, height in ((1, 9), (3, 12), (7, 20), (20, 7)):
+            for seed in range(4):
+                with self.subTest(width=width, height=height, seed=seed):
+                    wave = WaveMap()
+                    wave.width = width
+                    wave.height = height
+                    wave.seed = seed
+                    wave.generate_map()
+                    hpa = HPAMap()
+                    hpa.data = wave.data
+                    for maze in (wave, hpa):
+                        maze.start_point = WaveMap.to_raw(Point(0, 0))
+                        maze.end_point = WaveMap.to_raw(Point(width - 1, height - 1))
+                    self.assertEqual(len(hpa.find_path()), len(wave.find_path()))
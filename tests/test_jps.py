@@ -0,0 +1,54 @@
+"""Проверки поиска Jump Point Search."""
+
+from random import Random
+from unittest import TestCase
+
+from algorythms.base.exceptions import CalculationFailedError, WrongActionError
+from algorythms.base.grid import Grid
+from algorythms.base.math_handlers import Point
+from algorythms.jps.map import JPSMap
+from algorythms.wave.map import WaveMap
+
+
+class OpenGridTest(TestCase):
+    """Поиск на сетках с открытыми областями."""
+
+    def test_same_length_as_wave(self) -> None:
+        """Длина пути совпадает с длиной пути волнового алгоритма."""
+        random = Random(0)
+        for density in (0.0, 0.2, 0.35):
+            for _ in range(10):
+                width, height = random.randint(5, 25), random.randint(5, 25)
+                cells = bytearray(width * height)
+                for y in range(1, height - 1):
+                    for x in range(1, width - 1):
+                        cells[y * width + x] = random.random() >= density
+                grid = Grid(width, height, cells)
+                wave = WaveMap()
+                jps = JPSMap()
+                start = Point(1, 1)
+                end = Point(width - 2, height - 2)
+                if not (grid[start].passable and grid[end].passable):
+                    continue
+                for maze in (wave, jps):
+                    maze.data = grid
+                    maze.start_point = start
+                    maze.end_point = end
+                with self.subTest(width=width, height=height, density=density):
+                    try:
+                        expected = len(wave.find_path())
+                    except CalculationFailedError:
+                        continue
+                    self.assertEqual(len(jps.find_path()), expected)
+
+    def test_weighted_grid_rejected(self) -> None:
+        """Сетка со стоимостями ячеек не поддерживается."""
+        jps = JPSMap()
+        jps.width = jps.height = 5
+        jps.seed = 0
+        jps.generate_map()
+        jps.data.set_cost(jps.data.width + 2, 3)
+        jps.start_point = Point(1, 1)
+        jps.end_point = Point(9, 9)
+        with self.assertRaises(WrongActionError):
+            jps.find_path()
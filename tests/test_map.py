@@ -0,0 +1,170 @@
+"""Проверки кэша, индексов, статистики и пошагового поиска карты."""
+
+from random import Random
+from typing import List, Tuple
+from unittest import TestCase
+
+from algorythms.a_star.map import AStarMap
+from algorythms.base.exceptions import CalculationFailedError
+from algorythms.base.math_handlers import Point
+from algorythms.base.stats import SearchStats
+from algorythms.dstar.map import DStarLiteMap
+from algorythms.engines import ENGINES
+from algorythms.wave.map import WaveMap
+
+from .mazes import generate, open_grid, place, route_cost, shortest
+
+
+class CacheTest(TestCase):
+    """Кэш найденных путей."""
+
+    def test_repeated_query(self) -> None:
+        """Повторный запрос отвечается из кэша тем же путём."""
+        maze = generate(AStarMap, 10, 10, 0)
+        path = maze.find_path()
+        self.assertEqual(maze.stats.source, 'search')
+        self.assertEqual(maze.find_path(), path)
+        self.assertEqual(maze.stats.source, 'cache')
+        self.assertEqual(maze.stats.expanded, 0)
+        self.assertEqual(maze.cache.hits, 1)
+
+    def test_invalidation(self) -> None:
+        """Изменение проходимости сбрасывает кэш, и путь ищется заново."""
+        maze = place(AStarMap, open_grid(15, 11, 1, 0))
+        path = maze.find_path()
+        maze.data[path[len(path) // 2]].passable = False
+        new_path = maze.find_path()
+        self.assertEqual(maze.stats.source, 'search')
+        self.assertNotIn(path[len(path) // 2], new_path)
+        self.assertEqual(route_cost(maze.data, new_path), shortest(maze.data, Point(1, 1), Point(13, 9)))
+
+    def test_disabled(self) -> None:
+        """Кэш нулевой вместимости не хранит пути."""
+        maze = generate(AStarMap, 8, 8, 0)
+        maze.cache_size = 0
+        maze.find_path()
+        maze.find_path()
+        self.assertEqual(maze.stats.source, 'search')
+        self.assertEqual(len(maze.cache), 0)
+
+
+class StatsTest(TestCase):
+    """Статистика поиска."""
+
+    def test_counters(self) -> None:
+        """Счётчики и обработчики согласованы с найденным путём."""
+        for name, engine in ENGINES.items():
+            with self.subTest(engine=name):
+                maze = generate(engine, 10, 8, 2)
+                expanded: List[int] = []
+                done: List[Tuple[List[Point], SearchStats]] = []
+                maze.on_expand = expanded.append
+                maze.on_done = lambda path, stats: done.append((path, stats))
+                path, stats = maze.find_path_with_stats()
+                self.assertEqual(stats.length, len(path) - 1)
+                self.assertGreater(stats.expanded, 0)
+                self.assertEqual(len(expanded), stats.expanded)
+                self.assertEqual(done, [(path, stats)])
+                self.assertEqual(stats.as_dict()['length'], stats.length)
+
+
+class StepsTest(TestCase):
+    """Пошаговый поиск."""
+
+    def test_steps(self) -> None:
+        """Порции покрывают все раскрытые ячейки, а последняя содержит путь."""
+        for engine in (WaveMap, AStarMap):
+            with self.subTest(engine=engine.__name__):
+                maze = generate(engine, 12, 12, 3)
+                steps = list(maze.find_path_steps(16))
+                self.assertTrue(all(step.path is None for step in steps[:-1]))
+                self.assertEqual(sum(len(step.visited) for step in steps), maze.stats.expanded)
+                self.assertEqual(steps[-1].path, generate(engine, 12, 12, 3).find_path())
+
+    def test_cached_steps(self) -> None:
+        """Путь из кэша выдаётся одной порцией."""
+        maze = generate(AStarMap, 8, 8, 1)
+        path = maze.find_path()
+        steps = list(maze.find_path_steps())
+        self.assertEqual(len(steps), 1)
+        self.assertEqual(steps[0].path, path)
+        self.assertEqual(maze.stats.source, 'cache')
+
+
+class IndexTest(TestCase):
+    """Поле расстояний, индекс дерева и граф перекрёстков."""
+
+    def test_distance_field(self) -> None:
+        """Поле расстояний даёт кратчайшие пути до всех точек."""
+        maze = place(WaveMap, open_grid(15, 11, 0))
+        field = maze.distance_field()
+        for point in (Point(13, 9), Point(7, 5), Point(1, 9)):
+            expected = shortest(maze.data, Point(1, 1), point)
+            with self.subTest(point=point):
+                if expected is None:
+                    with self.assertRaises(CalculationFailedError):
+                        field.distance_to(point)
+                else:
+                    self.assertEqual(field.distance_to(point), expected)
+                    self.assertEqual(route_cost(maze.data, field.path_to(point)), expected)
+        maze.data[Point(2, 1)].passable = not maze.data[Point(2, 1)].passable
+        self.assertFalse(field.valid)
+
+    def test_tree_index(self) -> None:
+        """Индекс дерева отвечает на запросы в идеальном лабиринте без поиска."""
+        maze = generate(AStarMap, 12, 10, 4)
+        expected = generate(AStarMap, 12, 10, 4).find_path()
+        maze.build_tree_index()
+        self.assertEqual(maze.find_path(), expected)
+        self.assertEqual(maze.stats.source, 'tree')
+
+    def test_junction_graph(self) -> None:
+        """Граф перекрёстков находит кратчайший путь и устаревает при изменении карты."""
+        for seed in range(4):
+            maze = place(AStarMap, open_grid(17, 13, seed, 0.3))
+            expected = shortest(maze.data, Point(1, 1), Point(15, 11))
+            if expected is None:
+                continue
+            with self.subTest(seed=seed):
+                maze.build_junction_graph()
+                self.assertEqual(route_cost(maze.data, maze.find_path()), expected)
+                self.assertEqual(maze.stats.source, 'junctions')
+                maze.data[Point(15, 1)].passable = not maze.data[Point(15, 1)].passable
+                maze.find_path()
+                self.assertEqual(maze.stats.source, 'search')
+
+
+class DStarTest(TestCase):
+    """Инкрементальный поиск D* Lite."""
+
+    def test_edits(self) -> None:
+        """После изменений проходимости путь остаётся кратчайшим."""
+        random = Random(0)
+        grid = open_grid(15, 11, 5, 0.1)
+        maze = place(DStarLiteMap, grid)
+        points = [Point(x, y) for y in range(1, grid.height - 1) for x in range(1, grid.width - 1)]
+        points.remove(Point(1, 1))
+        points.remove(Point(13, 9))
+        for _ in range(40):
+            point = random.choice(points)
+            grid[point].passable = not grid[point].passable
+            expected = shortest(grid, Point(1, 1), Point(13, 9))
+            with self.subTest(point=point):
+                if expected is None:
+                    with self.assertRaises(CalculationFailedError):
+                        maze.find_path()
+                else:
+                    self.assertEqual(route_cost(grid, maze.find_path()), expected)
+        self.assertLessEqual(len(grid.changes), grid.size)
+
+    def test_border_edits(self) -> None:
+        """Изменение угловых ячеек рамки не выходит за пределы сетки."""
+        grid = open_grid(9, 7, 0, 0)
+        maze = place(DStarLiteMap, grid)
+        expected = route_cost(grid, maze.find_path())
+        for point in (Point(0, 0), Point(8, 0), Point(0, 6), Point(8, 6)):
+            with self.subTest(point=point):
+                grid[point].passable = True
+                self.assertEqual(route_cost(grid, maze.find_path()), expected)
+                grid[point].passable = False
+                self.assertEqual(route_cost(grid, maze.find_path()), expected)
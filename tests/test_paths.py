@@ -0,0 +1,41 @@
+"""Проверки сжатого представления путей."""
+
+from unittest import TestCase
+
+from algorythms.a_star.map import AStarMap
+from algorythms.base.exceptions import WrongArgumentValuesError
+from algorythms.base.math_handlers import Point
+from algorythms.base.paths import decode_runs, encode_runs, expand_waypoints, waypoints
+
+from .mazes import generate, open_grid, place
+
+
+class PathsTest(TestCase):
+    """Точки поворота и серии направлений."""
+
+    def test_round_trip(self) -> None:
+        """Путь восстанавливается по точкам поворота и по сериям направлений."""
+        paths = [generate(AStarMap, 9, 7, seed).find_path() for seed in range(3)]
+        for diagonal in ('', 'corner'):
+            maze = place(AStarMap, open_grid(15, 11, 1, 0.2))
+            maze.diagonal = diagonal
+            paths.append(maze.find_path())
+        paths.extend(([], [Point(1, 1)], [Point(1, 1), Point(2, 2)]))
+        for number, path in enumerate(paths):
+            with self.subTest(number=number):
+                self.assertEqual(expand_waypoints(waypoints(path)), path)
+                if path:
+                    self.assertEqual(decode_runs(path[0], encode_runs(path)), path)
+
+    def test_waypoints(self) -> None:
+        """Точками поворота остаются концы пути и смены направления."""
+        path = [Point(1, 1), Point(2, 1), Point(3, 1), Point(3, 2), Point(3, 3), Point(4, 4)]
+        self.assertEqual(waypoints(path), [Point(1, 1), Point(3, 1), Point(3, 3), Point(4, 4)])
+        self.assertEqual(encode_runs(path), [(1, 2), (0, 2), (4, 1)])
+
+    def test_invalid(self) -> None:
+        """Точки, не соединённые прямыми или диагональными отрезками, отклоняются."""
+        with self.assertRaises(WrongArgumentValuesError):
+            expand_waypoints([Point(1, 1), Point(3, 2)])
+        with self.assertRaises(WrongArgumentValuesError):
+            encode_runs([Point(1, 1), Point(3, 1)])
@@ -0,0 +1,119 @@
+"""Проверки сохранения и загрузки карт."""
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from algorythms.a_star.map import AStarMap
+from algorythms.base.exceptions import WrongArgumentValuesError
+from algorythms.base.generators import GENERATORS
+from algorythms.base.math_handlers import Point
+from algorythms.base.storage import (
+    dump_batch,
+    dump_rows,
+    load_batch_grid,
+    load_grid,
+    pack,
+    read_batch,
+    save_grid,
+    unpack,
+)
+
+from .mazes import generate
+
+
+class StorageTest(TestCase):
+    """Форматы файлов карт."""
+
+    def setUp(self) -> None:
+        """Создать временный каталог и лабиринт нечётного размера."""
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.maze = generate(AStarMap, 13, 7, 0)
+        self.rows = list(self.maze.data.rows())
+
+    def path(self, name: str) -> str:
+        """Получить путь к файлу во временном каталоге.
+
+        Args:
+            name: имя файла.
+
+        Returns:
+            Путь к файлу.
+        """
+        return os.path.join(self.directory.name, name)
+
+    def test_pack(self) -> None:
+        """Упаковка по биту на ячейку обратима, лишние ячейки дополнения отбрасываются."""
+        for count in (0, 1, 7, 8, 9, 100):
+            cells = bytes(index % 3 == 0 for index in range(count))
+            padding = bytes(-count % 8)
+            with self.subTest(count=count):
+                self.assertEqual(len(pack(cells + padding)), (count + 7) // 8)
+                self.assertEqual(unpack(pack(cells + padding), count), cells)
+
+    def test_round_trip(self) -> None:
+        """Сетка, начальная и конечная точки восстанавливаются из файла любого формата."""
+        for mapped, tile_size in ((True, 0), (False, 0), (True, 4), (True, 5)):
+            with self.subTest(mapped=mapped, tile_size=tile_size):
+                name = self.path(f'{mapped}-{tile_size}.maze')
+                save_grid(self.maze.data, name, self.maze.start_point, self.maze.end_point, tile_size)
+                grid, start, end = load_grid(name, mapped, 2)
+                with grid:
+                    self.assertEqual((grid.width, grid.height), (self.maze.data.width, self.maze.data.height))
+                    self.assertEqual(list(grid.rows()), self.rows)
+                    self.assertEqual((start, end), (self.maze.start_point, self.maze.end_point))
+
+    def test_map_load(self) -> None:
+        """Загруженная карта находит тот же путь и не меняет файл при изменении проходимости."""
+        name = self.path('map.maze')
+        self.maze.save(name)
+        expected = self.maze.find_path()
+        loaded = AStarMap()
+        loaded.load(name)
+        self.assertEqual(loaded.find_path(), expected)
+        loaded.data[Point(1, 2)].passable = not loaded.data[Point(1, 2)].passable
+        loaded.load(name)
+        self.assertEqual(list(loaded.data.rows()), self.rows)
+        loaded.close()
+
+    def test_dump_rows(self) -> None:
+        """Построчная запись совпадает с сохранением сетки."""
+        for generator in GENERATORS:
+            with self.subTest(generator=generator):
+                streamed = self.path(f'{generator}-rows.maze')
+                saved = self.path(f'{generator}-grid.maze')
+                source = GENERATORS[generator](1)
+                dump_rows(streamed, 11, 9, source.rows(5, 4))
+                save_grid(GENERATORS[generator](1).generate(5, 4), saved)
+                with open(streamed, 'rb') as first, open(saved, 'rb') as second:
+                    self.assertEqual(first.read(), second.read())
+
+    def test_batch(self) -> None:
+        """Набор сеток восстанавливается по номеру вместе с размерами и зёрнами."""
+        name = self.path('batch.mazes')
+        seeds = [3, 1, 4]
+        mazes = [bytes(GENERATORS['kruskal'](seed).generate(6, 4).passable) for seed in seeds]
+        dump_batch(name, 13, 9, seeds, mazes)
+        self.assertEqual(read_batch(name), (13, 9, seeds))
+        for index, maze in enumerate(mazes):
+            with self.subTest(index=index):
+                self.assertEqual(bytes(load_batch_grid(name, index).passable), maze)
+        with self.assertRaises(WrongArgumentValuesError):
+            load_batch_grid(name, len(seeds))
+
+    def test_broken_files(self) -> None:
+        """Обрезанный или чужой файл отклоняется."""
+        name = self.path('map.maze')
+        save_grid(self.maze.data, name)
+        with open(name, 'rb') as file:
+            data = file.read()
+        for broken in (data[:-1], b'NOPE' + data[4:], b''):
+            with self.subTest(size=len(broken)):
+                with open(name, 'wb') as file:
+                    file.write(broken)
+                for mapped in (True, False):
+                    with self.assertRaises(WrongArgumentValuesError):
+                        load_grid(name, mapped)
+                with self.assertRaises(WrongArgumentValuesError):
+                    read_batch(name)